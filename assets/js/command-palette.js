@@ -10,12 +10,338 @@
   const isLightboxOpen = () => document.getElementById("image-lightbox-container");
   const scrollToActive = () => {
     setTimeout(() => {
-      const active = document.getElementById("palette-active-item");
+      const active = isClientMode()
+        ? clientList()?.querySelector('[data-active="true"]')
+        : document.getElementById("palette-active-item");
       if (active) {
         active.scrollIntoView({ block: "nearest", behavior: "smooth" });
       }
     }, 50);
   };
+
+  // Client-side search: once the static index (built by `python -m
+  // xian_tech.search_assets`) has loaded, typing is matched and rendered here
+  // without sending events to the server. Until then the server-side palette
+  // state keeps handling the query.
+  const CLIENT_INDEX_VERSION = 1;
+  const TOKEN_PATTERN = /[\p{L}\p{N}]+/gu;
+  const FUZZY_MIN_LENGTH = 4;
+  const FUZZY_MAX_LENGTH = 32;
+  const FUZZY_MAX_CANDIDATES = 64;
+  const INPUT_ID = "command-palette-input";
+  let clientIndex = null;
+  let clientTrigrams = null;
+  let clientIndexRequest = null;
+  let clientResults = [];
+  let clientActive = -1;
+
+  const resultsContainer = () => document.getElementById("command-palette-results");
+  const clientList = () => document.getElementById("command-palette-client-results");
+  const isClientMode = () => resultsContainer()?.dataset.clientSearch === "on";
+
+  const loadClientIndex = () => {
+    if (clientIndex || clientIndexRequest) return;
+    const src = resultsContainer()?.dataset.indexSrc;
+    if (!src) return;
+    clientIndexRequest = fetch(src)
+      .then((response) => (response.ok ? response.json() : null))
+      .then((payload) => {
+        if (payload?.version === CLIENT_INDEX_VERSION) {
+          clientIndex = payload;
+          clientTrigrams = null;
+        }
+      })
+      .catch(() => {})
+      .finally(() => {
+        clientIndexRequest = null;
+      });
+  };
+
+  const tokenize = (text) => text.toLowerCase().match(TOKEN_PATTERN) ?? [];
+
+  const lowerBound = (items, value) => {
+    let low = 0;
+    let high = items.length;
+    while (low < high) {
+      const mid = (low + high) >> 1;
+      if (items[mid] < value) low = mid + 1;
+      else high = mid;
+    }
+    return low;
+  };
+
+  // Mirrors SearchIndex: a prefix scores as the best term score it completes,
+  // scaled by how much of the term has been typed.
+  const prefixScores = (token) => {
+    const { terms, postings } = clientIndex;
+    const scores = new Map();
+    for (let i = lowerBound(terms, token); i < terms.length && terms[i].startsWith(token); i += 1) {
+      const scale = token.length / terms[i].length;
+      const pairs = postings[i];
+      for (let j = 0; j < pairs.length; j += 2) {
+        const score = pairs[j + 1] * scale;
+        if (score > (scores.get(pairs[j]) ?? 0)) scores.set(pairs[j], score);
+      }
+    }
+    return scores;
+  };
+
+  // Typo fallback, mirroring SearchIndex.corrections: trigram overlap picks
+  // candidate terms and a banded edit distance verifies them.
+  const trigrams = (term) => {
+    const padded = `  ${term} `;
+    const grams = new Set();
+    for (let i = 0; i + 3 <= padded.length; i += 1) grams.add(padded.slice(i, i + 3));
+    return grams;
+  };
+
+  const trigramTerms = () => {
+    if (!clientTrigrams) {
+      clientTrigrams = new Map();
+      clientIndex.terms.forEach((term, termId) => {
+        for (const gram of trigrams(term)) {
+          if (!clientTrigrams.has(gram)) clientTrigrams.set(gram, []);
+          clientTrigrams.get(gram).push(termId);
+        }
+      });
+    }
+    return clientTrigrams;
+  };
+
+  const editDistance = (token, term, limit) => {
+    if (term.length < token.length - limit) return limit + 1;
+    const size = term.length;
+    const over = limit + 1;
+    let before = [];
+    let previous = Array.from({ length: size + 1 }, (_, j) => j);
+    for (let i = 1; i <= token.length; i += 1) {
+      const char = token[i - 1];
+      const low = Math.max(1, i - limit);
+      const high = Math.min(size, i + limit);
+      const current = new Array(size + 1).fill(over);
+      if (low === 1) current[0] = i;
+      let rowBest = current[0];
+      for (let j = low; j <= high; j += 1) {
+        const termChar = term[j - 1];
+        let value = Math.min(
+          previous[j - 1] + (char === termChar ? 0 : 1),
+          previous[j] + 1,
+          current[j - 1] + 1,
+        );
+        if (i > 1 && j > 1 && char === term[j - 2] && token[i - 2] === termChar) {
+          value = Math.min(value, before[j - 2] + 1);
+        }
+        current[j] = value;
+        rowBest = Math.min(rowBest, value);
+      }
+      if (rowBest > limit) return over;
+      before = previous;
+      previous = current;
+    }
+    let distance = previous[size];
+    if (size > token.length) distance = Math.min(distance, previous[token.length]);
+    return Math.min(distance, over);
+  };
+
+  const corrections = (token) => {
+    if (token.length < FUZZY_MIN_LENGTH || token.length > FUZZY_MAX_LENGTH) return [];
+    let limit = token.length < 8 ? 1 : 2;
+    const grams = trigrams(token);
+    const index = trigramTerms();
+    const shared = new Map();
+    for (const gram of grams) {
+      for (const termId of index.get(gram) ?? []) shared.set(termId, (shared.get(termId) ?? 0) + 1);
+    }
+    const threshold = Math.max(1, grams.size - 3 * limit);
+    const candidates = [...shared]
+      .filter(([, count]) => count >= threshold)
+      .sort((a, b) => b[1] - a[1] || a[0] - b[0])
+      .slice(0, FUZZY_MAX_CANDIDATES);
+    const matches = [];
+    for (const [termId] of candidates) {
+      const distance = editDistance(token, clientIndex.terms[termId], limit);
+      if (distance <= limit) {
+        matches.push([termId, distance]);
+        limit = distance;
+      }
+    }
+    return matches.filter(([, distance]) => distance === limit);
+  };
+
+  const correctedScores = (token) => {
+    const scores = new Map();
+    for (const [termId, distance] of corrections(token)) {
+      // A corrected term matches as a prefix, like a typed token would.
+      for (const [id, termScore] of prefixScores(clientIndex.terms[termId])) {
+        const score = termScore / (1 + distance);
+        if (score > (scores.get(id) ?? 0)) scores.set(id, score);
+      }
+    }
+    return scores;
+  };
+
+  const tokenScores = (token) => {
+    const scores = prefixScores(token);
+    return scores.size ? scores : correctedScores(token);
+  };
+
+  const searchClientIndex = (query) => {
+    const { entries } = clientIndex;
+    const tokens = [...new Set(tokenize(query))];
+    if (!tokens.length) return entries.map((_, id) => id);
+
+    const tables = tokens.map(tokenScores).sort((a, b) => a.size - b.size);
+    const ranked = [];
+    for (const [id, score] of tables[0]) {
+      let total = score;
+      let matched = true;
+      for (let k = 1; k < tables.length; k += 1) {
+        const other = tables[k].get(id);
+        if (other === undefined) {
+          matched = false;
+          break;
+        }
+        total += other;
+      }
+      if (matched) ranked.push([total, id]);
+    }
+    ranked.sort((a, b) => b[0] - a[0] || a[1] - b[1]);
+
+    const groups = new Map();
+    for (const [, id] of ranked) {
+      const category = entries[id].category;
+      if (!groups.has(category)) groups.set(category, []);
+      groups.get(category).push(id);
+    }
+    return [...groups.values()].flat();
+  };
+
+  const element = (tag, className, text) => {
+    const node = document.createElement(tag);
+    node.className = className;
+    if (text !== undefined) node.textContent = text;
+    return node;
+  };
+
+  const renderRow = (entry, position) => {
+    const link = element("a", "command-palette-client-item");
+    link.href = entry.href;
+    link.dataset.position = String(position);
+    if (position === clientActive) link.dataset.active = "true";
+    if (entry.external) {
+      link.target = "_blank";
+      link.rel = "noopener noreferrer";
+    }
+    const body = element("span", "command-palette-client-body");
+    const heading = element("span", "command-palette-client-heading");
+    heading.append(
+      element("span", "command-palette-client-title", entry.title),
+      element("span", "command-palette-client-badge", entry.badge),
+    );
+    body.append(heading, element("span", "command-palette-client-subtitle", entry.subtitle));
+    link.append(body, element("span", "command-palette-client-arrow", entry.external ? "↗" : "↵"));
+    return link;
+  };
+
+  const renderClientResults = () => {
+    const list = clientList();
+    if (!list) return;
+    const fragment = document.createDocumentFragment();
+    if (!clientResults.length) {
+      fragment.append(element("div", "command-palette-client-empty", "No matches found."));
+    }
+    let category = null;
+    clientResults.forEach((id, position) => {
+      const entry = clientIndex.entries[id];
+      if (entry.category !== category) {
+        category = entry.category;
+        fragment.append(element("div", "command-palette-client-header", category));
+      }
+      fragment.append(renderRow(entry, position));
+    });
+    list.replaceChildren(fragment);
+  };
+
+  const setClientActive = (position) => {
+    const list = clientList();
+    list?.querySelector('[data-active="true"]')?.removeAttribute("data-active");
+    clientActive = position;
+    const next = list?.querySelector(`[data-position="${position}"]`);
+    if (next) next.dataset.active = "true";
+  };
+
+  const runClientSearch = (query) => {
+    const container = resultsContainer();
+    if (!container) return;
+    container.dataset.clientSearch = "on";
+    clientResults = searchClientIndex(query);
+    clientActive = clientResults.length ? 0 : -1;
+    renderClientResults();
+    container.scrollTop = 0;
+  };
+
+  const moveClientActive = (step) => {
+    if (!clientResults.length) return;
+    const count = clientResults.length;
+    const current = clientActive < 0 ? (step > 0 ? -1 : 0) : clientActive;
+    setClientActive((current + step + count) % count);
+  };
+
+  const openEntry = (entry) => {
+    close();
+    if (entry.external) {
+      if (entry.href.startsWith("mailto:")) window.location.assign(entry.href);
+      else window.open(entry.href, "_blank", "noopener");
+      return;
+    }
+    // Let the router handle same-origin navigation without a full reload.
+    window.history.pushState({}, "", entry.href);
+    window.dispatchEvent(new PopStateEvent("popstate", { state: {} }));
+  };
+
+  const selectClientActive = () => {
+    if (clientActive < 0) return;
+    openEntry(clientIndex.entries[clientResults[clientActive]]);
+  };
+
+  window.addEventListener("focusin", (event) => {
+    if (event.target?.id === INPUT_ID) loadClientIndex();
+  });
+
+  // Capture phase runs before React's root listener, so stopping the event
+  // here keeps `set_command_query` from reaching the server.
+  window.addEventListener(
+    "input",
+    (event) => {
+      if (event.target?.id !== INPUT_ID) return;
+      if (!clientIndex) {
+        loadClientIndex();
+        return;
+      }
+      event.stopImmediatePropagation();
+      runClientSearch(event.target.value);
+    },
+    true,
+  );
+
+  window.addEventListener("click", (event) => {
+    const link = event.target?.closest?.(".command-palette-client-item");
+    if (!link || !clientIndex) return;
+    const entry = clientIndex.entries[clientResults[Number(link.dataset.position)]];
+    if (!entry) return;
+    if (entry.external) {
+      close();
+      return;
+    }
+    event.preventDefault();
+    openEntry(entry);
+  });
+
+  window.addEventListener("mouseover", (event) => {
+    const link = event.target?.closest?.(".command-palette-client-item");
+    if (link && isClientMode()) setClientActive(Number(link.dataset.position));
+  });
+
   window.addEventListener("keydown", (event) => {
     const key = event.key?.toLowerCase();
     if ((event.metaKey || event.ctrlKey) && key === "k") {
@@ -31,12 +357,14 @@
     }
     if (key === "arrowup") {
       event.preventDefault();
-      moveUp();
+      if (isClientMode()) moveClientActive(-1);
+      else moveUp();
       scrollToActive();
     }
     if (key === "arrowdown") {
       event.preventDefault();
-      moveDown();
+      if (isClientMode()) moveClientActive(1);
+      else moveDown();
       scrollToActive();
     }
     if (key === "enter") {
@@ -44,7 +372,8 @@
       const isInput = active?.tagName === "INPUT";
       if (isInput) {
         event.preventDefault();
-        selectActive();
+        if (isClientMode()) selectClientActive();
+        else selectActive();
       }
     }
   });
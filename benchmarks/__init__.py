@@ -0,0 +1 @@
+"""Performance benchmarks; run them as modules, e.g. ``python -m benchmarks.palette``."""
@@ -0,0 +1,90 @@
+"""Recording benchmark baselines and comparing runs against them."""
+from __future__ import annotations
+
+import json
+import platform
+from pathlib import Path
+from typing import Any
+
+
+def compare(
+    results: dict[str, dict[str, Any]],
+    baselines: dict[str, dict[str, Any]],
+    tolerance: float,
+    checked: dict[str, float],
+    unit: str = "entries",
+) -> list[str]:
+    """Return one message per metric that regressed beyond ``tolerance``.
+
+    ``checked`` maps each compared metric to an absolute floor that a
+    regression must also exceed, so scheduler noise on small inputs cannot
+    fail a run.
+    """
+    regressions: list[str] = []
+    for size, metrics in results.items():
+        recorded = baselines.get(size)
+        if not recorded:
+            continue
+        for metric, floor in checked.items():
+            if metric not in recorded:
+                continue
+            current, previous = metrics[metric], recorded[metric]
+            if current > previous * (1 + tolerance) and current - previous > floor:
+                regressions.append(
+                    f"{size} {unit}: {metric} {current:.3f} vs baseline {previous:.3f} "
+                    f"(+{(current / previous - 1) * 100 if previous else float('inf'):.0f}%)"
+                )
+    return regressions
+
+
+def load_baselines(path: Path) -> dict[str, Any]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def write_baselines(path: Path, results: dict[str, dict[str, Any]]) -> None:
+    recorded = load_baselines(path).get("results", {})
+    for size, metrics in results.items():
+        recorded[size] = {name: round(value, 4) for name, value in metrics.items()}
+    payload = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": dict(sorted(recorded.items(), key=lambda item: int(item[0]))),
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+def report(
+    results: dict[str, dict[str, Any]],
+    path: Path,
+    tolerance: float,
+    checked: dict[str, float],
+    update: bool,
+    unit: str = "entries",
+) -> int:
+    """Record or compare ``results`` as the ``main`` of a benchmark does; return the exit status."""
+    import sys
+
+    if update:
+        write_baselines(path, results)
+        print(f"Baselines written to {path}")
+        return 0
+
+    baselines = load_baselines(path).get("results", {})
+    if not baselines:
+        print(f"No baselines at {path}; run with --update-baseline to record them.")
+        return 0
+    regressions = compare(results, baselines, tolerance, checked, unit)
+    if regressions:
+        print(f"\nPERFORMANCE REGRESSION (tolerance {tolerance:.0%}):", file=sys.stderr)
+        for message in regressions:
+            print(f"  {message}", file=sys.stderr)
+        return 1
+    print(f"\nNo regressions against {path} (tolerance {tolerance:.0%}).")
+    return 0
+
+
+__all__ = ["compare", "load_baselines", "report", "write_baselines"]
@@ -0,0 +1,114 @@
+"""Deterministic synthetic corpora and keystroke sessions for palette benchmarks.
+
+Entries have the same normalized shape as ``SEARCH_ENTRIES``. Words are drawn
+from a generated vocabulary with a Zipf-like distribution, so a few terms are
+very common and most are rare, as in real page copy. A third of the entries
+carry a body, like the extracted page-content documents.
+"""
+from __future__ import annotations
+
+import random
+from itertools import accumulate
+from typing import Any
+
+SYLLABLES = (
+    "ba", "co", "de", "fi", "ga", "hu", "ji", "ka", "lo", "me", "nu", "pa",
+    "qui", "ro", "sa", "ti", "vo", "wa", "xe", "yo", "zu", "tion", "ment", "ing",
+)
+CATEGORY_COUNT = 12
+VOCABULARY_RATIO = 0.5
+BODY_RATIO = 3
+BODY_WORDS = 60
+
+
+def _vocabulary(rng: random.Random, size: int) -> list[str]:
+    words: set[str] = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))))
+    return sorted(words)
+
+
+class _WordSampler:
+    def __init__(self, rng: random.Random, words: list[str]):
+        self.rng = rng
+        self.words = words
+        self.cum_weights = list(accumulate(1 / rank for rank in range(1, len(words) + 1)))
+
+    def sample(self, count: int) -> list[str]:
+        return self.rng.choices(self.words, cum_weights=self.cum_weights, k=count)
+
+    def phrase(self, low: int, high: int) -> str:
+        return " ".join(self.sample(self.rng.randint(low, high))).capitalize()
+
+
+def generate_corpus(size: int, seed: int = 0) -> list[dict[str, Any]]:
+    """Return ``size`` palette entries shaped like ``SEARCH_ENTRIES``."""
+    rng = random.Random(seed)
+    sampler = _WordSampler(rng, _vocabulary(rng, max(64, int(size * VOCABULARY_RATIO))))
+    categories = [sampler.phrase(1, 2) for _ in range(CATEGORY_COUNT)]
+    entries: list[dict[str, Any]] = []
+    for position in range(size):
+        has_body = position % BODY_RATIO == 0
+        entries.append(
+            {
+                "id": f"synthetic-{position}",
+                "title": sampler.phrase(2, 5),
+                "subtitle": sampler.phrase(6, 14),
+                "category": rng.choice(categories),
+                "badge": "Content" if has_body else "Page",
+                "href": f"/synthetic/{position}",
+                "external": False,
+                "keywords": [sampler.phrase(1, 2) for _ in range(rng.randint(0, 3))],
+                "body": " ".join(sampler.sample(BODY_WORDS)) if has_body else "",
+            }
+        )
+    return entries
+
+
+def _typo(rng: random.Random, word: str) -> str:
+    if len(word) < 5:
+        return word
+    position = rng.randrange(1, len(word) - 1)
+    if rng.random() < 0.5:
+        return word[:position] + word[position + 1] + word[position] + word[position + 2 :]
+    return word[:position] + word[position + 1 :]
+
+
+def keystroke_sessions(
+    entries: list[dict[str, Any]],
+    sessions: int = 40,
+    seed: int = 0,
+) -> list[list[str]]:
+    """Return query values as they appear after each keystroke, per session.
+
+    Each session types one to three words taken from real entry titles, one
+    character at a time. Some words are misspelled, some sessions backspace
+    over the last word and retype it, and every session ends by clearing the
+    input.
+    """
+    rng = random.Random(seed)
+    result: list[list[str]] = []
+    for _ in range(sessions):
+        title_words = rng.choice(entries)["title"].lower().split()
+        words = rng.sample(title_words, k=min(len(title_words), rng.randint(1, 3)))
+        if rng.random() < 0.2:
+            words[-1] = _typo(rng, words[-1])
+        values: list[str] = []
+        typed = ""
+        for index, word in enumerate(words):
+            prefix = typed + (" " if index else "")
+            for end in range(1, len(word) + 1):
+                values.append(prefix + word[:end])
+            typed = prefix + word
+        if rng.random() < 0.3:
+            kept = typed[: len(typed) - len(words[-1])]
+            for end in range(len(typed) - 1, len(kept) - 1, -1):
+                values.append(typed[:end])
+            for end in range(1, len(words[-1]) + 1):
+                values.append(kept + words[-1][:end])
+        values.append("")
+        result.append(values)
+    return result
+
+
+__all__ = ["generate_corpus", "keystroke_sessions"]
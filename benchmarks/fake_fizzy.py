@@ -0,0 +1,276 @@
+"""Local stand-in for the Fizzy API, serving a synthetic board.
+
+``FakeFizzy`` answers the two endpoints the roadmap uses, with the board from
+``benchmarks.fizzy_board``:
+
+- ``GET /{account}/boards/{board_id}/columns``
+- ``GET /{account}/cards.json?board_ids=...[&indexed_by=closed][&sorted_by=latest][&page=N]``
+
+Card listings are paginated with ``Link: <...>; rel="next"`` headers, newest
+first or, with ``sorted_by=latest``, most recently updated first. Responses
+carry an ``ETag`` and honour ``If-None-Match``, and are gzip-compressed when
+the client accepts it, like the real API. ``latency`` and ``jitter`` delay
+every response. A share ``error_rate`` of requests fails with
+``error_status``, and setting ``down`` fails them all. ``touch`` changes cards
+so incremental syncs have something to pick up. ``stats`` counts what was
+served.
+
+Run it on its own to point a local app at it:
+
+    python -m benchmarks.fake_fizzy --cards 5000 --latency 0.05 --port 8765
+"""
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+from .fizzy_board import ACCOUNT_SLUG, BOARD_ID, generate_board
+
+DEFAULT_PAGE_SIZE = 50
+DEFAULT_TOKEN = "fake-fizzy-token"
+
+
+def _timestamp() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+class FakeFizzy:
+    """A threaded HTTP server that plays the Fizzy API for one synthetic board."""
+
+    def __init__(
+        self,
+        cards: int = 1_000,
+        *,
+        seed: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        token: str = DEFAULT_TOKEN,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        board = generate_board(cards, seed=seed)
+        self.columns: list[dict[str, Any]] = board["columns"]
+        self.cards: dict[str, dict[str, Any]] = {
+            card["id"]: card for card in (*board["open_cards"], *board["closed_cards"])
+        }
+        self.page_size = max(1, page_size)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.token = token
+        self.down = False
+        self.stats: Counter[str] = Counter()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._listings: dict[tuple[bool, bool], list[dict[str, Any]]] = {}
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def env(self) -> dict[str, str]:
+        """Environment settings that point the roadmap at this server."""
+        return {
+            "FIZZY_BASE_URL": self.base_url,
+            "FIZZY_TOKEN": self.token,
+            "FIZZY_ACCOUNT_SLUG": ACCOUNT_SLUG,
+            "FIZZY_BOARD_ID": BOARD_ID,
+        }
+
+    def start(self) -> FakeFizzy:
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> FakeFizzy:
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def serve_forever(self) -> None:
+        """Serve in the calling thread until interrupted."""
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._server.server_close()
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.stats[name] += amount
+
+    def reset_stats(self) -> Counter[str]:
+        """Return the counters so far and start new ones."""
+        with self._lock:
+            stats, self.stats = self.stats, Counter()
+        return stats
+
+    def touch(self, count: int) -> list[str]:
+        """Move ``count`` random open cards to another column; return their ids."""
+        with self._lock:
+            open_ids = sorted(card_id for card_id, card in self.cards.items() if not card["closed"])
+            touched = self._rng.sample(open_ids, min(count, len(open_ids)))
+            for card_id in touched:
+                column = self._rng.choice(self.columns)
+                card = self.cards[card_id] = dict(self.cards[card_id])
+                card["column"] = {"id": column["id"], "name": column["name"], "color": column["color"]}
+                card["updated_at"] = card["last_active_at"] = _timestamp()
+            self._listings.clear()
+        return touched
+
+    def _listing(self, closed: bool, latest: bool) -> list[dict[str, Any]]:
+        with self._lock:
+            listing = self._listings.get((closed, latest))
+            if listing is None:
+                cards = [card for card in self.cards.values() if card["closed"] == closed]
+                if latest:
+                    cards.sort(key=lambda card: card["updated_at"], reverse=True)
+                else:
+                    cards.sort(key=lambda card: card["number"], reverse=True)
+                listing = self._listings[(closed, latest)] = cards
+            return listing
+
+    def _respond(self, path: str, query: dict[str, list[str]]) -> tuple[int, Any, str]:
+        """``(status, payload, next_query)`` for a request, before errors are injected."""
+        prefix = f"/{ACCOUNT_SLUG}"
+        if not path.startswith(prefix + "/"):
+            return 404, {"error": "Unknown account."}, ""
+        path = path[len(prefix) :]
+        if path == f"/boards/{BOARD_ID}/columns":
+            self._count("columns")
+            return 200, self.columns, ""
+        if path != "/cards.json":
+            return 404, {"error": "Not found."}, ""
+        self._count("cards")
+        board_ids = query.get("board_ids") or query.get("board_ids[]") or [BOARD_ID]
+        if BOARD_ID not in board_ids:
+            return 200, [], ""
+        listing = self._listing(
+            closed=query.get("indexed_by", [""])[0] == "closed",
+            latest=query.get("sorted_by", [""])[0] == "latest",
+        )
+        try:
+            page = max(1, int(query.get("page", ["1"])[0]))
+        except ValueError:
+            page = 1
+        start = (page - 1) * self.page_size
+        next_query = ""
+        if start + self.page_size < len(listing):
+            next_query = urlencode({**{key: values[0] for key, values in query.items()}, "page": page + 1})
+        return 200, listing[start : start + self.page_size], next_query
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def _send(self, status: int, body: bytes = b"", headers: dict[str, str] | None = None) -> None:
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                try:
+                    self.end_headers()
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    # The client gave up first, e.g. its deadline passed.
+                    self.close_connection = True
+
+            def do_GET(self) -> None:
+                delay = fake.latency + (fake._rng.uniform(0, fake.jitter) if fake.jitter else 0.0)
+                if delay:
+                    time.sleep(delay)
+                fake._count("requests")
+                if fake.token and self.headers.get("Authorization") != f"Bearer {fake.token}":
+                    fake._count("unauthorized")
+                    self._send(401, b'{"error": "Unauthorized."}', {"Content-Type": "application/json"})
+                    return
+                if fake.down or (fake.error_rate and fake._rng.random() < fake.error_rate):
+                    fake._count("errors")
+                    self._send(fake.error_status, b'{"error": "Injected failure."}', {"Content-Type": "application/json"})
+                    return
+
+                url = urlsplit(self.path)
+                status, payload, next_query = fake._respond(url.path, parse_qs(url.query))
+                body = json.dumps(payload).encode("utf-8")
+                headers = {"Content-Type": "application/json"}
+                if status == 200:
+                    etag = f'"{hashlib.sha1(body).hexdigest()}"'
+                    headers["ETag"] = etag
+                    if self.headers.get("If-None-Match") == etag:
+                        fake._count("not_modified")
+                        self._send(304, headers={"ETag": etag})
+                        return
+                    if next_query:
+                        headers["Link"] = f'<{fake.base_url}{url.path}?{next_query}>; rel="next"'
+                if "gzip" in (self.headers.get("Accept-Encoding") or ""):
+                    body = gzip.compress(body, compresslevel=5)
+                    headers["Content-Encoding"] = "gzip"
+                fake._count("bytes_sent", len(body))
+                self._send(status, body, headers)
+
+        return Handler
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=1_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="up to this many more seconds, at random")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests that fail")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args(argv)
+
+    fake = FakeFizzy(
+        args.cards,
+        seed=args.seed,
+        page_size=args.page_size,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        host=args.host,
+        port=args.port,
+    )
+    print(f"Serving a {args.cards}-card board at {fake.base_url}. Point the app at it with:")
+    for name, value in fake.env().items():
+        print(f"  {name}={value}")
+    fake.serve_forever()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
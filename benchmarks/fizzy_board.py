@@ -0,0 +1,99 @@
+"""Deterministic synthetic Fizzy boards for roadmap benchmarks.
+
+Columns and cards have the shape the Fizzy API returns from
+``/boards/{id}/columns`` and ``/cards.json``, including the fields the roadmap
+ignores (creator, description, timestamps), so parsing and memory figures
+reflect real payloads. Cards are returned newest first, as Fizzy pages them.
+A few cards belong to another board or carry an excluded tag, so filtering is
+exercised too.
+"""
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+BOARD_ID = "03f5bench0board"
+OTHER_BOARD_ID = "03f5other0board"
+ACCOUNT_SLUG = "000bench"
+COLUMN_NAMES = ("Specification", "Working on", "Testing", "Review", "Done")
+TAGS = ("ui", "node", "contracts", "docs", "wallet", "infra", "sdk", "research", "bug", "internal")
+EXCLUDED_TAGS = {"internal"}
+WORDS = (
+    "add", "fix", "stake", "block", "sync", "peer", "wallet", "contract", "token", "index",
+    "cache", "query", "node", "release", "docs", "explorer", "bridge", "vote", "fee", "graph",
+)
+CLOSED_RATIO = 0.35
+OTHER_BOARD_RATIO = 0.02
+DESCRIPTION_WORDS = 80
+EPOCH = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _timestamp(moment: datetime) -> str:
+    return moment.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def generate_columns(board_id: str = BOARD_ID) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": f"col{position:04d}",
+            "name": name,
+            "color": {"name": "Blue", "value": "var(--color-card-default)"},
+            "position": position,
+            "created_at": _timestamp(EPOCH),
+        }
+        for position, name in enumerate(COLUMN_NAMES, start=1)
+    ]
+
+
+def _card(
+    rng: random.Random,
+    number: int,
+    columns: list[dict[str, Any]],
+    board_id: str,
+    closed: bool,
+) -> dict[str, Any]:
+    tags = rng.sample(TAGS, rng.randint(0, 3))
+    created = EPOCH + timedelta(minutes=number * 7)
+    updated = created + timedelta(minutes=rng.randint(0, 60 * 24 * 30))
+    column = None if closed or rng.random() < 0.1 else rng.choice(columns)
+    card_id = f"03f5card{number:010d}"
+    title = " ".join(rng.choices(WORDS, k=rng.randint(3, 9))).capitalize()
+    card: dict[str, Any] = {
+        "id": card_id,
+        "number": number,
+        "title": title,
+        "status": "published",
+        "description": " ".join(rng.choices(WORDS, k=DESCRIPTION_WORDS)),
+        "image_url": None,
+        # Fizzy returns tag names; older payloads used tag objects.
+        "tags": tags if number % 2 else [{"id": f"tag-{tag}", "name": tag} for tag in tags],
+        "golden": rng.random() < 0.05,
+        "closed": closed,
+        "created_at": _timestamp(created),
+        "updated_at": _timestamp(updated),
+        "last_active_at": _timestamp(updated),
+        "url": f"https://app.fizzy.do/{ACCOUNT_SLUG}/cards/{number}",
+        "board": {"id": board_id, "name": "Roadmap"},
+        "creator": {"id": f"user{number % 17:03d}", "name": f"Member {number % 17}", "role": "member"},
+        "comments_url": f"https://app.fizzy.do/{ACCOUNT_SLUG}/cards/{number}/comments.json",
+    }
+    if column is not None:
+        card["column"] = {"id": column["id"], "name": column["name"], "color": column["color"]}
+    return card
+
+
+def generate_board(size: int, seed: int = 0) -> dict[str, Any]:
+    """Return ``{"columns", "open_cards", "closed_cards"}`` for a board of ``size`` cards."""
+    rng = random.Random(seed)
+    columns = generate_columns()
+    open_cards: list[dict[str, Any]] = []
+    closed_cards: list[dict[str, Any]] = []
+    for number in range(size, 0, -1):
+        board_id = OTHER_BOARD_ID if rng.random() < OTHER_BOARD_RATIO else BOARD_ID
+        closed = rng.random() < CLOSED_RATIO
+        (closed_cards if closed else open_cards).append(_card(rng, number, columns, board_id, closed))
+    return {"columns": columns, "open_cards": open_cards, "closed_cards": closed_cards}
+
+
+__all__ = ["BOARD_ID", "EXCLUDED_TAGS", "generate_board", "generate_columns"]
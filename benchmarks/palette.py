@@ -0,0 +1,234 @@
+"""Command palette search benchmark.
+
+Generates synthetic corpora (see ``benchmarks.corpus``), installs each one as
+the search index and replays keystroke sessions through ``State``. Every
+keystroke runs ``set_command_query`` and then reads ``command_palette_layout``,
+``command_palette_actions``, ``command_palette_active_action`` and the
+serialized state delta, which is what a real event does before it is sent to
+the browser.
+
+Timing and memory are measured in separate passes, because tracemalloc slows
+everything it traces. The memory pass replays only the first
+``MEMORY_SESSIONS`` sessions. Each pass starts from an empty query cache.
+
+    python -m benchmarks.palette                      # run and compare to baselines
+    python -m benchmarks.palette --sizes 100 1000     # quicker subset
+    python -m benchmarks.palette --update-baseline    # record new baselines
+
+The exit status is 1 when any metric regresses beyond the tolerance.
+Baselines are machine-specific, so record them on the machine that runs the
+comparison.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+from unittest import mock
+
+from .baseline import report
+from .corpus import generate_corpus, keystroke_sessions
+
+DEFAULT_SIZES = (100, 1_000, 10_000, 100_000)
+DEFAULT_SESSIONS = 40
+MEMORY_SESSIONS = 8
+DEFAULT_TOLERANCE = 0.3
+BASELINE_PATH = Path(__file__).resolve().parent / "baselines" / "palette.json"
+
+# Metrics compared against the baseline. Each has an absolute floor that a
+# regression must also exceed, so scheduler noise on small corpora cannot fail a run.
+CHECKED_METRICS = {
+    "build_s": 0.1,
+    "open_ms": 5.0,
+    "keystroke_p50_ms": 0.5,
+    "keystroke_p99_ms": 2.0,
+    "alloc_kib_mean": 16.0,
+    "alloc_kib_p99": 64.0,
+    "index_mib": 0.5,
+    "peak_mib": 1.0,
+}
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def _palette_state() -> Any:
+    import reflex as rx
+
+    from xian_tech.state import State
+
+    root = rx.State(_reflex_internal_init=True)
+    return root.get_substate(State.get_full_name().split(".")[1:])
+
+
+@contextmanager
+def _installed(index: Any) -> Iterator[None]:
+    """Serve ``index`` to the palette in place of the site index."""
+    from xian_tech import search
+
+    search.QUERY_CACHE.clear()
+    with mock.patch.object(search, "get_search_index", lambda: index):
+        yield
+    search.QUERY_CACHE.clear()
+
+
+def _open(state: Any) -> int:
+    async def run() -> None:
+        async for _ in state.open_command_palette():
+            pass
+
+    asyncio.run(run())
+    return _flush(state)
+
+
+def _keystroke(state: Any, value: str) -> int:
+    state.set_command_query(value)
+    state.command_palette_layout
+    state.command_palette_actions
+    state.command_palette_active_action
+    return _flush(state)
+
+
+def _flush(state: Any) -> int:
+    from reflex.utils.format import json_dumps
+
+    size = len(json_dumps(state.get_delta()))
+    state._clean()
+    return size
+
+
+def _time_pass(entries: list[dict[str, Any]], sessions: list[list[str]]) -> dict[str, Any]:
+    from xian_tech.search import QUERY_CACHE, SearchIndex
+
+    started = time.perf_counter()
+    index = SearchIndex(entries)
+    build_s = time.perf_counter() - started
+
+    with _installed(index):
+        state = _palette_state()
+        started = time.perf_counter()
+        open_bytes = _open(state)
+        open_ms = (time.perf_counter() - started) * 1000
+
+        latencies: list[float] = []
+        delta_bytes: list[int] = []
+        for values in sessions:
+            for value in values:
+                started = time.perf_counter_ns()
+                delta_bytes.append(_keystroke(state, value))
+                latencies.append((time.perf_counter_ns() - started) / 1e6)
+        cache = QUERY_CACHE.stats()
+
+    return {
+        "build_s": build_s,
+        "open_ms": open_ms,
+        "open_kib": open_bytes / 1024,
+        "keystrokes": len(latencies),
+        "keystroke_p50_ms": statistics.median(latencies),
+        "keystroke_p99_ms": _percentile(latencies, 0.99),
+        "keystroke_max_ms": max(latencies),
+        "delta_kib_p50": statistics.median(delta_bytes) / 1024,
+        "delta_kib_p99": _percentile(delta_bytes, 0.99) / 1024,
+        "cache_hit_ratio": cache["hit_ratio"],
+    }
+
+
+def _memory_pass(entries: list[dict[str, Any]], sessions: list[list[str]]) -> dict[str, Any]:
+    from xian_tech.search import SearchIndex
+
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        index = SearchIndex(entries)
+        index_bytes = tracemalloc.get_traced_memory()[0] - baseline
+
+        allocations: list[int] = []
+        with _installed(index):
+            state = _palette_state()
+            _open(state)
+            for values in sessions:
+                for value in values:
+                    before, _ = tracemalloc.get_traced_memory()
+                    tracemalloc.reset_peak()
+                    _keystroke(state, value)
+                    allocations.append(tracemalloc.get_traced_memory()[1] - before)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "index_mib": index_bytes / 2**20,
+        "alloc_kib_mean": statistics.fmean(allocations) / 1024,
+        "alloc_kib_p99": _percentile(allocations, 0.99) / 1024,
+        "peak_mib": (peak_bytes - baseline) / 2**20,
+    }
+
+
+def run_corpus(size: int, session_count: int = DEFAULT_SESSIONS, seed: int = 0) -> dict[str, Any]:
+    """Benchmark one synthetic corpus of ``size`` entries."""
+    entries = generate_corpus(size, seed=seed)
+    sessions = keystroke_sessions(entries, sessions=session_count, seed=seed)
+    return {
+        "entries": size,
+        **_time_pass(entries, sessions),
+        **_memory_pass(entries, sessions[:MEMORY_SESSIONS]),
+    }
+
+
+def _print_table(results: dict[str, dict[str, Any]]) -> None:
+    columns = (
+        ("entries", "{:>8}"),
+        ("build_s", "{:>8.2f}"),
+        ("open_ms", "{:>8.1f}"),
+        ("keystroke_p50_ms", "{:>8.3f}"),
+        ("keystroke_p99_ms", "{:>8.3f}"),
+        ("delta_kib_p99", "{:>8.1f}"),
+        ("alloc_kib_mean", "{:>8.1f}"),
+        ("alloc_kib_p99", "{:>8.1f}"),
+        ("index_mib", "{:>8.1f}"),
+        ("peak_mib", "{:>8.1f}"),
+    )
+    headers = (
+        "entries", "build s", "open ms", "p50 ms", "p99 ms",
+        "delta KiB", "alloc KiB", "alloc p99", "index MiB", "peak MiB",
+    )
+    print(" ".join(f"{header:>9}" for header in headers))
+    for metrics in results.values():
+        print(" ".join(" " + fmt.format(metrics[name]) for name, fmt in columns))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--sessions", type=int, default=DEFAULT_SESSIONS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--json", action="store_true", help="print raw results as JSON")
+    args = parser.parse_args(argv)
+
+    results: dict[str, dict[str, Any]] = {}
+    for size in args.sizes:
+        print(f"Benchmarking {size} entries...", file=sys.stderr, flush=True)
+        results[str(size)] = run_corpus(size, args.sessions, args.seed)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        _print_table(results)
+
+    return report(results, args.baseline, args.tolerance, CHECKED_METRICS, args.update_baseline)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
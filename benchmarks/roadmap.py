@@ -0,0 +1,215 @@
+"""Roadmap normalization benchmark.
+
+Generates synthetic Fizzy boards (see ``benchmarks.fizzy_board``) and shapes
+each one with ``roadmap_board.normalize_board``, the step that turns raw
+columns and cards into the payload ``State`` sends to the browser. It reports
+throughput in cards per second and the peak memory the step allocates on top
+of the raw payload.
+
+The load pass decodes the board's ``/cards.json`` pages the way the roadmap
+does, streaming each body through ``board_cards`` in network-sized chunks,
+and reports its time and peak memory next to the peak of parsing every page
+with ``json.loads`` and keeping the raw cards.
+
+Timing and memory are measured in separate passes, because tracemalloc slows
+everything it traces. The timing pass keeps the best of ``--repeats`` runs.
+
+    python -m benchmarks.roadmap                      # run and compare to baselines
+    python -m benchmarks.roadmap --sizes 1000 10000   # quicker subset
+    python -m benchmarks.roadmap --update-baseline    # record new baselines
+
+The exit status is 1 when any metric regresses beyond the tolerance.
+Baselines are machine-specific, so record them on the machine that runs the
+comparison.
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+from .baseline import report
+from .fizzy_board import BOARD_ID, EXCLUDED_TAGS, generate_board
+
+PAGE_SIZE = 100
+DEFAULT_SIZES = (1_000, 10_000, 50_000)
+DEFAULT_REPEATS = 5
+DEFAULT_TOLERANCE = 0.3
+BASELINE_PATH = Path(__file__).resolve().parent / "baselines" / "roadmap.json"
+
+# Metrics compared against the baseline. Each has an absolute floor that a
+# regression must also exceed, so scheduler noise on small boards cannot fail a run.
+CHECKED_METRICS = {
+    "normalize_ms": 5.0,
+    "peak_mib": 1.0,
+    "load_ms": 5.0,
+    "load_peak_mib": 1.0,
+}
+
+
+def _normalize(board: dict[str, Any]) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    from xian_tech.roadmap_board import normalize_board
+
+    return normalize_board(
+        BOARD_ID,
+        EXCLUDED_TAGS,
+        board["columns"],
+        board["open_cards"],
+        board["closed_cards"],
+    )
+
+
+def _time_pass(board: dict[str, Any], repeats: int) -> dict[str, Any]:
+    timings: list[float] = []
+    for _ in range(repeats):
+        gc.collect()
+        started = time.perf_counter()
+        columns, done = _normalize(board)
+        timings.append(time.perf_counter() - started)
+        del columns, done
+    return {"normalize_ms": min(timings) * 1000}
+
+
+def _memory_pass(board: dict[str, Any]) -> dict[str, Any]:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        columns, done = _normalize(board)
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "peak_mib": (peak - baseline) / 2**20,
+        "output_mib": (retained - baseline) / 2**20,
+        "active_cards": sum(column["count"] for column in columns),
+        "done_cards": len(done),
+    }
+
+
+def _page_bodies(board: dict[str, Any]) -> list[bytes]:
+    cards = board["open_cards"] + board["closed_cards"]
+    return [
+        json.dumps(cards[start : start + PAGE_SIZE]).encode("utf-8")
+        for start in range(0, len(cards), PAGE_SIZE)
+    ]
+
+
+def _stream_load(bodies: list[bytes]) -> list[dict[str, Any]]:
+    from functools import partial
+
+    from xian_tech.fizzy_api import STREAM_CHUNK_SIZE, StreamedPage
+    from xian_tech.roadmap_board import board_cards
+
+    transform = partial(board_cards, board_id=BOARD_ID)
+    cards: list[dict[str, Any]] = []
+    for body in bodies:
+        page = StreamedPage(transform)
+        for start in range(0, len(body), STREAM_CHUNK_SIZE):
+            page.feed(body[start : start + STREAM_CHUNK_SIZE])
+        page.finish()
+        cards.extend(page.items)
+    return cards
+
+
+def _buffered_load(bodies: list[bytes]) -> list[dict[str, Any]]:
+    return [card for body in bodies for card in json.loads(body) if isinstance(card, dict)]
+
+
+def _traced_peak(function: Any, *args: Any) -> float:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        result = function(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return (peak - baseline) / 2**20
+
+
+def _load_pass(board: dict[str, Any], repeats: int) -> dict[str, Any]:
+    bodies = _page_bodies(board)
+    timings: list[float] = []
+    for _ in range(repeats):
+        gc.collect()
+        started = time.perf_counter()
+        cards = _stream_load(bodies)
+        timings.append(time.perf_counter() - started)
+        del cards
+    return {
+        "load_ms": min(timings) * 1000,
+        "load_peak_mib": _traced_peak(_stream_load, bodies),
+        "buffered_peak_mib": _traced_peak(_buffered_load, bodies),
+    }
+
+
+def run_board(size: int, repeats: int = DEFAULT_REPEATS, seed: int = 0) -> dict[str, Any]:
+    """Benchmark one synthetic board of ``size`` cards."""
+    board = generate_board(size, seed=seed)
+    timing = _time_pass(board, repeats)
+    return {
+        "cards": size,
+        **timing,
+        "cards_per_s": size / (timing["normalize_ms"] / 1000),
+        **_memory_pass(board),
+        **_load_pass(board, repeats),
+    }
+
+
+def _print_table(results: dict[str, dict[str, Any]]) -> None:
+    columns = (
+        ("cards", "{:>8}"),
+        ("normalize_ms", "{:>8.1f}"),
+        ("cards_per_s", "{:>8.0f}"),
+        ("peak_mib", "{:>8.1f}"),
+        ("output_mib", "{:>8.1f}"),
+        ("active_cards", "{:>8}"),
+        ("done_cards", "{:>8}"),
+        ("load_ms", "{:>8.1f}"),
+        ("load_peak_mib", "{:>8.1f}"),
+        ("buffered_peak_mib", "{:>8.1f}"),
+    )
+    headers = (
+        "cards", "time ms", "cards/s", "peak MiB", "out MiB", "active", "done",
+        "load ms", "load MiB", "loads MiB",
+    )
+    print(" ".join(f"{header:>9}" for header in headers))
+    for metrics in results.values():
+        print(" ".join(" " + fmt.format(metrics[name]) for name, fmt in columns))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--json", action="store_true", help="print raw results as JSON")
+    args = parser.parse_args(argv)
+
+    results: dict[str, dict[str, Any]] = {}
+    for size in args.sizes:
+        print(f"Benchmarking {size} cards...", file=sys.stderr, flush=True)
+        results[str(size)] = run_board(size, args.repeats, args.seed)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        _print_table(results)
+
+    return report(
+        results, args.baseline, args.tolerance, CHECKED_METRICS, args.update_baseline, unit="cards"
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
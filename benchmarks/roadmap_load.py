@@ -0,0 +1,222 @@
+"""Roadmap load test against the local Fizzy stand-in.
+
+Starts ``benchmarks.fake_fizzy`` in-process, points the roadmap at it and runs
+``--sessions`` concurrent ``/roadmap`` sessions through ``State.load_roadmap``.
+Sessions arrive spread over ``--arrival`` seconds. Each state update is
+serialized like a real event would be before it is sent to the browser. Three
+phases run in order:
+
+- cold: nothing is cached, so every session waits on one shared load and
+  renders the partial boards it publishes;
+- warm: a fresh snapshot is cached, so sessions are served from memory;
+- refresh: the snapshot is stale and ``--changes`` cards changed, so sessions
+  get the stale board while one incremental sync runs in the background.
+
+Each phase reports how long sessions took to their first board and to their
+last state update, how many updates and bytes they received, how long the
+shared Fizzy load took, and the requests the fake served.
+
+    python -m benchmarks.roadmap_load
+    python -m benchmarks.roadmap_load --cards 20000 --sessions 200 --latency 0.05
+    python -m benchmarks.roadmap_load --error-rate 0.05   # with injected failures
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Any
+
+from .fake_fizzy import DEFAULT_PAGE_SIZE, FakeFizzy
+from .fizzy_board import EXCLUDED_TAGS
+
+DEFAULT_CARDS = 2_000
+DEFAULT_SESSIONS = 20
+DEFAULT_ARRIVAL = 0.5
+DEFAULT_CHANGES = 20
+LOAD_TIMEOUT = 120.0
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def _configure(fake: FakeFizzy) -> None:
+    """Point the roadmap at ``fake``; must run before ``xian_tech.roadmap`` is imported."""
+    os.environ.update(fake.env())
+    os.environ.update(
+        FIZZY_EXCLUDE_TAGS=",".join(sorted(EXCLUDED_TAGS)),
+        FIZZY_CACHE_DIR="none",
+        ROADMAP_SNAPSHOT_PATH="none",
+    )
+    os.environ.pop("FIZZY_WEBHOOK_SECRET", None)
+    no_proxy = os.environ.get("no_proxy", "")
+    os.environ["no_proxy"] = ",".join(filter(None, (no_proxy, "127.0.0.1", "localhost")))
+
+
+def _roadmap_state() -> Any:
+    import reflex as rx
+
+    from xian_tech.state import State
+
+    root = rx.State(_reflex_internal_init=True)
+    return root.get_substate(State.get_full_name().split(".")[1:])
+
+
+def _flush(state: Any) -> int:
+    from reflex.utils.format import json_dumps
+
+    size = len(json_dumps(state.get_delta()))
+    state._clean()
+    return size
+
+
+async def _session(delay: float) -> dict[str, Any]:
+    await asyncio.sleep(delay)
+    state = _roadmap_state()
+    started = time.perf_counter()
+    first_board = None
+    updates = 0
+    sent = 0
+
+    def update() -> None:
+        nonlocal first_board, updates, sent
+        sent += _flush(state)
+        updates += 1
+        if first_board is None and state.roadmap_columns:
+            first_board = time.perf_counter() - started
+
+    async for _ in state.load_roadmap():
+        update()
+    update()  # the delta sent when the handler returns
+    elapsed = time.perf_counter() - started
+    return {
+        "first_board_s": elapsed if first_board is None else first_board,
+        "done_s": elapsed,
+        "updates": updates,
+        "kib": sent / 1024,
+        "error": bool(state.roadmap_error),
+    }
+
+
+async def _wait_fresh(cache: Any, started: float, sessions: asyncio.Future[Any]) -> float | None:
+    """Seconds from ``started`` until ``cache`` holds a fresh snapshot.
+
+    ``None`` when the shared load failed (the sessions are done and nothing
+    is loading) or took longer than ``LOAD_TIMEOUT``.
+    """
+    while cache.snapshot is None or cache.is_stale():
+        idle = sessions.done() and not cache.flights.stats()["in_flight"]
+        if idle or time.perf_counter() - started > LOAD_TIMEOUT:
+            return None
+        await asyncio.sleep(0.005)
+    return time.perf_counter() - started
+
+
+async def _phase(fake: FakeFizzy, sessions: int, arrival: float) -> dict[str, Any]:
+    from xian_tech.roadmap import ROADMAP_CACHE
+
+    fake.reset_stats()
+    fetches = ROADMAP_CACHE.fetches
+    step = arrival / sessions if sessions > 1 else 0.0
+    started = time.perf_counter()
+    running = asyncio.gather(*(_session(index * step) for index in range(sessions)))
+    load_s = await _wait_fresh(ROADMAP_CACHE, started, running)
+    results = await running
+    served = fake.reset_stats()
+
+    first_board = [result["first_board_s"] * 1000 for result in results]
+    done = [result["done_s"] * 1000 for result in results]
+    return {
+        "sessions": sessions,
+        "first_board_p50_ms": statistics.median(first_board),
+        "first_board_p99_ms": _percentile(first_board, 0.99),
+        "done_p50_ms": statistics.median(done),
+        "done_p99_ms": _percentile(done, 0.99),
+        "updates_mean": statistics.fmean(result["updates"] for result in results),
+        "kib_mean": statistics.fmean(result["kib"] for result in results),
+        "session_errors": sum(result["error"] for result in results),
+        "load_ms": None if load_s is None else load_s * 1000,
+        "cache_loads": ROADMAP_CACHE.fetches - fetches,
+        "fizzy_requests": served["requests"],
+        "fizzy_304s": served["not_modified"],
+        "fizzy_errors": served["errors"],
+        "fizzy_kib": served["bytes_sent"] / 1024,
+    }
+
+
+async def run_load_test(fake: FakeFizzy, sessions: int, arrival: float, changes: int) -> dict[str, Any]:
+    """Run the cold, warm and refresh phases against ``fake``."""
+    from xian_tech.roadmap import ROADMAP_CACHE
+
+    ROADMAP_CACHE.clear()
+    results = {"cold": await _phase(fake, sessions, arrival)}
+    results["warm"] = await _phase(fake, sessions, arrival)
+    snapshot = ROADMAP_CACHE.snapshot
+    if snapshot is not None:
+        snapshot["fetched_at"] -= ROADMAP_CACHE.ttl
+    fake.touch(changes)
+    results["refresh"] = await _phase(fake, sessions, arrival)
+    return results
+
+
+def _format(value: Any) -> str:
+    if value is None:
+        return "failed"
+    if isinstance(value, float):
+        return f"{value:.1f}"
+    return str(value)
+
+
+def _print_table(results: dict[str, dict[str, Any]]) -> None:
+    metrics = list(next(iter(results.values())))
+    print(f"{'':>20}" + "".join(f"{phase:>10}" for phase in results))
+    for metric in metrics:
+        print(f"{metric:>20}" + "".join(f"{_format(values[metric]):>10}" for values in results.values()))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=DEFAULT_CARDS)
+    parser.add_argument("--sessions", type=int, default=DEFAULT_SESSIONS)
+    parser.add_argument("--arrival", type=float, default=DEFAULT_ARRIVAL, help="seconds over which sessions arrive")
+    parser.add_argument("--changes", type=int, default=DEFAULT_CHANGES, help="cards changed before the refresh phase")
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE)
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds the fake adds to every response")
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of fake requests that fail")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="print raw results as JSON")
+    args = parser.parse_args(argv)
+
+    fake = FakeFizzy(
+        args.cards,
+        seed=args.seed,
+        page_size=args.page_size,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+    )
+    _configure(fake)
+    print(
+        f"Load testing {args.sessions} sessions on a {args.cards}-card board at {fake.base_url}...",
+        file=sys.stderr,
+        flush=True,
+    )
+    with fake:
+        results = asyncio.run(run_load_test(fake, args.sessions, args.arrival, args.changes))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        _print_table(results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+
+from benchmarks.fake_fizzy import FakeFizzy
+from benchmarks.fizzy_board import ACCOUNT_SLUG, BOARD_ID
+from xian_tech.roadmap import BoardConfig, BoardMirror, load_board, stream_board, sync_board
+
+CONFIG = BoardConfig("https://fizzy.example", "acct", "token", "board", frozenset())
+
+
+def _card(card_id, updated_at, closed=False, title="Card"):
+    return {
+        "id": card_id,
+        "number": int(card_id[1:]),
+        "title": title,
+        "closed": closed,
+        "updated_at": updated_at,
+    }
+
+
+def _mirror(*cards):
+    mirror = BoardMirror(CONFIG)
+    mirror.reset(
+        [{"id": "col", "name": "Working on"}],
+        [card for card in cards if not card["closed"]],
+        [card for card in cards if card["closed"]],
+    )
+    return mirror
+
+
+def test_reset_tracks_the_newest_change_time():
+    mirror = _mirror(_card("c1", "2026-01-01T00:00:00Z"), _card("c2", "2026-01-02T00:00:00Z"))
+    assert mirror.high_water == _mirror(_card("c2", "2026-01-02T00:00:00Z")).high_water
+    assert not mirror.needs_full_sync(3600)
+    assert mirror.needs_full_sync(0)
+
+
+def test_cards_without_change_times_force_full_syncs():
+    mirror = _mirror(_card("c1", "2026-01-01T00:00:00Z"), _card("c2", None))
+    assert mirror.high_water is None
+    assert mirror.needs_full_sync(3600)
+
+
+def test_merge_upserts_newer_cards_and_moves_them_between_listings():
+    mirror = _mirror(_card("c1", "2026-01-01T00:00:00Z"), _card("c2", "2026-01-01T00:00:00Z"))
+    before = mirror.high_water
+    mirror.merge(
+        mirror.columns,
+        [_card("c3", "2026-01-03T00:00:00Z")],
+        [_card("c1", "2026-01-02T00:00:00Z", closed=True)],
+    )
+    assert set(mirror.open) == {"c2", "c3"}
+    assert set(mirror.closed) == {"c1"}
+    assert mirror.high_water > before
+    assert mirror.changes == 2
+
+
+def test_merge_ignores_versions_older_than_the_stored_one():
+    mirror = _mirror(_card("c1", "2026-01-02T00:00:00Z", title="New"))
+    mirror.merge(mirror.columns, [_card("c1", "2026-01-01T00:00:00Z", title="Old")], [])
+    assert mirror.open["c1"]["title"] == "New"
+    assert mirror.changes == 0
+
+
+def test_pushed_cards_merge_over_the_stored_card_without_moving_high_water():
+    mirror = _mirror(_card("c1", "2026-01-01T00:00:00Z", title="Old"))
+    before = mirror.high_water
+    assert mirror.upsert_card({"id": "c1", "updated_at": "2026-01-02T00:00:00Z"}, closed=True)
+    assert mirror.closed["c1"]["title"] == "Old"
+    assert "c1" not in mirror.open
+    assert mirror.high_water == before
+    assert not mirror.upsert_card({"id": "c1", "updated_at": "2025-12-31T00:00:00Z", "title": "Older"})
+    assert mirror.remove_card({"id": "c1"})
+    assert not mirror.remove_card({"id": "c1"})
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    monkeypatch.setenv("FIZZY_CACHE_DIR", "none")
+    monkeypatch.setenv("no_proxy", "127.0.0.1,localhost")
+    with FakeFizzy(300, page_size=40) as fake:
+        yield fake
+
+
+def test_sync_board_matches_a_full_load(fake):
+    config = BoardConfig(fake.base_url, ACCOUNT_SLUG, fake.token, BOARD_ID, frozenset())
+
+    async def run():
+        mirror = BoardMirror(config)
+        async for before in stream_board(config, mirror=mirror):
+            pass
+        fake.touch(12)
+        fake.reset_stats()
+        synced = await sync_board(mirror)
+        stats = fake.reset_stats()
+        return before[:2], synced, await load_board(config), stats
+
+    before, synced, loaded, stats = asyncio.run(run())
+    assert synced == loaded
+    assert synced != before
+    # Columns plus the first page of each listing, not the whole board.
+    assert stats["requests"] <= 4
@@ -0,0 +1,150 @@
+import asyncio
+import json
+import socket
+import struct
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from xian_tech import fizzy_async
+from xian_tech.fizzy_api import STREAM_CHUNK_SIZE, FizzyClient, ResponseCache
+from xian_tech.fizzy_async import AsyncFizzyClient
+from xian_tech.fizzy_retry import CircuitBreaker, RetryPolicy
+
+ITEMS = [{"id": f"card-{number}", "title": "x" * 60} for number in range(3_000)]
+BODY = json.dumps(ITEMS).encode("utf-8")
+
+
+class DroppingServer:
+    """Serves ``BODY`` with keep-alive, but drops the first connection partway
+    through its second response, after more than one read's worth of body."""
+
+    def __init__(self):
+        self._socket = socket.create_server(("127.0.0.1", 0))
+        self.connections = 0
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._socket.getsockname()
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._socket.close()
+
+    def _serve(self):
+        while True:
+            try:
+                connection, _ = self._socket.accept()
+            except OSError:
+                return
+            self.connections += 1
+            threading.Thread(
+                target=self._handle, args=(connection, self.connections == 1), daemon=True
+            ).start()
+
+    def _handle(self, connection: socket.socket, drop: bool):
+        head = f"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: {len(BODY)}\r\n\r\n"
+        buffer = b""
+        served = 0
+        with connection:
+            while True:
+                while b"\r\n\r\n" not in buffer:
+                    data = connection.recv(65536)
+                    if not data:
+                        return
+                    buffer += data
+                buffer = buffer.partition(b"\r\n\r\n")[2]
+                served += 1
+                if drop and served == 2:
+                    connection.sendall(head.encode("latin-1") + BODY[: len(BODY) * 2 // 3])
+                    time.sleep(0.2)
+                    # Reset rather than close, like a peer that went away.
+                    connection.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+                    return
+                connection.sendall(head.encode("latin-1") + BODY)
+
+
+def _options():
+    return {
+        "compress": False,
+        "cache": ResponseCache(None, "token"),
+        "retry": RetryPolicy(backoff=0.0),
+        "breaker": CircuitBreaker("test"),
+    }
+
+
+def test_body_is_larger_than_one_read():
+    assert len(BODY) * 2 // 3 > 2 * STREAM_CHUNK_SIZE
+
+
+def test_sync_client_does_not_refeed_a_partly_read_page():
+    with DroppingServer() as server:
+        client = FizzyClient(server.base_url, "acct", "token", **_options())
+        try:
+            assert next(client.stream_pages("/first")) == ITEMS
+            assert next(client.stream_pages("/second")) == ITEMS
+        finally:
+            client.close()
+    assert server.connections == 2
+    assert client.retries == 1
+
+
+async def _fetch_page(client: AsyncFizzyClient, path: str):
+    async for page in client.stream_pages(path):
+        return page
+    pytest.fail("no page")
+
+
+def _fetch_twice(executor=None):
+    async def run():
+        with DroppingServer() as server:
+            client = AsyncFizzyClient(server.base_url, "acct", "token", executor, **_options())
+            try:
+                assert await _fetch_page(client, "/first") == ITEMS
+                assert await _fetch_page(client, "/second") == ITEMS
+            finally:
+                client.close()
+        return server, client
+
+    return asyncio.run(run())
+
+
+def test_async_client_does_not_refeed_a_partly_read_page(monkeypatch):
+    monkeypatch.setattr(fizzy_async, "FEED_BATCH_BYTES", STREAM_CHUNK_SIZE)
+    server, client = _fetch_twice()
+    assert server.connections == 2
+    assert client.retries == 1
+
+
+def test_async_client_resends_when_nothing_was_fed_yet():
+    assert len(BODY) < fizzy_async.FEED_BATCH_BYTES
+    server, client = _fetch_twice()
+    assert server.connections == 2
+    assert client.retries == 0
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.calls = 0
+
+    def submit(self, *args, **kwargs):
+        self.calls += 1
+        return super().submit(*args, **kwargs)
+
+
+def test_async_client_decodes_on_its_executor_in_few_hops():
+    executor = CountingExecutor()
+    try:
+        _fetch_twice(executor)
+    finally:
+        executor.shutdown()
+    # Per page: one hop for the buffered body and one for the result.
+    assert executor.calls == 2 * 2
@@ -0,0 +1,126 @@
+import random
+
+import pytest
+
+from xian_tech.fizzy_retry import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    FizzyAPIError,
+    RetryPolicy,
+    parse_retry_after,
+)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker("fizzy.test", failure_threshold=3, reset_timeout=30.0, clock=clock)
+
+
+def _trip(breaker):
+    for _ in range(breaker.failure_threshold):
+        breaker.allow()
+        breaker.record_failure("503")
+
+
+def test_consecutive_failures_open_the_breaker(breaker):
+    breaker.record_failure("503")
+    breaker.record_failure("503")
+    breaker.record_success()  # resets the run
+    breaker.record_failure("503")
+    breaker.record_failure("503")
+    assert breaker.state == CLOSED
+    breaker.record_failure("503")
+    assert breaker.state == OPEN
+    assert breaker.stats()["opens"] == 1
+
+
+def test_an_open_breaker_rejects_until_the_reset_timeout(breaker, clock):
+    _trip(breaker)
+    clock.now += 29
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+    assert breaker.stats()["rejected"] == 1
+    assert breaker.stats()["retry_in"] == 1.0
+    clock.now += 1
+    breaker.allow()
+    assert breaker.state == HALF_OPEN
+
+
+def test_half_open_lets_one_probe_through(breaker, clock):
+    _trip(breaker)
+    clock.now += 30
+    breaker.allow()
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+
+
+def test_a_successful_probe_closes_the_breaker(breaker, clock):
+    _trip(breaker)
+    clock.now += 30
+    breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    breaker.allow()
+    breaker.allow()
+
+
+def test_a_failed_probe_reopens_the_breaker(breaker, clock):
+    _trip(breaker)
+    clock.now += 30
+    breaker.allow()
+    breaker.record_failure("timeout")
+    assert breaker.state == OPEN
+    assert breaker.stats()["opens"] == 2
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+
+
+def test_a_lost_probe_is_replaced_after_the_reset_timeout(breaker, clock):
+    _trip(breaker)
+    clock.now += 30
+    breaker.allow()  # never reports back
+    clock.now += 29
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+    clock.now += 1
+    breaker.allow()
+    assert breaker.state == HALF_OPEN
+
+
+def test_retry_policy_only_retries_retryable_errors_within_the_attempts():
+    policy = RetryPolicy(attempts=3, backoff=0.5, max_backoff=4.0, rng=random.Random(0))
+    retryable = FizzyAPIError("503", 503, retryable=True)
+    assert policy.delay(0, FizzyAPIError("404", 404), 10.0) is None
+    assert 0 <= policy.delay(0, retryable, 10.0) <= 0.5
+    assert 0 <= policy.delay(1, retryable, 10.0) <= 1.0
+    assert policy.delay(2, retryable, 10.0) is None
+
+
+def test_retry_policy_honours_retry_after_but_not_past_the_deadline():
+    policy = RetryPolicy(attempts=3, rng=random.Random(0))
+    throttled = FizzyAPIError("429", 429, retryable=True, retry_after=2.0)
+    assert policy.delay(0, throttled, 10.0) == 2.0
+    assert policy.delay(0, throttled, 1.0) is None
+
+
+def test_parse_retry_after_reads_seconds_and_dates():
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after("Thu, 01 Jan 1970 00:00:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
@@ -0,0 +1,85 @@
+import gzip
+import json
+import zlib
+
+import pytest
+
+from xian_tech.json_stream import Inflater, JsonArrayDecoder
+
+ITEMS = [
+    {"id": 1, "title": "Café ☕", "tags": ["a", "b"], "nested": {"x": [1, 2.5, None]}},
+    42,
+    -0.5e3,
+    "a string with ] and , inside",
+    [],
+    {},
+    True,
+    None,
+]
+
+
+def _decode(body: bytes, size: int) -> list:
+    decoder = JsonArrayDecoder()
+    items = []
+    for start in range(0, len(body), size):
+        items.extend(decoder.feed(body[start : start + size]))
+    return items + decoder.close()
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64, 10_000])
+def test_any_chunking_decodes_like_json_loads(size):
+    body = json.dumps(ITEMS, ensure_ascii=False, indent=1).encode("utf-8")
+    assert _decode(body, size) == ITEMS
+
+
+def test_elements_are_returned_as_soon_as_they_are_complete():
+    decoder = JsonArrayDecoder()
+    assert decoder.feed(b'[{"a": 1}, {"b"') == [{"a": 1}]
+    assert decoder.feed(b': 2}, 1') == [{"b": 2}]
+    assert decoder.feed(b"2") == []  # the number may go on
+    assert decoder.feed(b"]") == [12]
+    assert decoder.close() == []
+
+
+def test_empty_bodies_and_arrays_decode_to_nothing():
+    assert _decode(b"", 4) == []
+    assert _decode(b"  [ ]  ", 1) == []
+
+
+@pytest.mark.parametrize(
+    "body",
+    [b'{"a": 1}', b"[1, 2", b"[1 2]", b"[1,]", b"[1] [2]", b'[{"a": }]', b"[,1]"],
+)
+def test_malformed_bodies_raise_value_error(body):
+    with pytest.raises(ValueError):
+        _decode(body, 3)
+
+
+def test_a_large_element_split_into_many_chunks_is_decoded_once():
+    item = {"body": "x" * 200_000}
+    body = json.dumps([item, item]).encode("utf-8")
+    assert _decode(body, 1_000) == [item, item]
+
+
+@pytest.mark.parametrize(
+    "encoding, compress",
+    [
+        ("gzip", gzip.compress),
+        ("deflate", zlib.compress),
+        ("deflate", lambda data: zlib.compress(data)[2:-4]),  # raw deflate
+        (None, lambda data: data),
+    ],
+)
+def test_inflater_undoes_content_encoding_in_chunks(encoding, compress):
+    body = json.dumps(ITEMS).encode("utf-8")
+    encoded = compress(body)
+    inflater = Inflater(encoding)
+    decoded = b"".join(inflater.decompress(encoded[i : i + 5]) for i in range(0, len(encoded), 5))
+    assert decoded + inflater.flush() == body
+
+
+def test_inflater_rejects_truncated_bodies():
+    inflater = Inflater("gzip")
+    inflater.decompress(gzip.compress(b"[1, 2, 3]")[:-4])
+    with pytest.raises(ValueError):
+        inflater.flush()
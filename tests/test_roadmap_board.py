@@ -0,0 +1,236 @@
+import random
+from typing import Any
+
+import pytest
+
+from xian_tech.roadmap_board import board_cards, normalize_board, slim_card
+
+COLUMN_NAME_OVERRIDES = {
+    "specification": "Design",
+    "working on": "Execute",
+    "testing": "Validate",
+}
+
+
+def legacy_build_board(board_id, excluded_tags, columns, open_cards, closed_cards):
+    """``build_board`` as it was before ``normalize_board``, kept as the reference."""
+
+    def normalize_id(value: Any) -> str:
+        return str(value).strip()
+
+    def is_done_column(name: str) -> bool:
+        normalized = name.strip().lower()
+        done_keywords = (
+            "done",
+            "complete",
+            "completed",
+            "finished",
+            "shipped",
+            "released",
+        )
+        return any(keyword in normalized for keyword in done_keywords)
+
+    columns = [col for col in columns if isinstance(col, dict)]
+    open_cards = [card for card in open_cards if isinstance(card, dict)]
+    closed_cards = [card for card in closed_cards if isinstance(card, dict)]
+    board_id_value = str(board_id)
+
+    def is_same_board(card: dict[str, Any]) -> bool:
+        board = card.get("board") or {}
+        if board.get("id") is not None:
+            return str(board.get("id")) == board_id_value
+        if card.get("board_id") is not None:
+            return str(card.get("board_id")) == board_id_value
+        return True
+
+    open_cards = [card for card in open_cards if is_same_board(card)]
+    closed_cards = [card for card in closed_cards if is_same_board(card)]
+
+    columns_sorted = sorted(
+        columns,
+        key=lambda col: (col.get("position") is None, col.get("position") or 0),
+    )
+    done_column_ids = {
+        normalize_id(col.get("id", ""))
+        for col in columns_sorted
+        if is_done_column(col.get("name", ""))
+    }
+    cards_by_column: dict[str, list[dict[str, Any]]] = {
+        normalize_id(col.get("id", "")): []
+        for col in columns_sorted
+        if normalize_id(col.get("id", "")) not in done_column_ids
+    }
+    untriaged: list[dict[str, Any]] = []
+    done_cards: list[dict[str, Any]] = []
+    done_card_ids: set[str] = set()
+
+    def extract_tags(raw_tags: Any) -> list[str]:
+        if not raw_tags:
+            return []
+        if isinstance(raw_tags, list):
+            if raw_tags and isinstance(raw_tags[0], dict):
+                return [
+                    str(tag.get("name", "")).strip()
+                    for tag in raw_tags
+                    if tag.get("name")
+                ]
+            return [str(tag).strip() for tag in raw_tags if str(tag).strip()]
+        return [str(raw_tags).strip()]
+
+    def is_excluded(card: dict[str, Any]) -> bool:
+        if not excluded_tags:
+            return False
+        tags = [tag.lower() for tag in extract_tags(card.get("tags"))]
+        return any(tag in excluded_tags for tag in tags)
+
+    if excluded_tags:
+        open_cards = [card for card in open_cards if not is_excluded(card)]
+        closed_cards = [card for card in closed_cards if not is_excluded(card)]
+
+    def build_raw_card_payload(data: dict[str, Any]) -> dict[str, Any]:
+        tags = extract_tags(data.get("tags"))
+        return {
+            "id": data.get("id", ""),
+            "number": data.get("number", 0),
+            "title": data.get("title", ""),
+            "status": data.get("status", ""),
+            "url": data.get("url", ""),
+            "tags": tags,
+            "tags_text": ", ".join(tags),
+            "golden": bool(data.get("golden", False)),
+            "closed": bool(data.get("closed", False)),
+        }
+
+    def add_done_payload(payload: dict[str, Any]) -> None:
+        card_id = str(payload.get("id", ""))
+        if not card_id or card_id in done_card_ids:
+            return
+        done_cards.append(payload)
+        done_card_ids.add(card_id)
+
+    for card in open_cards:
+        column_id = None
+        column = card.get("column") or {}
+        if card.get("column_id") is not None:
+            column_id = normalize_id(card.get("column_id"))
+        elif column.get("id") is not None:
+            column_id = normalize_id(column.get("id"))
+
+        card_payload = build_raw_card_payload(card)
+        if column_id in done_column_ids or card_payload.get("closed"):
+            add_done_payload(card_payload)
+            continue
+        if column_id and column_id in cards_by_column:
+            cards_by_column[column_id].append(card_payload)
+        else:
+            untriaged.append(card_payload)
+
+    for column_id, items in cards_by_column.items():
+        items.sort(key=lambda item: item["number"])
+
+    for card in closed_cards:
+        add_done_payload(build_raw_card_payload(card))
+
+    done_payload = sorted(done_cards, key=lambda item: item["number"])
+
+    columns_payload = []
+    for col in columns_sorted:
+        col_id = normalize_id(col.get("id", ""))
+        if col_id in done_column_ids:
+            continue
+        normalized = str(col.get("name", "")).strip().lower()
+        columns_payload.append(
+            {
+                "id": col.get("id", ""),
+                "name": COLUMN_NAME_OVERRIDES.get(normalized, col.get("name", "")),
+                "cards": cards_by_column.get(col_id, []),
+                "count": len(cards_by_column.get(col_id, [])),
+            }
+        )
+
+    untriaged_sorted = sorted(untriaged, key=lambda item: item["number"])
+    columns_payload.insert(
+        0,
+        {
+            "id": "untriaged",
+            "name": "Investigate",
+            "cards": untriaged_sorted,
+            "count": len(untriaged_sorted),
+        },
+    )
+
+    return columns_payload, done_payload
+
+
+def _random_card(rng: random.Random, index: int) -> Any:
+    card: dict[str, Any] = {
+        "id": rng.choice([str(index), index, "", None, str(index % 50)]),
+        "number": rng.randint(1, 300),
+        "title": f"Card {index}",
+        "status": "published",
+        "url": f"/cards/{index}",
+        "golden": rng.random() < 0.1,
+        "closed": rng.random() < 0.15,
+    }
+    roll = rng.random()
+    if roll < 0.3:
+        card["column"] = {"id": rng.choice(["a", "b", "d", "x", " a "])}
+    elif roll < 0.5:
+        card["column_id"] = rng.choice(["a", "b", "d", 7, None])
+    elif roll < 0.6:
+        card["column"] = None
+    roll = rng.random()
+    if roll < 0.3:
+        card["tags"] = [
+            {"name": rng.choice(["Internal", "ui", "", None, " core "])}
+            for _ in range(rng.randint(1, 3))
+        ]
+    elif roll < 0.5:
+        card["tags"] = [rng.choice(["internal", "x", "", " y "]) for _ in range(rng.randint(0, 3))]
+    elif roll < 0.55:
+        card["tags"] = "Solo"
+    roll = rng.random()
+    if roll < 0.1:
+        card["board"] = {"id": "other"}
+    elif roll < 0.2:
+        card["board"] = {"id": "B"}
+    elif roll < 0.25:
+        card["board_id"] = "other"
+    elif roll < 0.3:
+        card["board"] = {}
+    return card
+
+
+def _random_board(seed: int) -> tuple[list[Any], list[Any], list[Any]]:
+    rng = random.Random(seed)
+    columns: list[Any] = [
+        {
+            "id": rng.choice(["a", "b", "d", "e", 7]),
+            "name": rng.choice(["Working on", "Done", "Testing", "Specification", "Released stuff", "Misc"]),
+            "position": rng.choice([None, 1, 2, 3, 0]),
+        }
+        for _ in range(rng.randint(0, 5))
+    ]
+    columns.append("junk")
+    open_cards = [_random_card(rng, index) for index in range(rng.randint(0, 60))] + ["junk"]
+    closed_cards = [_random_card(rng, index + 1000) for index in range(rng.randint(0, 30))]
+    return columns, open_cards, closed_cards
+
+
+@pytest.mark.parametrize("excluded_tags", [frozenset(), frozenset({"internal", "core"})])
+@pytest.mark.parametrize("seed", range(150))
+def test_normalize_board_matches_the_legacy_build_board(seed, excluded_tags):
+    board = _random_board(seed)
+    assert normalize_board("B", excluded_tags, *board) == legacy_build_board("B", excluded_tags, *board)
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_slimmed_cards_normalize_like_raw_cards(seed):
+    columns, open_cards, closed_cards = _random_board(seed)
+    excluded_tags = frozenset({"internal"})
+    slimmed = [
+        [slim_card(card) for card in board_cards(cards, "B")] for cards in (open_cards, closed_cards)
+    ]
+    assert normalize_board("B", excluded_tags, columns, *slimmed) == normalize_board(
+        "B", excluded_tags, columns, open_cards, closed_cards
+    )
@@ -0,0 +1,262 @@
+import asyncio
+import contextlib
+import hashlib
+import hmac
+import json
+from types import SimpleNamespace
+
+import httpx
+import pytest
+import reflex as rx
+from reflex.istate.data import ReflexURL, RouterData
+from reflex.utils import prerequisites
+from starlette.testclient import TestClient
+
+from benchmarks.fake_fizzy import FakeFizzy
+from xian_tech import roadmap_webhook
+from xian_tech.roadmap import BoardConfig, BoardMirror, RoadmapCache, board_config
+from xian_tech.roadmap_webhook import (
+    SIGNATURE_HEADER,
+    STATUS_PATH,
+    WEBHOOK_PATH,
+    board_change,
+    broadcast_roadmap,
+    verify_signature,
+    webhook_api,
+)
+from xian_tech.state import State
+
+SECRET = "webhook-secret"
+CONFIG = BoardConfig("https://fizzy.example", "acct", "token", "board", frozenset())
+
+
+def _sign(body: bytes, secret: str = SECRET) -> str:
+    return hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+
+
+def test_verify_signature_accepts_hex_with_or_without_prefix():
+    body = b'{"id": "evt"}'
+    assert verify_signature(SECRET, body, _sign(body))
+    assert verify_signature(SECRET, body, "sha256=" + _sign(body).upper())
+    assert not verify_signature(SECRET, body, _sign(body, "other"))
+    assert not verify_signature(SECRET, body + b" ", _sign(body))
+    assert not verify_signature(SECRET, body, "")
+
+
+@pytest.fixture
+def patches(monkeypatch):
+    monkeypatch.setenv("FIZZY_WEBHOOK_SECRET", SECRET)
+    monkeypatch.setattr(roadmap_webhook, "_SEEN_EVENTS", type(roadmap_webhook._SEEN_EVENTS)(maxlen=10))
+    changes = []
+
+    async def patch(change):
+        changes.append(change)
+        return None
+
+    monkeypatch.setattr(roadmap_webhook.ROADMAP_CACHE, "patch", patch)
+    return changes
+
+
+def _post(client, event, signature=None):
+    body = json.dumps(event).encode("utf-8")
+    headers = {SIGNATURE_HEADER: _sign(body) if signature is None else signature}
+    return client.post(WEBHOOK_PATH, content=body, headers=headers)
+
+
+def test_requests_without_a_valid_signature_are_rejected(patches):
+    client = TestClient(webhook_api())
+    event = {"id": "evt-1", "action": "card_closed", "eventable": {"id": "c1"}}
+    assert _post(client, event, signature="0" * 64).status_code == 401
+    assert _post(client, event, signature="").status_code == 401
+    assert patches == []
+
+
+def test_the_receiver_is_off_without_a_secret(patches, monkeypatch):
+    monkeypatch.delenv("FIZZY_WEBHOOK_SECRET")
+    assert _post(TestClient(webhook_api()), {"id": "evt-1"}).status_code == 503
+
+
+def test_oversized_bodies_are_rejected(patches, monkeypatch):
+    monkeypatch.setattr(roadmap_webhook, "MAX_BODY_BYTES", 64)
+    client = TestClient(webhook_api())
+    event = {"id": "evt-1", "action": "card_closed", "eventable": {"id": "c" * 100}}
+    assert _post(client, event).status_code == 413
+
+    def chunks():  # no Content-Length, so the limit applies while reading
+        yield b'{"id": "evt-1", '
+        yield b'"padding": "' + b"x" * 100 + b'"}'
+
+    response = client.post(WEBHOOK_PATH, content=chunks(), headers={SIGNATURE_HEADER: "0" * 64})
+    assert response.status_code == 413
+    assert patches == []
+
+
+def test_redelivered_events_are_applied_once(patches):
+    client = TestClient(webhook_api())
+    event = {"id": "evt-1", "action": "card_closed", "eventable": {"id": "c1"}}
+    assert _post(client, event).json() == {"applied": False}
+    assert _post(client, event).json() == {"applied": False, "duplicate": True}
+    assert len(patches) == 1
+
+
+def test_concurrent_redeliveries_are_applied_once(patches, monkeypatch):
+    async def slow_patch(change):
+        patches.append(change)
+        await asyncio.sleep(0.05)
+
+    monkeypatch.setattr(roadmap_webhook.ROADMAP_CACHE, "patch", slow_patch)
+    body = json.dumps({"id": "evt-1", "action": "card_closed", "eventable": {"id": "c1"}}).encode("utf-8")
+
+    async def run():
+        transport = httpx.ASGITransport(app=webhook_api())
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            headers = {SIGNATURE_HEADER: _sign(body)}
+            return await asyncio.gather(
+                *(client.post(WEBHOOK_PATH, content=body, headers=headers) for _ in range(2))
+            )
+
+    responses = asyncio.run(run())
+    assert sorted("duplicate" in response.json() for response in responses) == [False, True]
+    assert len(patches) == 1
+
+
+def test_a_failed_patch_lets_the_redelivery_through(patches, monkeypatch):
+    async def failing_patch(change):
+        patches.append(change)
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(roadmap_webhook.ROADMAP_CACHE, "patch", failing_patch)
+    client = TestClient(webhook_api())
+    event = {"id": "evt-1", "action": "card_closed", "eventable": {"id": "c1"}}
+    with pytest.raises(RuntimeError):
+        _post(client, event)
+    with pytest.raises(RuntimeError):
+        _post(client, event)
+    assert len(patches) == 2
+
+
+def test_events_without_a_board_change_are_acknowledged(patches):
+    response = _post(TestClient(webhook_api()), {"id": "evt-2", "action": "comment_created"})
+    assert response.status_code == 202
+    assert patches == []
+
+
+def test_the_status_endpoint_needs_the_status_token(monkeypatch):
+    client = TestClient(webhook_api())
+    monkeypatch.delenv("FIZZY_STATUS_TOKEN", raising=False)
+    assert client.get(STATUS_PATH).status_code == 503
+    monkeypatch.setenv("FIZZY_STATUS_TOKEN", "status-token")
+    assert client.get(STATUS_PATH).status_code == 401
+    assert client.get(STATUS_PATH, headers={"Authorization": "Bearer wrong"}).status_code == 401
+    response = client.get(STATUS_PATH, headers={"Authorization": "Bearer status-token"})
+    assert response.status_code == 200
+    assert "roadmap" in response.json()
+
+
+def _mirror():
+    mirror = BoardMirror(CONFIG)
+    mirror.reset(
+        [{"id": "col", "name": "Working on"}],
+        [{"id": "c1", "number": 1, "title": "Card", "closed": False}],
+        [],
+    )
+    return mirror
+
+
+def test_card_events_patch_the_mirror():
+    mirror = _mirror()
+    assert board_change({"action": "card_closed", "eventable": {"id": "c1"}})(mirror)
+    assert "c1" in mirror.closed
+    assert board_change({"action": "card_reopened", "eventable": {"id": "c1"}})(mirror)
+    assert "c1" in mirror.open
+    assert board_change({"action": "card_deleted", "eventable": {"id": "c1"}})(mirror)
+    assert not mirror.open and not mirror.closed
+
+
+def test_events_for_other_boards_are_ignored():
+    event = {"action": "card_closed", "eventable": {"id": "c1"}, "board": {"id": "elsewhere"}}
+    mirror = _mirror()
+    assert not board_change(event)(mirror)
+    assert "c1" in mirror.open
+
+
+def test_column_events_patch_the_columns():
+    mirror = _mirror()
+    rename = {"action": "column_updated", "eventable": {"id": "col", "name": "Doing"}}
+    assert board_change(rename)(mirror)
+    assert mirror.columns == [{"id": "col", "name": "Doing"}]
+    assert board_change({"action": "column_deleted", "eventable": {"id": "col"}})(mirror)
+    assert mirror.columns == []
+
+
+def test_events_without_an_eventable_are_not_changes():
+    assert board_change({"action": "card_closed"}) is None
+    assert board_change({"action": "card_closed", "eventable_type": "Comment", "eventable": {}}) is None
+
+
+@pytest.fixture
+def session(monkeypatch):
+    """One connected session showing ``/roadmap``, reachable through a stand-in app."""
+    root = rx.State(_reflex_internal_init=True)
+    state = root.get_substate(State.get_full_name().split(".")[1:])
+    state.router = RouterData(url=ReflexURL("http://localhost:3000/roadmap"))
+
+    @contextlib.asynccontextmanager
+    async def modify_state(key):
+        yield root
+
+    namespace = SimpleNamespace(token_to_sid={"token": "sid"})
+    app = SimpleNamespace(event_namespace=namespace, modify_state=modify_state)
+    monkeypatch.setattr(prerequisites, "get_app", lambda: SimpleNamespace(app=app))
+    monkeypatch.setattr(roadmap_webhook, "ROADMAP_SUBSCRIBERS", {"token"})
+    return state
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    monkeypatch.setenv("FIZZY_CACHE_DIR", "none")
+    monkeypatch.setenv("no_proxy", "127.0.0.1,localhost")
+    with FakeFizzy(200, page_size=20, latency=0.01) as fake:
+        for name, value in fake.env().items():
+            monkeypatch.setenv(name, value)
+        cache = RoadmapCache(snapshot_path=None)
+        cache.on_refresh = broadcast_roadmap
+        monkeypatch.setattr(roadmap_webhook, "ROADMAP_CACHE", cache)
+        # A snapshot restored after a restart: stale, and no mirror yet.
+        cache._config = board_config()
+        cache._snapshot = {"columns": [], "done": [], "fetched_at": 0.0}
+        yield cache, fake
+
+
+def test_a_background_refresh_is_pushed_to_connected_sessions(session, cache):
+    cache, _ = cache
+    session._show_roadmap_snapshot(cache.snapshot, True)
+
+    async def run():
+        stale = await cache.get()
+        await cache._refresh_task
+        return stale
+
+    assert asyncio.run(run())["columns"] == []
+    assert session.roadmap_columns == cache.snapshot["columns"] != []
+    assert not session.roadmap_stale
+
+
+def test_changes_pushed_during_the_first_load_reach_connected_sessions(session, cache):
+    cache, fake = cache
+    card_id = next(card_id for card_id, card in fake.cards.items() if not card["closed"])
+    closed = board_change({"action": "card_closed", "eventable": {"id": card_id}})
+
+    async def run():
+        await cache.get()
+        refresh = cache._refresh_task
+        while cache._loading_mirror is None:
+            await asyncio.sleep(0.001)
+        assert await cache.patch(closed) is None  # queued for the running load
+        await refresh
+
+    asyncio.run(run())
+    shown = [card["id"] for column in session.roadmap_columns for card in column["cards"]]
+    assert shown and card_id not in shown
+    assert session.roadmap_done_count == len(cache.snapshot["done"])
+    assert card_id in {card["id"] for card in cache.snapshot["done"]}
@@ -0,0 +1,110 @@
+from xian_tech.search import SearchIndex, _edit_distance, entry_term_scores
+
+
+def _entry(title, subtitle="", keywords=(), body="", category="Docs"):
+    return {
+        "title": title,
+        "subtitle": subtitle,
+        "category": category,
+        "keywords": list(keywords),
+        "body": body,
+    }
+
+
+ENTRIES = [
+    _entry("Consensus", "CometBFT validators", body="blocks are final"),
+    _entry("Contracting", "Python smart contracts", keywords=["consensus"]),
+    _entry("Tooling", "Wallets and explorers", body="consensus consensus"),
+    _entry("Node setup", "Run a validator node", keywords=["validator"]),
+]
+
+
+def _titles(index, query, **kwargs):
+    return [index.entries[entry_id]["title"] for entry_id in index.search(query, **kwargs)]
+
+
+def test_title_outweighs_keywords_and_body():
+    assert _titles(SearchIndex(ENTRIES), "consensus") == ["Consensus", "Contracting", "Tooling"]
+
+
+def test_rare_terms_score_higher_than_common_ones():
+    entries = [
+        _entry("Gamma", "ledger staking"),
+        _entry("Delta", "ledger"),
+        _entry("Epsilon", "ledger"),
+    ]
+    scores = entry_term_scores(entries)
+    assert scores[0]["staking"] > scores[0]["ledger"]
+
+
+def test_shorter_fields_score_higher_for_the_same_term():
+    entries = [
+        _entry("Alpha", "staking"),
+        _entry("Beta", "staking rewards for delegators on every block"),
+    ]
+    scores = entry_term_scores(entries)
+    assert scores[0]["staking"] > scores[1]["staking"]
+
+
+def test_every_token_must_prefix_an_entry_token():
+    index = SearchIndex(ENTRIES)
+    assert _titles(index, "val") == ["Node setup", "Consensus"]
+    assert _titles(index, "valid node") == ["Node setup"]
+    assert _titles(index, "valid wallets") == []
+
+
+def test_prefixes_score_below_whole_tokens():
+    index = SearchIndex(ENTRIES)
+    whole = index._scores["consensus"][0]
+    prefix = index._scores["cons"][0]
+    assert prefix < whole
+
+
+def test_empty_query_returns_every_entry_in_order():
+    index = SearchIndex(ENTRIES)
+    assert index.search("  ") == [0, 1, 2, 3]
+    assert index.search("", candidates=[3, 1]) == [3, 1]
+
+
+def test_candidates_restrict_the_results():
+    index = SearchIndex(ENTRIES)
+    assert _titles(index, "consensus", candidates=[1, 2, 3]) == ["Contracting", "Tooling"]
+
+
+def test_edit_distance_counts_transpositions_as_one_edit():
+    assert _edit_distance("concensus", "consensus", 2) == 1
+    assert _edit_distance("conesnsus", "consensus", 2) == 1
+    assert _edit_distance("abcdef", "zyxwvu", 2) == 3
+
+
+def test_edit_distance_also_matches_a_term_prefix():
+    # A half-typed word with a typo still matches the longer term.
+    assert _edit_distance("valid", "validator", 1) == 0
+    assert _edit_distance("valud", "validator", 1) == 1
+
+
+def test_misspelled_tokens_are_corrected():
+    index = SearchIndex(ENTRIES)
+    assert index.corrections("consensys") == [("consensus", 1)]
+    assert _titles(index, "consensys") == ["Consensus", "Contracting", "Tooling"]
+    assert _titles(index, "walets") == ["Tooling"]
+
+
+def test_only_the_closest_corrections_are_kept():
+    index = SearchIndex([_entry("Validator"), _entry("Valuation")])
+    assert [term for term, _ in index.corrections("validatr")] == ["validator"]
+
+
+def test_corrected_matches_score_below_exact_ones():
+    index = SearchIndex([_entry("Staking"), _entry("Stacking")])
+    assert _titles(index, "stacking") == ["Stacking"]
+    exact = index.search("staking")
+    assert exact == [0]
+    assert index._corrected_table("stakinng")[1][0] < index._scores["staking"][0]
+
+
+def test_short_tokens_are_not_corrected():
+    index = SearchIndex(ENTRIES)
+    assert index.corrections("nxd") == []
+    assert _titles(index, "nxd") == []
+    assert _titles(index, "nxde") == ["Node setup"]
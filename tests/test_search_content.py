@@ -0,0 +1,20 @@
+from xian_tech.search_content import PACKAGE_DIR, _module_sources
+
+
+def _relative(paths):
+    return {str(path.relative_to(PACKAGE_DIR)) for path in paths}
+
+
+def test_page_sources_follow_imports_transitively():
+    sources = _relative(_module_sources("xian_tech.pages.about"))
+
+    # about.py imports components.common, which imports state, which imports state.app.
+    assert {"pages/about.py", "components/common.py", "theme.py", "state/__init__.py", "state/app.py"} <= sources
+
+
+def test_page_sources_skip_function_level_imports():
+    sources = _relative(_module_sources("xian_tech.search_content"))
+
+    # ``build_content_index`` imports the app lazily; that must not pull in every page.
+    assert "xian_tech.py" not in sources
+    assert not any(source.startswith("pages/") for source in sources)
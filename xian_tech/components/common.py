@@ -1,3 +1,4 @@
+import json
 import re
 from hashlib import md5
 from typing import Any, Optional, TypedDict
@@ -5,6 +6,7 @@ from typing import Any, Optional, TypedDict
 import reflex as rx
 
 from ..data import NAV_LINKS
+from ..search_assets import client_index_url
 from ..state import State
 from ..theme import (
     ACCENT,
@@ -27,6 +29,12 @@ MD_MEDIA = "@media (min-width: 1024px)"
 NAV_DROPDOWN_LABELS = [link["label"] for link in NAV_LINKS if link.get("children")]
 HEADER_CONTROL_HEIGHT = "2.6rem"
 HEADER_CONTROL_RADIUS = "12px"
+# Palette entry fields a row renders; state only carries entry ids.
+PALETTE_ROW_FIELDS = ("title", "subtitle", "badge", "href", "external")
+_PALETTE_ENTRIES_JS = "xianPaletteEntries"
+_PALETTE_CATEGORIES_JS = "xianPaletteCategories"
+_PALETTE_ENTRIES = rx.Var(_PALETTE_ENTRIES_JS).to(list[dict[str, Any]])
+_PALETTE_CATEGORIES = rx.Var(_PALETTE_CATEGORIES_JS).to(list[str])
 
 
 class SectionActionLink(TypedDict, total=False):
@@ -1332,10 +1340,24 @@ def feature_card(title: str, description: str, icon: str) -> rx.Component:
 
 
 
+class _PaletteEntries(rx.Fragment):
+    """Declares the palette entries and categories once as JS constants in the compiled module."""
+
+    def add_custom_code(self) -> list[str]:
+        from ..search import SEARCH_CATEGORIES, SEARCH_ENTRIES
+
+        entries = [{field: entry[field] for field in PALETTE_ROW_FIELDS} for entry in SEARCH_ENTRIES]
+        return [
+            f"const {_PALETTE_ENTRIES_JS} = {json.dumps(entries)};",
+            f"const {_PALETTE_CATEGORIES_JS} = {json.dumps(list(SEARCH_CATEGORIES))};",
+        ]
+
+
 def command_palette() -> rx.Component:
     """Global command palette with CMD/CTRL + K shortcut."""
 
-    def action_row(action: dict[str, Any]) -> rx.Component:
+    def action_row(entry_id: rx.Var) -> rx.Component:
+        action = _PALETTE_ENTRIES[entry_id].to(dict[str, Any])
         arrow = rx.cond(
             action["external"],
             rx.icon(tag="arrow_up_right", size=18, color=TEXT_MUTED),
@@ -1347,7 +1369,7 @@ def command_palette() -> rx.Component:
             height="22px",
             flex_shrink="0",
         )
-        is_active = action["id"] == State.command_palette_active_id
+        is_active = entry_id == State.command_palette_active_index
 
         return rx.link(
             rx.hstack(
@@ -1392,7 +1414,7 @@ def command_palette() -> rx.Component:
             href=action["href"],
             is_external=action["external"],
             on_click=State.close_command_palette,
-            on_mouse_enter=State.set_command_palette_selection(action["id"]),
+            on_mouse_enter=State.set_command_palette_selection(entry_id),
             padding="0.85rem 1rem",
             border_radius="12px",
             border=f"1px solid {BORDER_COLOR}",
@@ -1407,10 +1429,10 @@ def command_palette() -> rx.Component:
             width="100%",
         )
 
-    def palette_list_entry(entry: dict[str, Any]) -> rx.Component:
+    def palette_list_entry(row: rx.Var) -> rx.Component:
         header = rx.box(
             rx.text(
-                entry["category"],
+                _PALETTE_CATEGORIES[-1 - row],
                 size="2",
                 color=TEXT_MUTED,
                 text_transform="uppercase",
@@ -1420,9 +1442,9 @@ def command_palette() -> rx.Component:
         )
 
         return rx.cond(
-            entry["type"] == "header",
+            row < 0,
             header,
-            action_row(entry),
+            action_row(row),
         )
 
     return rx.fragment(
@@ -1462,8 +1484,11 @@ def command_palette() -> rx.Component:
                                     ),
                                     side="right",
                                 ),
-                                value=State.command_query,
+                                # Uncontrolled so the client-side matcher in command-palette.js
+                                # can own the query once the static index has loaded.
+                                default_value=State.command_query,
                                 on_change=State.set_command_query,
+                                id="command-palette-input",
                                 placeholder='Try "deterministic python", "research guild", or "foundation contact"',
                                 auto_focus=True,
                                 width="100%",
@@ -1493,26 +1518,36 @@ def command_palette() -> rx.Component:
                                 },
                             ),
                             rx.box(
-                                rx.cond(
-                                    State.command_palette_empty,
-                                    rx.flex(
-                                        rx.text("No matches found.", size="2", color=TEXT_MUTED),
-                                        align="center",
-                                        justify="center",
-                                        height="100%",
-                                        width="100%",
-                                    ),
-                                    rx.vstack(
-                                        rx.foreach(
-                                            State.command_palette_sections,
-                                            lambda entry: palette_list_entry(entry),
+                                rx.box(
+                                    rx.cond(
+                                        State.command_palette_empty,
+                                        rx.flex(
+                                            rx.text("No matches found.", size="2", color=TEXT_MUTED),
+                                            align="center",
+                                            justify="center",
+                                            height="100%",
+                                            width="100%",
+                                        ),
+                                        rx.vstack(
+                                            _PaletteEntries.create(),
+                                            rx.foreach(
+                                                State.command_palette_layout,
+                                                lambda row: palette_list_entry(row),
+                                            ),
+                                            spacing="2",
+                                            width="100%",
+                                            padding_right="0.5rem",
+                                            padding_bottom="0.5rem",
                                         ),
-                                        spacing="2",
-                                        width="100%",
-                                        padding_right="0.5rem",
-                                        padding_bottom="0.5rem",
                                     ),
+                                    class_name="command-palette-server-results",
+                                ),
+                                rx.box(
+                                    id="command-palette-client-results",
+                                    class_name="command-palette-client-results",
                                 ),
+                                id="command-palette-results",
+                                custom_attrs={"data-index-src": client_index_url()},
                                 width="100%",
                                 max_height="360px",
                                 overflow_y="auto",
@@ -1798,6 +1833,7 @@ def page_layout(*children: rx.Component) -> rx.Component:
             nav_bar(),
             rx.box(
                 *children,
+                id="page-content",
                 min_height="calc(100vh - 200px)",
                 padding_bottom="2rem",
             ),
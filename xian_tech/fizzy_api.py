@@ -1,13 +1,59 @@
 """Lightweight Fizzy API helper (no client dependency)."""
 from __future__ import annotations
 
+import gzip
+import hashlib
+import http.client
 import json
+import os
+import queue
 import re
+import ssl
+import threading
+import time
+import zlib
 
-from typing import Any
-from urllib.error import HTTPError, URLError
-from urllib.parse import urlencode
-from urllib.request import Request, urlopen
+from collections import OrderedDict
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, TypeVar
+from urllib.parse import urlencode, urljoin, urlsplit
+from urllib.request import getproxies, proxy_bypass
+
+from .fileio import atomic_write_bytes
+from .fizzy_retry import (
+    OPEN,
+    RETRYABLE_STATUSES,
+    CircuitBreaker,
+    CircuitOpenError,
+    FizzyAPIError,
+    RetryPolicy,
+    env_number,
+    get_breaker,
+    parse_retry_after,
+)
+from .json_stream import Inflater, JsonArrayDecoder
+
+DEFAULT_POOL_SIZE = 4
+# Seconds one attempt may take, and all attempts of a call together.
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_DEADLINE = 20.0
+MAX_REDIRECTS = 5
+RESPONSE_CACHE_VERSION = 2
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent / "build" / "fizzy"
+DEFAULT_CACHE_ENTRIES = 2_000
+STREAM_CHUNK_SIZE = 64 * 1024
+# Response headers callers read from cached responses (pagination).
+_CACHED_HEADERS = ("Link",)
+_REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+T = TypeVar("T")
 
 
 def _build_url(base_url: str, account_slug: str, path: str) -> str:
@@ -30,6 +76,675 @@ def _parse_link_next(link_header: str | None) -> str:
     return match.group(1) if match else ""
 
 
+def _decode_body(body: bytes, encoding: str | None) -> bytes:
+    encoding = (encoding or "").strip().lower()
+    if not body:
+        return body
+    if encoding in ("gzip", "x-gzip"):
+        return gzip.decompress(body)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    return body
+
+
+# Maps a batch of decoded items of a streamed page to the items to keep.
+PageTransform = Callable[[list[Any]], Iterable[Any]]
+
+
+def _dict_items(items: list[Any]) -> list[dict[str, Any]]:
+    return [item for item in items if isinstance(item, dict)]
+
+
+class StreamedPage:
+    """Body of one streamed page: a JSON array decoded as its chunks arrive.
+
+    Each batch of decoded items goes through ``transform`` straight away, so
+    only the kept items and the unparsed tail of the body are held.
+    """
+
+    def __init__(self, transform: PageTransform):
+        self.transform = transform
+        self.items: list[Any] = []
+        self.bytes_received = 0
+        self._inflater = Inflater(None)
+        self._decoder = JsonArrayDecoder()
+
+    def begin(self, encoding: str | None) -> None:
+        self._inflater = Inflater(encoding)
+
+    def feed(self, chunk: bytes) -> None:
+        self.bytes_received += len(chunk)
+        self.items.extend(self.transform(self._decoder.feed(self._inflater.decompress(chunk))))
+
+    def finish(self) -> None:
+        tail = self._decoder.feed(self._inflater.flush()) + self._decoder.close()
+        self.items.extend(self.transform(tail))
+
+
+class CachedResponse(NamedTuple):
+    etag: str
+    last_modified: str
+    headers: dict[str, str]
+    payload: Any
+
+
+class ResponseCache:
+    """Validators and parsed payloads of cacheable Fizzy responses, by token and URL.
+
+    Entries live in memory and, unless ``directory`` is ``None``, in one JSON
+    file per URL under a subdirectory named by a hash of the token, so
+    revalidation survives restarts and tokens never share entries. Both hold
+    at most ``max_entries``; the least recently used entries go first. Files
+    are only readable by the owner.
+    """
+
+    def __init__(self, directory: Path | None, token: str, max_entries: int = DEFAULT_CACHE_ENTRIES):
+        self.identity = hashlib.sha256(f"fizzy-token\n{token}".encode("utf-8")).hexdigest()[:32]
+        self.directory = None if directory is None else directory / self.identity
+        self.max_entries = max(1, max_entries)
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._files: int | None = None
+        self._lock = threading.Lock()
+
+    def _path(self, url: str) -> Path | None:
+        if self.directory is None:
+            return None
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def _remember(self, url: str, entry: CachedResponse) -> None:
+        with self._lock:
+            self._entries[url] = entry
+            self._entries.move_to_end(url)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def peek(self, url: str) -> CachedResponse | None:
+        """The entry held in memory, without touching the disk."""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+            return entry
+
+    def get(self, url: str) -> CachedResponse | None:
+        entry = self.peek(url)
+        if entry is not None:
+            return entry
+        path = self._path(url)
+        if path is None:
+            return None
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if (
+            data.get("version") != RESPONSE_CACHE_VERSION
+            or data.get("identity") != self.identity
+            or data.get("url") != url
+        ):
+            return None
+        entry = CachedResponse(data["etag"], data["last_modified"], data["headers"], data["payload"])
+        self._remember(url, entry)
+        return entry
+
+    def put(self, url: str, entry: CachedResponse, body: bytes) -> None:
+        """Remember ``entry``; ``body`` is the raw JSON already parsed into its payload."""
+        self._remember(url, entry)
+        path = self._path(url)
+        if path is None:
+            return
+        meta = json.dumps(
+            {
+                "version": RESPONSE_CACHE_VERSION,
+                "identity": self.identity,
+                "url": url,
+                "etag": entry.etag,
+                "last_modified": entry.last_modified,
+                "headers": entry.headers,
+            }
+        )
+        # Splice the raw body in rather than re-serializing the parsed payload.
+        record = meta[:-1].encode("utf-8") + b', "payload": ' + body + b"}"
+        try:
+            is_new = not path.exists()
+            atomic_write_bytes(path, record, mode=0o600)
+        except OSError:
+            return
+        if is_new:
+            self._count_file()
+
+    def _count_file(self) -> None:
+        with self._lock:
+            if self._files is None:
+                self._files = sum(1 for _ in self.directory.glob("*.json"))
+            else:
+                self._files += 1
+            over = self._files > self.max_entries
+        if over:
+            self._prune()
+
+    def _prune(self) -> None:
+        # Drop the least recently written files down to 90% of the limit.
+        files = []
+        for path in self.directory.glob("*.json"):
+            try:
+                files.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+        files.sort()
+        excess = len(files) - self.max_entries * 9 // 10
+        for _, path in files[: max(0, excess)]:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+        with self._lock:
+            self._files = len(files) - max(0, excess)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _env_cache_dir() -> Path | None:
+    value = os.getenv("FIZZY_CACHE_DIR", "").strip()
+    if value.lower() == "none":
+        return None
+    return Path(value) if value else DEFAULT_CACHE_DIR
+
+
+def _env_cache_entries() -> int:
+    try:
+        return max(1, int(os.getenv("FIZZY_CACHE_MAX_ENTRIES", "") or DEFAULT_CACHE_ENTRIES))
+    except ValueError:
+        return DEFAULT_CACHE_ENTRIES
+
+
+def _env_pool_size() -> int:
+    try:
+        return max(1, int(os.getenv("FIZZY_POOL_SIZE", "") or DEFAULT_POOL_SIZE))
+    except ValueError:
+        return DEFAULT_POOL_SIZE
+
+
+class BaseFizzyClient:
+    """Request building and response handling shared by the sync and async clients.
+
+    ``timeout`` bounds one attempt and ``deadline`` a whole call, retries and
+    backoff included; they default to ``FIZZY_TIMEOUT`` and
+    ``FIZZY_DEADLINE``. ``breaker`` defaults to the shared breaker of the
+    host, so the sync and async clients trip it together.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        account_slug: str,
+        token: str,
+        *,
+        pool_size: int | None = None,
+        timeout: float | None = None,
+        deadline: float | None = None,
+        compress: bool = True,
+        cache: ResponseCache | None = None,
+        retry: RetryPolicy | None = None,
+        breaker: CircuitBreaker | None = None,
+    ):
+        self.base_url = base_url
+        self.account_slug = account_slug
+        self.token = token
+        self.pool_size = _env_pool_size() if pool_size is None else max(1, pool_size)
+        self.timeout = env_number("FIZZY_TIMEOUT", DEFAULT_TIMEOUT) if timeout is None else timeout
+        self.deadline = env_number("FIZZY_DEADLINE", DEFAULT_DEADLINE) if deadline is None else deadline
+        self.compress = compress
+        self._ssl_context = ssl.create_default_context()
+        self.cache = cache or ResponseCache(_env_cache_dir(), token, _env_cache_entries())
+        self.retry = retry or RetryPolicy.from_env()
+        self.breaker = breaker or get_breaker(base_url)
+        self.connections_opened = 0
+        self.requests_sent = 0
+        self.bytes_received = 0
+        self.not_modified = 0
+        self.retries = 0
+
+    def _url(self, path: str, params: dict[str, Any] | None) -> str:
+        url = _build_url(self.base_url, self.account_slug, path)
+        if params:
+            url += "?" + urlencode(params, doseq=True)
+        return url
+
+    def _headers(self, cached: CachedResponse | None = None) -> dict[str, str]:
+        headers = {
+            "Authorization": f"Bearer {self.token}",
+            "Accept": "application/json",
+            "User-Agent": "xian-tech/roadmap",
+            "Connection": "keep-alive",
+        }
+        if self.compress:
+            headers["Accept-Encoding"] = "gzip, deflate"
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+        return headers
+
+    @staticmethod
+    def _proxy_for(scheme: str, host: str) -> str:
+        return "" if proxy_bypass(host) else getproxies().get(scheme, "")
+
+    def _call_deadline(self, timeout: float | None) -> float:
+        return time.monotonic() + (self.deadline if timeout is None else timeout)
+
+    def _attempt_timeout(self, url: str, deadline: float) -> float:
+        """Seconds the next attempt may take; raises once ``deadline`` has passed."""
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise FizzyAPIError(f"Fizzy API request timed out: {url}")
+        return min(self.timeout, remaining)
+
+    def _retry_delay(self, attempt: int, error: FizzyAPIError, deadline: float) -> float | None:
+        """Report a failed attempt to the breaker; seconds to wait before the next, or ``None``."""
+        if isinstance(error, CircuitOpenError):
+            return None
+        if error.retryable:
+            self.breaker.record_failure(str(error))
+        else:  # the host answered; the request itself was wrong
+            self.breaker.record_success()
+        if self.breaker.state == OPEN:
+            return None
+        delay = self.retry.delay(attempt, error, deadline - time.monotonic())
+        if delay is not None:
+            self.retries += 1
+        return delay
+
+    def _result(
+        self,
+        url: str,
+        cached: CachedResponse | None,
+        status: int,
+        headers: http.client.HTTPMessage,
+        body: bytes,
+    ) -> tuple[Any, dict[str, str]]:
+        if status == 304 and cached is not None:
+            self.not_modified += 1
+            return cached.payload, dict(cached.headers)
+        if status >= 400:
+            raise FizzyAPIError(
+                f"Fizzy API error {status}: {body.decode('utf-8', errors='ignore')}",
+                status,
+                retryable=status in RETRYABLE_STATUSES,
+                retry_after=parse_retry_after(headers.get("Retry-After")),
+            )
+        payload = json.loads(body) if body else None
+        etag = headers.get("ETag", "")
+        last_modified = headers.get("Last-Modified", "")
+        if status == 200 and body and (etag or last_modified):
+            kept = {name: headers[name] for name in _CACHED_HEADERS if headers.get(name)}
+            self.cache.put(url, CachedResponse(etag, last_modified, kept, payload), body)
+        return payload, dict(headers)
+
+    def _page_result(
+        self,
+        key: str,
+        cached: CachedResponse | None,
+        status: int,
+        headers: http.client.HTTPMessage,
+        body: bytes,
+        page: StreamedPage,
+    ) -> tuple[list[Any], dict[str, str]]:
+        """Like ``_result`` for a streamed page; the cache keeps the transformed items."""
+        if status != 200:
+            data, result_headers = self._result(key, cached, status, headers, body)
+            if status == 304 and cached is not None:
+                return data, result_headers
+            return (list(page.transform(data)) if isinstance(data, list) else []), result_headers
+        etag = headers.get("ETag", "")
+        last_modified = headers.get("Last-Modified", "")
+        if etag or last_modified:
+            kept = {name: headers[name] for name in _CACHED_HEADERS if headers.get(name)}
+            record = json.dumps(page.items, separators=(",", ":")).encode("utf-8")
+            self.cache.put(key, CachedResponse(etag, last_modified, kept, page.items), record)
+        return page.items, dict(headers)
+
+    @staticmethod
+    def _stream_key(url: str, variant: str) -> str:
+        # Transformed pages are cached apart from the raw responses of the same URL.
+        return f"{url}#{variant}"
+
+    @staticmethod
+    def _card_params(
+        board_id: str,
+        indexed_by: str | None,
+        sorted_by: str | None,
+        bracketed: bool = False,
+    ) -> dict[str, Any]:
+        # The Fizzy CLI uses /cards.json with board_ids; in this deployment
+        # board_ids without [] returns all cards (including triage).
+        params: dict[str, Any] = {"board_ids[]" if bracketed else "board_ids": board_id}
+        if indexed_by:
+            params["indexed_by"] = indexed_by
+        if sorted_by:
+            params["sorted_by"] = sorted_by
+        return params
+
+
+class FizzyClient(BaseFizzyClient):
+    """Fizzy API client with per-host keep-alive connection pools.
+
+    Up to ``pool_size`` idle connections are kept per host; a request takes
+    one (or opens a new one when all are busy) and returns it afterwards. A
+    pooled connection the server has closed is replaced and the request is
+    sent again once, unless part of the response body was already read.
+    Redirects are followed like ``urlopen`` did, and ``https_proxy``/
+    ``http_proxy`` settings are honoured. ``timeout`` bounds each blocking
+    socket operation of an attempt.
+
+    ``cache`` defaults to a ``ResponseCache`` in ``FIZZY_CACHE_DIR`` (or
+    ``build/fizzy``); ``FIZZY_CACHE_DIR=none`` keeps it in memory only.
+    """
+
+    def __init__(self, base_url: str, account_slug: str, token: str, **options: Any):
+        super().__init__(base_url, account_slug, token, **options)
+        self._pools: dict[tuple[str, str, int], queue.LifoQueue[http.client.HTTPConnection]] = {}
+        self._pools_lock = threading.Lock()
+
+    def _pool(self, key: tuple[str, str, int]) -> queue.LifoQueue[http.client.HTTPConnection]:
+        with self._pools_lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = self._pools[key] = queue.LifoQueue(maxsize=self.pool_size)
+            return pool
+
+    def _connect(self, scheme: str, host: str, port: int, timeout: float) -> http.client.HTTPConnection:
+        proxy = self._proxy_for(scheme, host)
+        target_host, target_port = host, port
+        if proxy:
+            parsed = urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+            target_host, target_port = parsed.hostname or host, parsed.port or 80
+        if scheme == "https":
+            connection: http.client.HTTPConnection = http.client.HTTPSConnection(
+                target_host, target_port, timeout=timeout, context=self._ssl_context
+            )
+            if proxy:
+                connection.set_tunnel(host, port)
+        else:
+            connection = http.client.HTTPConnection(target_host, target_port, timeout=timeout)
+        self.connections_opened += 1
+        return connection
+
+    def _send(
+        self,
+        url: str,
+        cached: CachedResponse | None = None,
+        page: StreamedPage | None = None,
+        timeout: float | None = None,
+    ) -> tuple[int, http.client.HTTPMessage, bytes]:
+        """Send a GET; a ``200`` body is streamed into ``page`` instead when one is given."""
+        timeout = self.timeout if timeout is None else timeout
+        parts = urlsplit(url)
+        scheme = parts.scheme or "https"
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, parts.hostname or "", port)
+        if scheme == "http" and self._proxy_for(scheme, key[1]):
+            target = url
+        else:
+            target = parts.path or "/"
+            if parts.query:
+                target += "?" + parts.query
+
+        pool = self._pool(key)
+        retry = True
+        while True:
+            try:
+                connection = pool.get_nowait()
+                reused = True
+            except queue.Empty:
+                connection = self._connect(*key, timeout)
+                reused = False
+            connection.timeout = timeout
+            if connection.sock is not None:
+                connection.sock.settimeout(timeout)
+            try:
+                connection.request("GET", target, headers=self._headers(cached))
+                response = connection.getresponse()
+                if page is not None and response.status == 200:
+                    page.begin(response.headers.get("Content-Encoding"))
+                    while True:
+                        chunk = response.read(STREAM_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        page.feed(chunk)
+                    page.finish()
+                    body = b""
+                else:
+                    body = response.read()
+            except _STALE_CONNECTION_ERRORS:
+                connection.close()
+                # Resend only if none of the body reached ``page``: a partly
+                # fed page cannot take the same bytes again.
+                if reused and retry and (page is None or page.bytes_received == 0):
+                    retry = False
+                    continue
+                raise
+            except BaseException:
+                connection.close()
+                raise
+            self.requests_sent += 1
+            self.bytes_received += len(body) + (page.bytes_received if page is not None else 0)
+            if response.will_close:
+                connection.close()
+            else:
+                try:
+                    pool.put_nowait(connection)
+                except queue.Full:
+                    connection.close()
+            return response.status, response.headers, _decode_body(
+                body, response.headers.get("Content-Encoding")
+            )
+
+    def _retrying(self, url: str, timeout: float | None, attempt: Callable[[float], T]) -> T:
+        """Run ``attempt(attempt_timeout)`` until it succeeds, retrying within the call's deadline."""
+        deadline = self._call_deadline(timeout)
+        number = 0
+        while True:
+            attempt_timeout = self._attempt_timeout(url, deadline)
+            self.breaker.allow()
+            try:
+                result = attempt(attempt_timeout)
+            except FizzyAPIError as exc:
+                delay = self._retry_delay(number, exc, deadline)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                number += 1
+                continue
+            self.breaker.record_success()
+            return result
+
+    def _attempt_json(self, url: str, timeout: float) -> tuple[Any, dict[str, str]]:
+        try:
+            for _ in range(MAX_REDIRECTS + 1):
+                cached = self.cache.get(url)
+                status, headers, body = self._send(url, cached, timeout=timeout)
+                location = headers.get("Location")
+                if status in _REDIRECT_STATUSES and location:
+                    url = urljoin(url, location)
+                    continue
+                break
+        except (OSError, http.client.HTTPException) as exc:
+            raise FizzyAPIError(f"Fizzy API request failed: {exc}", retryable=True) from exc
+        return self._result(url, cached, status, headers, body)
+
+    def request_json(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> tuple[Any, dict[str, str]]:
+        """GET ``path`` and return ``(payload, headers)``.
+
+        ``timeout`` overrides the client's ``deadline`` for this call.
+        Raises ``FizzyAPIError`` once the attempts or the deadline run out,
+        and ``CircuitOpenError`` without sending anything while the host's
+        breaker is open.
+        """
+        url = self._url(path, params)
+        return self._retrying(url, timeout, partial(self._attempt_json, url))
+
+    def iter_pages(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Yield each page of a paginated endpoint as soon as it arrives."""
+        data, headers = self.request_json(path, params)
+        while True:
+            if isinstance(data, list):
+                yield [item for item in data if isinstance(item, dict)]
+            next_url = _parse_link_next(headers.get("Link"))
+            if not next_url:
+                return
+            data, headers = self.request_json(next_url, None)
+
+    def get_paginated(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        return [item for page in self.iter_pages(path, params) for item in page]
+
+    def _attempt_page(
+        self,
+        url: str,
+        transform: PageTransform,
+        variant: str,
+        timeout: float,
+    ) -> tuple[list[Any], dict[str, str]]:
+        try:
+            for _ in range(MAX_REDIRECTS + 1):
+                key = self._stream_key(url, variant)
+                cached = self.cache.get(key)
+                page = StreamedPage(transform)
+                status, headers, body = self._send(url, cached, page, timeout)
+                location = headers.get("Location")
+                if status in _REDIRECT_STATUSES and location:
+                    url = urljoin(url, location)
+                    continue
+                break
+        except ValueError as exc:
+            raise FizzyAPIError(f"Fizzy API request failed: {exc}") from exc
+        except (OSError, http.client.HTTPException) as exc:
+            raise FizzyAPIError(f"Fizzy API request failed: {exc}", retryable=True) from exc
+        return self._page_result(key, cached, status, headers, body, page)
+
+    def _request_page(
+        self,
+        url: str,
+        transform: PageTransform,
+        variant: str,
+    ) -> tuple[list[Any], dict[str, str]]:
+        return self._retrying(url, None, partial(self._attempt_page, url, transform, variant))
+
+    def stream_pages(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        transform: PageTransform = _dict_items,
+        variant: str = "items",
+    ) -> Iterator[list[Any]]:
+        """Like ``iter_pages``, but decode each page while it downloads.
+
+        Decoded items pass through ``transform`` in batches as the body
+        arrives, and a page holds only what it yields, so memory does not
+        depend on how much of each response is thrown away. Pages are cached
+        after ``transform`` under ``variant``, which must change whenever the
+        transform does.
+        """
+        url = self._url(path, params)
+        while url:
+            page, headers = self._request_page(url, transform, variant)
+            yield page
+            next_url = _parse_link_next(headers.get("Link"))
+            url = self._url(next_url, None) if next_url else ""
+
+    def get_board_columns(self, board_id: str) -> list[dict[str, Any]]:
+        data, _ = self.request_json(f"/boards/{board_id}/columns")
+        if isinstance(data, list):
+            return [item for item in data if isinstance(item, dict)]
+        return []
+
+    def iter_board_card_pages(
+        self,
+        board_id: str,
+        indexed_by: str | None = None,
+        sorted_by: str | None = None,
+        transform: PageTransform | None = None,
+        variant: str = "items",
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Yield the board's cards page by page; see ``get_board_cards``.
+
+        ``sorted_by="latest"`` lists recently active cards first, which lets
+        incremental syncs stop paginating once they reach unchanged cards.
+        With a ``transform`` the pages are streamed; see ``stream_pages``.
+        """
+        if transform is None:
+            pages: Callable[..., Iterator[list[Any]]] = self.iter_pages
+        else:
+            pages = partial(self.stream_pages, transform=transform, variant=variant)
+        found = False
+        params = self._card_params(board_id, indexed_by, sorted_by)
+        for page in pages("/cards.json", params):
+            found = found or bool(page)
+            yield page
+        if found:
+            return
+        yield from pages(
+            "/cards.json", self._card_params(board_id, indexed_by, sorted_by, bracketed=True)
+        )
+
+    def get_board_cards(
+        self,
+        board_id: str,
+        indexed_by: str | None = None,
+    ) -> list[dict[str, Any]]:
+        return [
+            card
+            for page in self.iter_board_card_pages(board_id, indexed_by)
+            for card in page
+        ]
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        with self._pools_lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            while True:
+                try:
+                    pool.get_nowait().close()
+                except queue.Empty:
+                    break
+
+
+_CLIENTS: dict[tuple[str, str, str], FizzyClient] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def get_client(base_url: str, account_slug: str, token: str) -> FizzyClient:
+    """Return the shared client for these credentials, creating it on first use."""
+    key = (base_url, account_slug, token)
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(key)
+        if client is None:
+            client = _CLIENTS[key] = FizzyClient(base_url, account_slug, token)
+        return client
+
+
 def _request_json(
     base_url: str,
     account_slug: str,
@@ -37,26 +752,7 @@ def _request_json(
     path: str,
     params: dict[str, Any] | None = None,
 ) -> tuple[Any, dict[str, str]]:
-    url = _build_url(base_url, account_slug, path)
-    if params:
-        url += "?" + urlencode(params, doseq=True)
-
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Accept": "application/json",
-        "User-Agent": "xian-tech/roadmap",
-    }
-    req = Request(url, headers=headers)
-    try:
-        with urlopen(req, timeout=30) as resp:
-            body = resp.read()
-            payload = json.loads(body) if body else None
-            return payload, dict(resp.headers)
-    except HTTPError as exc:
-        body = exc.read().decode("utf-8", errors="ignore")
-        raise RuntimeError(f"Fizzy API error {exc.code}: {body}") from exc
-    except URLError as exc:
-        raise RuntimeError(f"Fizzy API request failed: {exc}") from exc
+    return get_client(base_url, account_slug, token).request_json(path, params)
 
 
 def get_paginated(
@@ -66,19 +762,7 @@ def get_paginated(
     path: str,
     params: dict[str, Any] | None = None,
 ) -> list[dict[str, Any]]:
-    data, headers = _request_json(base_url, account_slug, token, path, params)
-    results: list[dict[str, Any]] = []
-    if isinstance(data, list):
-        results.extend([item for item in data if isinstance(item, dict)])
-
-    next_url = _parse_link_next(headers.get("Link"))
-    while next_url:
-        data, headers = _request_json(base_url, account_slug, token, next_url, None)
-        if isinstance(data, list):
-            results.extend([item for item in data if isinstance(item, dict)])
-        next_url = _parse_link_next(headers.get("Link"))
-
-    return results
+    return get_client(base_url, account_slug, token).get_paginated(path, params)
 
 
 def get_board_columns(
@@ -87,10 +771,7 @@ def get_board_columns(
     token: str,
     board_id: str,
 ) -> list[dict[str, Any]]:
-    data, _ = _request_json(base_url, account_slug, token, f"/boards/{board_id}/columns")
-    if isinstance(data, list):
-        return [item for item in data if isinstance(item, dict)]
-    return []
+    return get_client(base_url, account_slug, token).get_board_columns(board_id)
 
 
 def get_board_cards(
@@ -100,15 +781,19 @@ def get_board_cards(
     board_id: str,
     indexed_by: str | None = None,
 ) -> list[dict[str, Any]]:
-    # The Fizzy CLI uses /cards.json with board_ids; in this deployment
-    # board_ids without [] returns all cards (including triage).
-    params: dict[str, Any] = {"board_ids": board_id}
-    if indexed_by:
-        params["indexed_by"] = indexed_by
-    results = get_paginated(base_url, account_slug, token, "/cards.json", params)
-    if results:
-        return results
-    fallback_params: dict[str, Any] = {"board_ids[]": board_id}
-    if indexed_by:
-        fallback_params["indexed_by"] = indexed_by
-    return get_paginated(base_url, account_slug, token, "/cards.json", fallback_params)
+    return get_client(base_url, account_slug, token).get_board_cards(board_id, indexed_by)
+
+
+def iter_board_card_pages(
+    base_url: str,
+    account_slug: str,
+    token: str,
+    board_id: str,
+    indexed_by: str | None = None,
+    sorted_by: str | None = None,
+    transform: PageTransform | None = None,
+    variant: str = "items",
+) -> Iterator[list[dict[str, Any]]]:
+    return get_client(base_url, account_slug, token).iter_board_card_pages(
+        board_id, indexed_by, sorted_by, transform, variant
+    )
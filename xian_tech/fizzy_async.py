@@ -0,0 +1,540 @@
+"""Asyncio Fizzy API client with the same API as ``fizzy_api`` (no client dependency)."""
+from __future__ import annotations
+
+import asyncio
+import email.parser
+import http.client
+import weakref
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any, AsyncIterator, Awaitable, Callable, TypeVar
+from urllib.parse import urljoin, urlsplit
+
+from .fizzy_api import (
+    MAX_REDIRECTS,
+    STREAM_CHUNK_SIZE,
+    _REDIRECT_STATUSES,
+    BaseFizzyClient,
+    CachedResponse,
+    PageTransform,
+    StreamedPage,
+    _decode_body,
+    _dict_items,
+    _parse_link_next,
+)
+from .fizzy_retry import FizzyAPIError
+
+MAX_HEADER_BYTES = 64 * 1024
+# Streamed bodies are decoded in batches of this many bytes, one thread hop each.
+FEED_BATCH_BYTES = 1024 * 1024
+_NO_BODY_STATUSES = {204, 304}
+_STALE_CONNECTION_ERRORS = (
+    asyncio.IncompleteReadError,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+_header_parser = email.parser.BytesParser(_class=http.client.HTTPMessage)
+
+T = TypeVar("T")
+
+
+def _finish_page(page: StreamedPage, rest: bytes) -> None:
+    if rest:
+        page.feed(rest)
+    page.finish()
+
+
+class _Connection:
+    """One keep-alive HTTP/1.1 connection."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    @property
+    def is_closed(self) -> bool:
+        return self.writer.is_closing() or self.reader.at_eof()
+
+    def close(self) -> None:
+        self.writer.close()
+
+    async def _read_head(self) -> tuple[int, str, http.client.HTTPMessage]:
+        head = await self.reader.readuntil(b"\r\n\r\n")
+        if len(head) > MAX_HEADER_BYTES:
+            raise http.client.HTTPException("Response headers are too large.")
+        status_line, _, header_block = head.partition(b"\r\n")
+        version, status, *_ = status_line.decode("latin-1").split(" ", 2) + [""]
+        if not version.startswith("HTTP/") or not status.isdigit():
+            raise http.client.BadStatusLine(status_line.decode("latin-1", errors="replace"))
+        return int(status), version, _header_parser.parsebytes(header_block)
+
+    async def _read_chunked(self) -> AsyncIterator[bytes]:
+        while True:
+            size_line = await self.reader.readuntil(b"\r\n")
+            size = int(size_line.split(b";", 1)[0].strip() or b"0", 16)
+            if size == 0:
+                while await self.reader.readuntil(b"\r\n") != b"\r\n":
+                    pass  # trailers
+                return
+            async for chunk in self._read_exactly(size):
+                yield chunk
+            await self.reader.readexactly(2)
+
+    async def _read_exactly(self, length: int) -> AsyncIterator[bytes]:
+        while length > 0:
+            chunk = await self.reader.readexactly(min(length, STREAM_CHUNK_SIZE))
+            length -= len(chunk)
+            yield chunk
+
+    async def _read_to_eof(self) -> AsyncIterator[bytes]:
+        while True:
+            chunk = await self.reader.read(STREAM_CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+    async def request(
+        self,
+        target: str,
+        host: str,
+        headers: dict[str, str],
+        page: StreamedPage | None = None,
+        offload: Callable[..., Awaitable[Any]] = asyncio.to_thread,
+    ) -> tuple[int, http.client.HTTPMessage, bytes, bool]:
+        """Send a GET and return ``(status, headers, raw_body, will_close)``.
+
+        A ``200`` body is streamed into ``page`` instead when one is given,
+        decoded through ``offload`` in batches of ``FEED_BATCH_BYTES``.
+        """
+        lines = [f"GET {target} HTTP/1.1", f"Host: {host}"]
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        await self.writer.drain()
+
+        status, version, response_headers = await self._read_head()
+        connection = (response_headers.get("Connection") or "").lower()
+        will_close = connection == "close" or (version == "HTTP/1.0" and connection != "keep-alive")
+        length = response_headers.get("Content-Length")
+        if status in _NO_BODY_STATUSES or 100 <= status < 200:
+            return status, response_headers, b"", will_close
+        if "chunked" in (response_headers.get("Transfer-Encoding") or "").lower():
+            chunks = self._read_chunked()
+        elif length is not None:
+            chunks = self._read_exactly(int(length))
+        else:
+            chunks = self._read_to_eof()
+            will_close = True
+        if page is None or status != 200:
+            return status, response_headers, b"".join([chunk async for chunk in chunks]), will_close
+        page.begin(response_headers.get("Content-Encoding"))
+        batch: list[bytes] = []
+        size = 0
+        async for chunk in chunks:
+            batch.append(chunk)
+            size += len(chunk)
+            if size >= FEED_BATCH_BYTES:
+                await offload(page.feed, b"".join(batch))
+                batch, size = [], 0
+        await offload(_finish_page, page, b"".join(batch))
+        return status, response_headers, b"", will_close
+
+
+class AsyncFizzyClient(BaseFizzyClient):
+    """Fizzy API client on ``asyncio`` streams with per-host keep-alive pools.
+
+    Works like ``fizzy_api.FizzyClient``: up to ``pool_size`` idle
+    connections are kept per host, a pooled connection the server has closed
+    is replaced and the request sent again once, and redirects and proxy
+    settings are honoured. ``timeout`` bounds each attempt, connecting
+    included, and ``deadline`` each call; ``request_json`` also takes a
+    per-call ``timeout`` that replaces the deadline. Decoding and cache file
+    access run on ``executor`` (the default executor when ``None``).
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        account_slug: str,
+        token: str,
+        executor: Executor | None = None,
+        **options: Any,
+    ):
+        super().__init__(base_url, account_slug, token, **options)
+        self.executor = executor
+        self._pools: dict[tuple[str, str, int], list[_Connection]] = {}
+
+    def _offload(self, call: Callable[..., T], *args: Any) -> Awaitable[T]:
+        return asyncio.get_running_loop().run_in_executor(self.executor, call, *args)
+
+    async def _open_tunnel(self, proxy: str, host: str, port: int) -> _Connection:
+        parsed = urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+        reader, writer = await asyncio.open_connection(parsed.hostname, parsed.port or 80)
+        connection = _Connection(reader, writer)
+        writer.write(f"CONNECT {host}:{port} HTTP/1.1\r\nHost: {host}:{port}\r\n\r\n".encode("latin-1"))
+        await writer.drain()
+        status, _, _ = await connection._read_head()
+        if status != 200:
+            connection.close()
+            raise OSError(f"Proxy CONNECT to {host}:{port} failed with status {status}.")
+        await writer.start_tls(self._ssl_context, server_hostname=host)
+        return connection
+
+    async def _connect(self, scheme: str, host: str, port: int) -> _Connection:
+        proxy = self._proxy_for(scheme, host)
+        if proxy and scheme == "https":
+            connection = await self._open_tunnel(proxy, host, port)
+        elif proxy:
+            parsed = urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+            connection = _Connection(*await asyncio.open_connection(parsed.hostname, parsed.port or 80))
+        elif scheme == "https":
+            connection = _Connection(
+                *await asyncio.open_connection(host, port, ssl=self._ssl_context, server_hostname=host)
+            )
+        else:
+            connection = _Connection(*await asyncio.open_connection(host, port))
+        self.connections_opened += 1
+        return connection
+
+    def _checkout(self, key: tuple[str, str, int]) -> _Connection | None:
+        pool = self._pools.get(key)
+        while pool:
+            connection = pool.pop()
+            if not connection.is_closed:
+                return connection
+            connection.close()
+        return None
+
+    def _checkin(self, key: tuple[str, str, int], connection: _Connection) -> None:
+        pool = self._pools.setdefault(key, [])
+        if len(pool) < self.pool_size:
+            pool.append(connection)
+        else:
+            connection.close()
+
+    async def _send(
+        self,
+        url: str,
+        cached: CachedResponse | None = None,
+        page: StreamedPage | None = None,
+    ) -> tuple[int, http.client.HTTPMessage, bytes]:
+        parts = urlsplit(url)
+        scheme = parts.scheme or "https"
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, parts.hostname or "", port)
+        if scheme == "http" and self._proxy_for(scheme, key[1]):
+            target = url
+        else:
+            target = parts.path or "/"
+            if parts.query:
+                target += "?" + parts.query
+        host = parts.netloc.rpartition("@")[2]
+
+        retry = True
+        while True:
+            connection = self._checkout(key)
+            reused = connection is not None
+            if connection is None:
+                connection = await self._connect(*key)
+            try:
+                status, headers, body, will_close = await connection.request(
+                    target, host, self._headers(cached), page, self._offload
+                )
+            except _STALE_CONNECTION_ERRORS:
+                connection.close()
+                # Resend only if none of the body reached ``page``: a partly
+                # fed page cannot take the same bytes again.
+                if reused and retry and (page is None or page.bytes_received == 0):
+                    retry = False
+                    continue
+                raise
+            except BaseException:
+                connection.close()
+                raise
+            self.requests_sent += 1
+            self.bytes_received += len(body) + (page.bytes_received if page is not None else 0)
+            if will_close:
+                connection.close()
+            else:
+                self._checkin(key, connection)
+            return status, headers, body
+
+    async def _retrying(
+        self,
+        url: str,
+        timeout: float | None,
+        attempt: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Await ``attempt()`` until it succeeds, each try bounded by the attempt timeout."""
+        deadline = self._call_deadline(timeout)
+        number = 0
+        while True:
+            attempt_timeout = self._attempt_timeout(url, deadline)
+            self.breaker.allow()
+            try:
+                async with asyncio.timeout(attempt_timeout):
+                    result = await attempt()
+            except TimeoutError as exc:
+                error = FizzyAPIError(f"Fizzy API request timed out: {url}", retryable=True)
+                error.__cause__ = exc
+            except (ValueError, asyncio.LimitOverrunError) as exc:
+                error = FizzyAPIError(f"Fizzy API request failed: {exc}")
+                error.__cause__ = exc
+            except (OSError, http.client.HTTPException, asyncio.IncompleteReadError) as exc:
+                error = FizzyAPIError(f"Fizzy API request failed: {exc}", retryable=True)
+                error.__cause__ = exc
+            except FizzyAPIError as exc:
+                error = exc
+            else:
+                self.breaker.record_success()
+                return result
+            delay = self._retry_delay(number, error, deadline)
+            if delay is None:
+                raise error
+            await asyncio.sleep(delay)
+            number += 1
+
+    async def _cached(self, key: str) -> CachedResponse | None:
+        entry = self.cache.peek(key)
+        if entry is None and self.cache.directory is not None:
+            entry = await self._offload(self.cache.get, key)
+        return entry
+
+    def _json_result(
+        self,
+        url: str,
+        cached: CachedResponse | None,
+        status: int,
+        headers: http.client.HTTPMessage,
+        body: bytes,
+    ) -> tuple[Any, dict[str, str]]:
+        # Runs on the executor: decompression and parsing in one hop.
+        return self._result(url, cached, status, headers, _decode_body(body, headers.get("Content-Encoding")))
+
+    def _streamed_result(
+        self,
+        key: str,
+        cached: CachedResponse | None,
+        status: int,
+        headers: http.client.HTTPMessage,
+        body: bytes,
+        page: StreamedPage,
+    ) -> tuple[list[Any], dict[str, str]]:
+        body = _decode_body(body, headers.get("Content-Encoding"))
+        return self._page_result(key, cached, status, headers, body, page)
+
+    async def _attempt_json(self, url: str) -> tuple[Any, dict[str, str]]:
+        for _ in range(MAX_REDIRECTS + 1):
+            cached = await self._cached(url)
+            status, headers, body = await self._send(url, cached)
+            location = headers.get("Location")
+            if status in _REDIRECT_STATUSES and location:
+                url = urljoin(url, location)
+                continue
+            break
+        return await self._offload(self._json_result, url, cached, status, headers, body)
+
+    async def request_json(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> tuple[Any, dict[str, str]]:
+        """GET ``path`` and return ``(payload, headers)``; see ``FizzyClient.request_json``."""
+        url = self._url(path, params)
+        return await self._retrying(url, timeout, partial(self._attempt_json, url))
+
+    async def iter_pages(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield each page of a paginated endpoint as soon as it arrives."""
+        data, headers = await self.request_json(path, params)
+        while True:
+            if isinstance(data, list):
+                yield [item for item in data if isinstance(item, dict)]
+            next_url = _parse_link_next(headers.get("Link"))
+            if not next_url:
+                return
+            data, headers = await self.request_json(next_url, None)
+
+    async def get_paginated(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        return [item async for page in self.iter_pages(path, params) for item in page]
+
+    async def _attempt_page(
+        self,
+        url: str,
+        transform: PageTransform,
+        variant: str,
+    ) -> tuple[list[Any], dict[str, str]]:
+        for _ in range(MAX_REDIRECTS + 1):
+            key = self._stream_key(url, variant)
+            cached = await self._cached(key)
+            page = StreamedPage(transform)
+            status, headers, body = await self._send(url, cached, page)
+            location = headers.get("Location")
+            if status in _REDIRECT_STATUSES and location:
+                url = urljoin(url, location)
+                continue
+            break
+        return await self._offload(self._streamed_result, key, cached, status, headers, body, page)
+
+    async def _request_page(
+        self,
+        url: str,
+        transform: PageTransform,
+        variant: str,
+        timeout: float | None = None,
+    ) -> tuple[list[Any], dict[str, str]]:
+        return await self._retrying(
+            url, timeout, partial(self._attempt_page, url, transform, variant)
+        )
+
+    async def stream_pages(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        transform: PageTransform = _dict_items,
+        variant: str = "items",
+    ) -> AsyncIterator[list[Any]]:
+        """Yield pages decoded while they download; see ``FizzyClient.stream_pages``."""
+        url = self._url(path, params)
+        while url:
+            page, headers = await self._request_page(url, transform, variant)
+            yield page
+            next_url = _parse_link_next(headers.get("Link"))
+            url = self._url(next_url, None) if next_url else ""
+
+    async def get_board_columns(self, board_id: str) -> list[dict[str, Any]]:
+        data, _ = await self.request_json(f"/boards/{board_id}/columns")
+        if isinstance(data, list):
+            return [item for item in data if isinstance(item, dict)]
+        return []
+
+    async def iter_board_card_pages(
+        self,
+        board_id: str,
+        indexed_by: str | None = None,
+        sorted_by: str | None = None,
+        transform: PageTransform | None = None,
+        variant: str = "items",
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield the board's cards page by page; see ``FizzyClient.iter_board_card_pages``."""
+        if transform is None:
+            pages: Callable[..., AsyncIterator[list[Any]]] = self.iter_pages
+        else:
+            pages = partial(self.stream_pages, transform=transform, variant=variant)
+        found = False
+        params = self._card_params(board_id, indexed_by, sorted_by)
+        async for page in pages("/cards.json", params):
+            found = found or bool(page)
+            yield page
+        if found:
+            return
+        async for page in pages(
+            "/cards.json", self._card_params(board_id, indexed_by, sorted_by, bracketed=True)
+        ):
+            yield page
+
+    async def get_board_cards(
+        self,
+        board_id: str,
+        indexed_by: str | None = None,
+    ) -> list[dict[str, Any]]:
+        return [
+            card
+            async for page in self.iter_board_card_pages(board_id, indexed_by)
+            for card in page
+        ]
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            for connection in pool:
+                connection.close()
+
+
+_CLIENTS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[tuple[str, str, str], AsyncFizzyClient]
+] = weakref.WeakKeyDictionary()
+
+
+def get_client(
+    base_url: str,
+    account_slug: str,
+    token: str,
+    executor: Executor | None = None,
+) -> AsyncFizzyClient:
+    """Return the running loop's shared client for these credentials, on ``executor`` if given."""
+    clients = _CLIENTS.setdefault(asyncio.get_running_loop(), {})
+    key = (base_url, account_slug, token)
+    client = clients.get(key)
+    if client is None:
+        client = clients[key] = AsyncFizzyClient(base_url, account_slug, token, executor)
+    elif executor is not None:
+        client.executor = executor
+    return client
+
+
+async def get_paginated(
+    base_url: str,
+    account_slug: str,
+    token: str,
+    path: str,
+    params: dict[str, Any] | None = None,
+    executor: Executor | None = None,
+) -> list[dict[str, Any]]:
+    return await get_client(base_url, account_slug, token, executor).get_paginated(path, params)
+
+
+async def get_board_columns(
+    base_url: str,
+    account_slug: str,
+    token: str,
+    board_id: str,
+    executor: Executor | None = None,
+) -> list[dict[str, Any]]:
+    return await get_client(base_url, account_slug, token, executor).get_board_columns(board_id)
+
+
+async def get_board_cards(
+    base_url: str,
+    account_slug: str,
+    token: str,
+    board_id: str,
+    indexed_by: str | None = None,
+    executor: Executor | None = None,
+) -> list[dict[str, Any]]:
+    return await get_client(base_url, account_slug, token, executor).get_board_cards(board_id, indexed_by)
+
+
+def iter_board_card_pages(
+    base_url: str,
+    account_slug: str,
+    token: str,
+    board_id: str,
+    indexed_by: str | None = None,
+    sorted_by: str | None = None,
+    transform: PageTransform | None = None,
+    variant: str = "items",
+    executor: Executor | None = None,
+) -> AsyncIterator[list[dict[str, Any]]]:
+    return get_client(base_url, account_slug, token, executor).iter_board_card_pages(
+        board_id, indexed_by, sorted_by, transform, variant
+    )
+
+
+__all__ = [
+    "AsyncFizzyClient",
+    "get_board_cards",
+    "get_board_columns",
+    "get_client",
+    "get_paginated",
+    "iter_board_card_pages",
+]
@@ -0,0 +1,227 @@
+"""Retries, deadlines and per-host circuit breaking for Fizzy requests."""
+from __future__ import annotations
+
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable
+from urllib.parse import urlsplit
+
+DEFAULT_ATTEMPTS = 3
+DEFAULT_BACKOFF = 0.25
+DEFAULT_MAX_BACKOFF = 4.0
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT = 30.0
+# Statuses that say the host is struggling rather than that the request is wrong.
+RETRYABLE_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+MAX_ERROR_LENGTH = 200
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class FizzyAPIError(RuntimeError):
+    """A Fizzy request failed.
+
+    ``status`` is the HTTP status, or ``None`` when no response arrived.
+    ``retryable`` marks failures that may pass on another attempt, and
+    ``retry_after`` is the wait the server asked for, in seconds.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        status: int | None = None,
+        *,
+        retryable: bool = False,
+        retry_after: float | None = None,
+    ):
+        super().__init__(message)
+        self.status = status
+        self.retryable = retryable
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(FizzyAPIError):
+    """The host's circuit breaker is open, so the request was not sent."""
+
+
+def env_number(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, "") or default)
+    except ValueError:
+        return default
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a ``Retry-After`` header (delay or HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, moment.timestamp() - time.time())
+
+
+class RetryPolicy:
+    """How many attempts a call gets and how long to wait between them."""
+
+    def __init__(
+        self,
+        attempts: int = DEFAULT_ATTEMPTS,
+        backoff: float = DEFAULT_BACKOFF,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+        rng: random.Random | None = None,
+    ):
+        self.attempts = max(1, attempts)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._rng = rng or random.Random()
+
+    @classmethod
+    def from_env(cls) -> RetryPolicy:
+        return cls(attempts=int(env_number("FIZZY_RETRY_ATTEMPTS", DEFAULT_ATTEMPTS)))
+
+    def delay(self, attempt: int, error: FizzyAPIError, remaining: float) -> float | None:
+        """Seconds to wait before retrying after failed ``attempt`` (0-based), or ``None`` to give up."""
+        if not error.retryable or attempt + 1 >= self.attempts:
+            return None
+        delay = self._rng.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+        if error.retry_after is not None:
+            delay = max(delay, error.retry_after)
+        return delay if delay < remaining else None
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one Fizzy host; thread-safe.
+
+    Closed, requests go through and failures are counted; a success resets
+    the count. ``failure_threshold`` failures in a row open it, and ``allow``
+    then raises ``CircuitOpenError`` for ``reset_timeout`` seconds. After
+    that it is half open: one probe is let through, and its outcome closes
+    or reopens the breaker. A probe that never reports back is replaced
+    after another ``reset_timeout``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probe_started: float | None = None
+        self.opens = 0
+        self.rejected = 0
+        self.total_failures = 0
+        self.last_error = ""
+
+    def allow(self) -> None:
+        """Raise ``CircuitOpenError`` unless a request may be sent now."""
+        with self._lock:
+            now = self._clock()
+            if self.state == OPEN and now - self.opened_at >= self.reset_timeout:
+                self.state = HALF_OPEN
+                self._probe_started = None
+            if self.state == HALF_OPEN and (
+                self._probe_started is None or now - self._probe_started >= self.reset_timeout
+            ):
+                self._probe_started = now
+                return
+            if self.state == CLOSED:
+                return
+            self.rejected += 1
+            retry_in = max(0.0, self.opened_at + self.reset_timeout - now)
+        raise CircuitOpenError(
+            f"Fizzy at {self.name} is unavailable after repeated failures; "
+            f"retrying in {retry_in:.0f}s."
+        )
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self._probe_started = None
+
+    def record_failure(self, error: str) -> None:
+        with self._lock:
+            self.failures += 1
+            self.total_failures += 1
+            self.last_error = error[:MAX_ERROR_LENGTH]
+            if self.state == HALF_OPEN or (
+                self.state == CLOSED and self.failures >= self.failure_threshold
+            ):
+                self.state = OPEN
+                self.opened_at = self._clock()
+                self._probe_started = None
+                self.opens += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Counters for logging or monitoring."""
+        with self._lock:
+            retry_in = 0.0
+            if self.state == OPEN:
+                retry_in = max(0.0, self.opened_at + self.reset_timeout - self._clock())
+            return {
+                "state": self.state,
+                "consecutive_failures": self.failures,
+                "failures": self.total_failures,
+                "opens": self.opens,
+                "rejected": self.rejected,
+                "retry_in": round(retry_in, 1),
+                "last_error": self.last_error,
+            }
+
+
+_BREAKERS: dict[str, CircuitBreaker] = {}
+_BREAKERS_LOCK = threading.Lock()
+
+
+def get_breaker(base_url: str) -> CircuitBreaker:
+    """Return the shared breaker for ``base_url``'s host, creating it on first use."""
+    parts = urlsplit(base_url)
+    name = parts.netloc or base_url
+    with _BREAKERS_LOCK:
+        breaker = _BREAKERS.get(name)
+        if breaker is None:
+            breaker = _BREAKERS[name] = CircuitBreaker(
+                name,
+                failure_threshold=int(
+                    env_number("FIZZY_BREAKER_THRESHOLD", DEFAULT_FAILURE_THRESHOLD)
+                ),
+                reset_timeout=env_number("FIZZY_BREAKER_RESET", DEFAULT_RESET_TIMEOUT),
+            )
+        return breaker
+
+
+def breaker_stats() -> dict[str, dict[str, Any]]:
+    """``CircuitBreaker.stats`` of every Fizzy host, by host."""
+    with _BREAKERS_LOCK:
+        breakers = list(_BREAKERS.values())
+    return {breaker.name: breaker.stats() for breaker in breakers}
+
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "FizzyAPIError",
+    "RETRYABLE_STATUSES",
+    "RetryPolicy",
+    "breaker_stats",
+    "get_breaker",
+]
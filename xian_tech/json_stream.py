@@ -0,0 +1,138 @@
+"""Incremental decoding of (optionally compressed) JSON array response bodies."""
+from __future__ import annotations
+
+import codecs
+import json
+import re
+import zlib
+from typing import Any
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DELIMITERS = frozenset(" \t\n\r,]")
+
+_START, _VALUE_OR_END, _VALUE, _SEPARATOR, _END = range(5)
+
+
+class JsonArrayDecoder:
+    """Decode the elements of one top-level JSON array from byte chunks.
+
+    ``feed`` returns the elements completed by a chunk and ``close`` those left
+    at the end of the body. ``ValueError`` is raised when the body is not a
+    single JSON array; an empty body decodes to no elements.
+    """
+
+    def __init__(self) -> None:
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pending: list[str] = []
+        self._pending_length = 0
+        self._state = _START
+        # Length the unparsed text must reach before an unfinished element is
+        # parsed again, so one large element costs linear time.
+        self._retry_at = 0
+
+    def _append(self, text: str) -> None:
+        self._pending.append(text)
+        self._pending_length += len(text)
+
+    def _join(self) -> None:
+        self._buffer += "".join(self._pending)
+        self._pending, self._pending_length = [], 0
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        self._append(self._text.decode(chunk))
+        if len(self._buffer) + self._pending_length < self._retry_at:
+            return []
+        self._join()
+        return self._drain(final=False)
+
+    def close(self) -> list[Any]:
+        self._append(self._text.decode(b"", final=True))
+        self._join()
+        items = self._drain(final=True)
+        if self._state not in (_START, _END) or self._buffer.strip():
+            raise ValueError("Truncated JSON array.")
+        return items
+
+    def _drain(self, final: bool) -> list[Any]:
+        items: list[Any] = []
+        buffer, state, position = self._buffer, self._state, 0
+        self._retry_at = 0
+        while True:
+            position = _WHITESPACE.match(buffer, position).end()
+            if position == len(buffer):
+                break
+            char = buffer[position]
+            if state == _START:
+                if char != "[":
+                    raise ValueError("Expected a JSON array.")
+                state, position = _VALUE_OR_END, position + 1
+            elif state == _SEPARATOR or (state == _VALUE_OR_END and char == "]"):
+                if char == "]":
+                    state = _END
+                elif char != "," or state != _SEPARATOR:
+                    raise ValueError(f"Unexpected {char!r} in JSON array.")
+                else:
+                    state = _VALUE
+                position += 1
+            elif state == _END:
+                raise ValueError("Extra data after JSON array.")
+            else:
+                try:
+                    item, end = self._decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    self._retry_at = 2 * (len(buffer) - position)
+                    break
+                if (
+                    not final
+                    and isinstance(item, (int, float))
+                    and (end == len(buffer) or buffer[end] not in _DELIMITERS)
+                ):
+                    break  # the number may continue in the next chunk
+                items.append(item)
+                state, position = _SEPARATOR, end
+        self._buffer, self._state = buffer[position:], state
+        return items
+
+
+class Inflater:
+    """Undo a ``Content-Encoding`` of ``gzip`` or ``deflate`` chunk by chunk."""
+
+    def __init__(self, encoding: str | None):
+        encoding = (encoding or "").strip().lower()
+        self._gzip = encoding in ("gzip", "x-gzip")
+        self._deflate = encoding == "deflate"
+        self._inflater: Any = zlib.decompressobj(16 + zlib.MAX_WBITS) if self._gzip else None
+        self._head = b""
+
+    def decompress(self, chunk: bytes) -> bytes:
+        if self._deflate and self._inflater is None:
+            # "deflate" is zlib-wrapped per the RFC, but some servers send raw
+            # deflate; the two-byte zlib header tells them apart.
+            chunk = self._head + chunk
+            if len(chunk) < 2:
+                self._head = chunk
+                return b""
+            wrapped = chunk[0] & 0x0F == 8 and int.from_bytes(chunk[:2], "big") % 31 == 0
+            self._inflater = zlib.decompressobj(zlib.MAX_WBITS if wrapped else -zlib.MAX_WBITS)
+        if self._inflater is None:
+            return chunk
+        try:
+            return self._inflater.decompress(chunk)
+        except zlib.error as exc:
+            raise ValueError(f"Invalid {'gzip' if self._gzip else 'deflate'} body: {exc}") from exc
+
+    def flush(self) -> bytes:
+        if self._inflater is None:
+            if self._head:
+                raise ValueError("Truncated compressed body.")
+            return b""
+        if not self._inflater.eof:
+            raise ValueError("Truncated compressed body.")
+        return self._inflater.flush()
+
+
+__all__ = ["Inflater", "JsonArrayDecoder"]
@@ -265,6 +265,7 @@ def _faq_item(item: dict[str, Any]) -> rx.Component:
             color=TEXT_MUTED,
         ),
         value=f"faq-{item['id']}",
+        id=f"faq-{item['id']}",
         background=SURFACE,
         border_radius="14px",
         border=f"1px solid {BORDER_COLOR}",
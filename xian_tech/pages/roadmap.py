@@ -129,11 +129,16 @@ def roadmap_page() -> rx.Component:
             rx.box(
                 rx.vstack(
                     rx.text(column["name"], size="4", weight="bold", color=TEXT_PRIMARY),
-                    rx.hstack(
-                        rx.text(column.get("count", 0), size="2", color=TEXT_MUTED),
-                        rx.text("cards", size="2", color=TEXT_MUTED),
-                        spacing="1",
-                        align_items="center",
+                    rx.cond(
+                        State.roadmap_loading,
+                        # The columns arrive before their cards; a count of 0 would read as empty.
+                        rx.skeleton(height="12px", width="30%", loading=True),
+                        rx.hstack(
+                            rx.text(column.get("count", 0), size="2", color=TEXT_MUTED),
+                            rx.text("cards", size="2", color=TEXT_MUTED),
+                            spacing="1",
+                            align_items="center",
+                        ),
                     ),
                     spacing="1",
                     align_items="start",
@@ -146,7 +151,11 @@ def roadmap_page() -> rx.Component:
             ),
             rx.box(
                 rx.vstack(
-                    rx.foreach(column["cards"], roadmap_card),
+                    rx.cond(
+                        State.roadmap_loading,
+                        rx.fragment(*[roadmap_card_skeleton() for _ in range(3)]),
+                        rx.foreach(column["cards"], roadmap_card),
+                    ),
                     spacing="2",
                     align_items="stretch",
                     width="100%",
@@ -178,18 +187,79 @@ def roadmap_page() -> rx.Component:
         width="100%",
     )
 
+    # Done cards are fetched only when the section is expanded, a page at a time.
+    done_pager = rx.hstack(
+        rx.button(
+            rx.icon(tag="chevron_left", size=16),
+            "Newer",
+            variant="soft",
+            color_scheme="gray",
+            size="1",
+            disabled=State.roadmap_done_page <= 0,
+            on_click=State.show_roadmap_done_page(State.roadmap_done_page - 1),
+        ),
+        rx.text(
+            "Page ",
+            State.roadmap_done_page + 1,
+            " of ",
+            State.roadmap_done_pages,
+            size="2",
+            color=TEXT_MUTED,
+        ),
+        rx.button(
+            "Older",
+            rx.icon(tag="chevron_right", size=16),
+            variant="soft",
+            color_scheme="gray",
+            size="1",
+            disabled=State.roadmap_done_page + 1 >= State.roadmap_done_pages,
+            on_click=State.show_roadmap_done_page(State.roadmap_done_page + 1),
+        ),
+        spacing="3",
+        align_items="center",
+    )
+
     done_section = rx.vstack(
-        rx.hstack(
+        rx.button(
+            rx.icon(
+                tag="chevron_right",
+                size=18,
+                transform=rx.cond(State.roadmap_done_open, "rotate(90deg)", "rotate(0deg)"),
+                transition="transform 0.2s ease",
+            ),
             rx.text("Done", size="4", weight="bold", color=TEXT_PRIMARY),
             rx.text(State.roadmap_done_count, size="2", color=TEXT_MUTED),
-            spacing="2",
-            align_items="center",
+            variant="ghost",
+            color_scheme="gray",
+            on_click=State.toggle_roadmap_done,
+            aria_expanded=rx.cond(State.roadmap_done_open, "true", "false"),
+            cursor="pointer",
         ),
-        rx.grid(
-            rx.foreach(State.roadmap_done_cards, roadmap_card),
-            columns={"base": "1", "sm": "2", "md": "3", "lg": "4"},
-            spacing="4",
-            width="100%",
+        rx.cond(
+            State.roadmap_done_open & State.roadmap_done_loading,
+            rx.hstack(
+                rx.spinner(size="1"),
+                rx.text("Loading done cards…", size="2", color=TEXT_MUTED),
+                spacing="2",
+                align_items="center",
+            ),
+            rx.box(),
+        ),
+        rx.cond(
+            State.roadmap_done_open & ~State.roadmap_done_loading,
+            rx.vstack(
+                rx.grid(
+                    rx.foreach(State.roadmap_done_cards, roadmap_card),
+                    columns={"base": "1", "sm": "2", "md": "3", "lg": "4"},
+                    spacing="4",
+                    width="100%",
+                ),
+                rx.cond(State.roadmap_done_pages > 1, done_pager, rx.box()),
+                spacing="3",
+                align_items="start",
+                width="100%",
+            ),
+            rx.box(),
         ),
         spacing="3",
         align_items="start",
@@ -247,6 +317,31 @@ def roadmap_page() -> rx.Component:
                         State.roadmap_show_loading,
                         loading_view,
                         rx.vstack(
+                            rx.cond(
+                                State.roadmap_stale,
+                                rx.callout.root(
+                                    rx.callout.icon(rx.icon(tag="clock")),
+                                    rx.callout.text(
+                                        "Showing the board as last synced on ",
+                                        State.roadmap_synced_at,
+                                        ". Live data is refreshing in the background.",
+                                    ),
+                                    color_scheme="amber",
+                                    size="1",
+                                    width="100%",
+                                ),
+                                rx.box(),
+                            ),
+                            rx.cond(
+                                State.roadmap_loading,
+                                rx.hstack(
+                                    rx.spinner(size="1"),
+                                    rx.text("Loading cards…", size="2", color=TEXT_MUTED),
+                                    spacing="2",
+                                    align_items="center",
+                                ),
+                                rx.box(),
+                            ),
                             board_view,
                             rx.cond(State.roadmap_done_count > 0, done_section, rx.box()),
                             spacing="4",
@@ -0,0 +1,927 @@
+"""Roadmap board loading and the process-wide snapshot cache."""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from contextlib import aclosing
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    Hashable,
+    NamedTuple,
+    NotRequired,
+    TypeVar,
+    TypedDict,
+)
+
+from .fileio import atomic_write_bytes
+from .roadmap_board import board_cards, normalize_board, slim_card
+
+DEFAULT_CACHE_TTL = 300.0
+WEBHOOK_CACHE_TTL = 86400.0
+SNAPSHOT_VERSION = 1
+DEFAULT_SNAPSHOT_PATH = Path(__file__).resolve().parent.parent / "build" / "roadmap" / "snapshot.json"
+DEFAULT_FETCH_WORKERS = 4
+DEFAULT_FULL_SYNC_INTERVAL = 3600.0
+# Raw card fields that move whenever a card changes, newest wins.
+CHANGE_FIELDS = ("updated_at", "last_active_at")
+# Cache variant of card pages slimmed by ``board_cards``; bump when it changes.
+CARD_CACHE_VARIANT = "roadmap-cards-1"
+FLIGHT_HISTORY = 100
+
+T = TypeVar("T")
+
+_FETCH_POOL: ThreadPoolExecutor | None = None
+
+
+class BoardConfig(NamedTuple):
+    base_url: str
+    account_slug: str
+    token: str
+    board_id: str
+    excluded_tags: frozenset[str]
+
+
+class RoadmapSnapshot(TypedDict):
+    columns: list[dict[str, Any]]
+    done: list[dict[str, Any]]
+    fetched_at: float  # last load from Fizzy
+    patched_at: NotRequired[float]  # last pushed change applied since
+
+
+def board_config() -> BoardConfig:
+    """Read the Fizzy board settings from the environment."""
+    token = os.getenv("FIZZY_TOKEN", "").strip()
+    account_slug = (
+        os.getenv("FIZZY_ACCOUNT_SLUG", "")
+        or os.getenv("FIZZY_ACCOUNT", "")
+        or "1"
+    ).strip().lstrip("/")
+    board_id = (
+        os.getenv("FIZZY_BOARD_ID", "")
+        or os.getenv("FIZZY_BOARD", "")
+        or "03fiomkit5oknquymk0ooi26m"
+    ).strip()
+    base_url = (
+        os.getenv("FIZZY_BASE_URL", "")
+        or os.getenv("FIZZY_API_URL", "")
+        or "https://tasks.xian.technology"
+    ).strip()
+
+    if not token:
+        raise ValueError("Missing FIZZY_TOKEN for Fizzy API access.")
+    if not account_slug or not board_id:
+        raise ValueError("Missing FIZZY_ACCOUNT_SLUG or FIZZY_BOARD_ID.")
+
+    excluded_tags_raw = os.getenv("FIZZY_EXCLUDE_TAGS", "").strip()
+    excluded_tags = frozenset(
+        tag.strip().lower()
+        for tag in excluded_tags_raw.split(",")
+        if tag.strip()
+    )
+    return BoardConfig(base_url, account_slug, token, board_id, excluded_tags)
+
+
+def _fetch_pool() -> ThreadPoolExecutor:
+    global _FETCH_POOL
+    if _FETCH_POOL is None:
+        try:
+            workers = max(1, int(os.getenv("FIZZY_FETCH_WORKERS", "") or DEFAULT_FETCH_WORKERS))
+        except ValueError:
+            workers = DEFAULT_FETCH_WORKERS
+        _FETCH_POOL = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fizzy-fetch")
+    return _FETCH_POOL
+
+
+def _card_stream_options(config: BoardConfig) -> dict[str, Any]:
+    """``iter_board_card_pages`` options that stream pages through ``board_cards``."""
+    return {"transform": partial(board_cards, board_id=config.board_id), "variant": CARD_CACHE_VARIANT}
+
+
+def _board_requests(config: BoardConfig) -> tuple[Callable[[], list[dict[str, Any]]], ...]:
+    from . import fizzy_api
+
+    base_url, account_slug, token, board_id, _ = config
+
+    def cards(indexed_by: str | None) -> list[dict[str, Any]]:
+        pages = fizzy_api.iter_board_card_pages(
+            base_url, account_slug, token, board_id, indexed_by, **_card_stream_options(config)
+        )
+        return [card for page in pages for card in page]
+
+    return (
+        partial(fizzy_api.get_board_columns, base_url, account_slug, token, board_id),
+        partial(cards, None),
+        partial(cards, "closed"),
+    )
+
+
+def fetch_board(config: BoardConfig) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Fetch the board and return ``(columns_payload, done_payload)``.
+
+    Columns, open cards and closed cards are requested concurrently on the
+    shared fetch pool.
+    """
+    futures = [_fetch_pool().submit(request) for request in _board_requests(config)]
+    columns, open_cards, closed_cards = (future.result() for future in futures)
+    return build_board(config, columns, open_cards, closed_cards)
+
+
+async def load_board(config: BoardConfig) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Async ``fetch_board`` on the ``fizzy_async`` client; only shaping runs on the pool."""
+    from . import fizzy_async
+
+    base_url, account_slug, token, board_id, _ = config
+
+    async def cards(indexed_by: str | None) -> list[dict[str, Any]]:
+        pages = fizzy_async.iter_board_card_pages(
+            base_url,
+            account_slug,
+            token,
+            board_id,
+            indexed_by,
+            executor=_fetch_pool(),
+            **_card_stream_options(config),
+        )
+        return [card async for page in pages for card in page]
+
+    columns, open_cards, closed_cards = await asyncio.gather(
+        fizzy_async.get_board_columns(base_url, account_slug, token, board_id, _fetch_pool()),
+        cards(None),
+        cards("closed"),
+    )
+    return await asyncio.get_running_loop().run_in_executor(
+        _fetch_pool(), build_board, config, columns, open_cards, closed_cards
+    )
+
+
+def _board_page_streams(config: BoardConfig) -> dict[str, AsyncIterator[list[dict[str, Any]]]]:
+    from . import fizzy_async
+
+    base_url, account_slug, token, board_id, _ = config
+
+    async def columns() -> AsyncIterator[list[dict[str, Any]]]:
+        yield await fizzy_async.get_board_columns(base_url, account_slug, token, board_id, _fetch_pool())
+
+    options = {**_card_stream_options(config), "executor": _fetch_pool()}
+    return {
+        "columns": columns(),
+        "open": fizzy_async.iter_board_card_pages(
+            base_url, account_slug, token, board_id, **options
+        ),
+        "closed": fizzy_async.iter_board_card_pages(
+            base_url, account_slug, token, board_id, indexed_by="closed", **options
+        ),
+    }
+
+
+async def _pump(
+    pages: asyncio.Queue[tuple[str, Any]],
+    kind: str,
+    stream: AsyncIterator[list[dict[str, Any]]],
+) -> None:
+    try:
+        async for page in stream:
+            pages.put_nowait((kind, page))
+    except Exception as exc:
+        pages.put_nowait((kind, exc))
+    else:
+        pages.put_nowait((kind, None))
+
+
+async def stream_board(
+    config: BoardConfig,
+    mirror: BoardMirror | None = None,
+) -> AsyncIterator[tuple[list[dict[str, Any]], list[dict[str, Any]], bool]]:
+    """Yield ``(columns_payload, done_payload, complete)`` while the board loads.
+
+    One partial board is published as soon as the columns arrive, with
+    whatever cards are already in, and then the complete board. Every
+    published board is sent whole to each waiting session, so publishing the
+    board as it grows would cost each session the board size times the number
+    of updates. The complete item equals ``load_board(config)``. When given,
+    ``mirror`` is reset to the loaded raw board so later refreshes can use
+    ``sync_board``.
+    """
+    loop = asyncio.get_running_loop()
+    pool = _fetch_pool()
+    pages: asyncio.Queue[tuple[str, Any]] = asyncio.Queue()
+    streams = _board_page_streams(config)
+    pumps = [asyncio.create_task(_pump(pages, kind, stream)) for kind, stream in streams.items()]
+
+    received: dict[str, list[dict[str, Any]]] = {kind: [] for kind in streams}
+    pending = set(streams)
+    published = False
+    try:
+        while pending:
+            kind, page = await pages.get()
+            if isinstance(page, Exception):
+                raise page
+            if page is None:
+                pending.discard(kind)
+            else:
+                received[kind].extend(page)
+            if not pending:
+                break
+            if published or "columns" in pending:
+                continue
+            columns, done = await loop.run_in_executor(
+                pool, build_board, config, received["columns"], received["open"], received["closed"]
+            )
+            published = True
+            yield columns, done, False
+        if mirror is None:
+            mirror = BoardMirror(config)
+        mirror.reset(received["columns"], received["open"], received["closed"])
+        columns, done = await loop.run_in_executor(pool, mirror.build)
+        yield columns, done, True
+    finally:
+        for pump in pumps:
+            pump.cancel()
+
+
+def _card_key(card: dict[str, Any]) -> str:
+    return str(card.get("id") or card.get("number") or "")
+
+
+def _card_timestamp(card: dict[str, Any]) -> float | None:
+    """Latest change time of a raw card, from ``updated_at`` or ``last_active_at``."""
+    stamps = []
+    for field in CHANGE_FIELDS:
+        value = card.get(field)
+        if not isinstance(value, str) or not value:
+            continue
+        try:
+            stamps.append(datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp())
+        except ValueError:
+            continue
+    return max(stamps, default=None)
+
+
+class BoardMirror:
+    """Raw Fizzy columns and slimmed cards (``slim_card``) of one board, keyed by card id.
+
+    ``reset`` stores a full load, ``merge`` applies the cards changed since
+    ``high_water`` and ``build`` shapes the result with ``build_board``. Cards
+    that are deleted, moved to another board or set aside only disappear on
+    the next full load, so ``needs_full_sync`` asks for one every
+    ``full_sync_interval`` seconds.
+    """
+
+    def __init__(self, config: BoardConfig):
+        self.config = config
+        self.columns: list[dict[str, Any]] = []
+        self.open: dict[str, dict[str, Any]] = {}
+        self.closed: dict[str, dict[str, Any]] = {}
+        self.high_water: float | None = None
+        self.full_sync_at = 0.0
+        self.changes = 0
+
+    def reset(
+        self,
+        columns: list[dict[str, Any]],
+        open_cards: list[dict[str, Any]],
+        closed_cards: list[dict[str, Any]],
+    ) -> None:
+        self.columns = columns
+        self.open = {_card_key(card): card for card in open_cards if isinstance(card, dict)}
+        self.closed = {_card_key(card): card for card in closed_cards if isinstance(card, dict)}
+        stamps = [_card_timestamp(card) for card in (*self.open.values(), *self.closed.values())]
+        # Without change times there is nothing to sync against.
+        self.high_water = None if None in stamps else max(stamps, default=0.0)
+        self.full_sync_at = time.monotonic()
+        self.changes = 0
+
+    def merge(
+        self,
+        columns: list[dict[str, Any]],
+        open_changes: list[dict[str, Any]],
+        closed_changes: list[dict[str, Any]],
+    ) -> None:
+        """Replace the columns and upsert changed cards; a card lives in one listing."""
+        self.columns = columns
+        for changes, target, other in (
+            (open_changes, self.open, self.closed),
+            (closed_changes, self.closed, self.open),
+        ):
+            for card in changes:
+                key = _card_key(card)
+                stamp = _card_timestamp(card)
+                if self._is_older(key, stamp):
+                    continue
+                other.pop(key, None)
+                target[key] = card
+                if stamp is not None and self.high_water is not None:
+                    self.high_water = max(self.high_water, stamp)
+                self.changes += 1
+
+    def _is_older(self, key: str, stamp: float | None) -> bool:
+        known = self.open.get(key) or self.closed.get(key)
+        known_stamp = _card_timestamp(known) if known else None
+        return stamp is not None and known_stamp is not None and stamp < known_stamp
+
+    def upsert_card(self, card: dict[str, Any], **overrides: Any) -> bool:
+        """Apply one pushed card, possibly partial, over the stored version.
+
+        Versions older than the stored one are ignored. ``high_water`` is left
+        alone, so a missed push is still picked up by the next ``sync_board``.
+        """
+        key = _card_key(card)
+        if not key or self._is_older(key, _card_timestamp(card)):
+            return False
+        stored = self.open.pop(key, None) or self.closed.pop(key, None) or {}
+        merged = slim_card({**stored, **card, **overrides})
+        (self.closed if merged.get("closed") else self.open)[key] = merged
+        self.changes += 1
+        return True
+
+    def remove_card(self, card: dict[str, Any]) -> bool:
+        key = _card_key(card)
+        removed = self.open.pop(key, None) or self.closed.pop(key, None)
+        self.changes += removed is not None
+        return removed is not None
+
+    def upsert_column(self, column: dict[str, Any]) -> bool:
+        column_id = str(column.get("id", ""))
+        if not column_id:
+            return False
+        for position, known in enumerate(self.columns):
+            if str(known.get("id", "")) == column_id:
+                self.columns = [*self.columns[:position], {**known, **column}, *self.columns[position + 1 :]]
+                return True
+        self.columns = [*self.columns, column]
+        return True
+
+    def remove_column(self, column_id: str) -> bool:
+        columns = [column for column in self.columns if str(column.get("id", "")) != column_id]
+        changed = len(columns) != len(self.columns)
+        self.columns = columns
+        return changed
+
+    def needs_full_sync(self, full_sync_interval: float) -> bool:
+        return (
+            self.high_water is None
+            or time.monotonic() - self.full_sync_at >= full_sync_interval
+        )
+
+    def build(self) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        return build_board(
+            self.config, self.columns, list(self.open.values()), list(self.closed.values())
+        )
+
+
+async def _changed_cards(
+    pages: AsyncIterator[list[dict[str, Any]]],
+    since: float,
+) -> list[dict[str, Any]]:
+    # Pages are sorted by latest activity, so the first card older than
+    # ``since`` means the rest of the listing is unchanged.
+    changed: list[dict[str, Any]] = []
+    async with aclosing(pages):
+        async for page in pages:
+            reached_unchanged = False
+            for card in page:
+                stamp = _card_timestamp(card)
+                if stamp is not None and stamp < since:
+                    reached_unchanged = True
+                else:
+                    changed.append(card)
+            if reached_unchanged:
+                break
+    return changed
+
+
+async def fetch_board_changes(
+    mirror: BoardMirror,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]]:
+    """Fetch the columns and the open and closed cards changed since ``mirror.high_water``.
+
+    The columns are always refetched; they are one small, usually ``304``,
+    request. Cards cost one page per listing plus one per page of changes.
+    """
+    from . import fizzy_async
+
+    base_url, account_slug, token, board_id, _ = mirror.config
+    since = mirror.high_water or 0.0
+
+    def changes(indexed_by: str | None) -> Awaitable[list[dict[str, Any]]]:
+        pages = fizzy_async.iter_board_card_pages(
+            base_url,
+            account_slug,
+            token,
+            board_id,
+            indexed_by,
+            sorted_by="latest",
+            executor=_fetch_pool(),
+            **_card_stream_options(mirror.config),
+        )
+        return _changed_cards(pages, since)
+
+    return await asyncio.gather(
+        fizzy_async.get_board_columns(base_url, account_slug, token, board_id, _fetch_pool()),
+        changes(None),
+        changes("closed"),
+    )
+
+
+async def sync_board(mirror: BoardMirror) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Merge the cards changed since ``mirror.high_water`` and rebuild the board."""
+    mirror.merge(*await fetch_board_changes(mirror))
+    return await asyncio.get_running_loop().run_in_executor(_fetch_pool(), mirror.build)
+
+
+def build_board(
+    config: BoardConfig,
+    columns: list[dict[str, Any]],
+    open_cards: list[dict[str, Any]],
+    closed_cards: list[dict[str, Any]],
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Shape raw Fizzy columns and cards into ``(columns_payload, done_payload)``."""
+    return normalize_board(config.board_id, config.excluded_tags, columns, open_cards, closed_cards)
+
+
+class _Flight(Generic[T]):
+    def __init__(self, task: asyncio.Future[T]):
+        self.task = task
+        self.callers = 0
+
+
+class SingleFlight(Generic[T]):
+    """Collapse concurrent calls with the same key into one in-flight call.
+
+    Every caller awaits the same future, so a burst of requests for one board
+    costs a single fetch and a single executor thread. Callers are shielded
+    from each other: one cancelled caller does not cancel the shared call.
+    ``served`` keeps how many callers each of the recent calls answered.
+    """
+
+    def __init__(self, history: int = FLIGHT_HISTORY):
+        self._inflight: dict[Hashable, _Flight[T]] = {}
+        self.served: deque[int] = deque(maxlen=history)
+        self.flights = 0
+        self.callers = 0
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        flight = self._inflight.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(call()))
+            self._inflight[key] = flight
+            self.flights += 1
+            flight.task.add_done_callback(lambda _: self._finish(key, flight))
+        flight.callers += 1
+        self.callers += 1
+        return await asyncio.shield(flight.task)
+
+    def _finish(self, key: Hashable, flight: _Flight[T]) -> None:
+        if self._inflight.get(key) is flight:
+            del self._inflight[key]
+        self.served.append(flight.callers)
+        if not flight.task.cancelled():
+            # Mark the exception retrieved when every caller was cancelled.
+            flight.task.exception()
+
+    def in_flight(self, key: Hashable) -> int:
+        """Number of callers currently waiting on ``key`` (0 when idle)."""
+        flight = self._inflight.get(key)
+        return flight.callers if flight else 0
+
+    def stats(self) -> dict[str, Any]:
+        """Counters for logging or monitoring."""
+        return {
+            "flights": self.flights,
+            "callers": self.callers,
+            "in_flight": len(self._inflight),
+            "last_served": self.served[-1] if self.served else 0,
+            "max_served": max(self.served, default=0),
+        }
+
+
+def _cache_ttl() -> float:
+    # Pushed changes keep the board current, so polling becomes a safety net.
+    default = WEBHOOK_CACHE_TTL if os.getenv("FIZZY_WEBHOOK_SECRET", "").strip() else DEFAULT_CACHE_TTL
+    try:
+        return float(os.getenv("ROADMAP_CACHE_TTL", "") or default)
+    except ValueError:
+        return default
+
+
+def _full_sync_interval() -> float:
+    try:
+        return float(os.getenv("ROADMAP_FULL_SYNC_INTERVAL", "") or DEFAULT_FULL_SYNC_INTERVAL)
+    except ValueError:
+        return DEFAULT_FULL_SYNC_INTERVAL
+
+
+def _snapshot_path() -> Path | None:
+    value = os.getenv("ROADMAP_SNAPSHOT_PATH", "").strip()
+    if value.lower() == "none":
+        return None
+    return Path(value) if value else DEFAULT_SNAPSHOT_PATH
+
+
+def _board_key(config: BoardConfig) -> dict[str, Any]:
+    # Everything that shapes the payload except the token.
+    return {
+        "base_url": config.base_url,
+        "account_slug": config.account_slug,
+        "board_id": config.board_id,
+        "excluded_tags": sorted(config.excluded_tags),
+    }
+
+
+def write_snapshot(path: Path, config: BoardConfig, snapshot: RoadmapSnapshot) -> None:
+    """Persist ``snapshot`` atomically, tagged with the board it was built from."""
+    body = json.dumps(
+        {"version": SNAPSHOT_VERSION, "board": _board_key(config), **snapshot},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    atomic_write_bytes(path, body.encode("utf-8"))
+
+
+def snapshot_signature(path: Path) -> tuple[int, int, int] | None:
+    """``(inode, mtime_ns, size)`` of the snapshot file, or ``None`` without one.
+
+    ``write_snapshot`` replaces the file, so any write changes the signature.
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def _snapshot_time(snapshot: RoadmapSnapshot) -> float:
+    return max(snapshot["fetched_at"], snapshot.get("patched_at", 0.0))
+
+
+def read_snapshot(path: Path, config: BoardConfig) -> RoadmapSnapshot | None:
+    """Return the snapshot persisted for this board, or ``None``."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != SNAPSHOT_VERSION
+        or data.get("board") != _board_key(config)
+    ):
+        return None
+    try:
+        snapshot: RoadmapSnapshot = {
+            "columns": data["columns"],
+            "done": data["done"],
+            "fetched_at": float(data["fetched_at"]),
+        }
+        if data.get("patched_at") is not None:
+            snapshot["patched_at"] = float(data["patched_at"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    return snapshot
+
+
+class RoadmapCache:
+    """Process-wide roadmap snapshot with a TTL and stale-while-revalidate.
+
+    Persisted to ``snapshot_path``, synced incrementally and patched by webhooks; see the README.
+    """
+
+    def __init__(self, ttl: float | None = None, snapshot_path: Path | None = None):
+        self.ttl = _cache_ttl() if ttl is None else ttl
+        self.snapshot_path = _snapshot_path() if snapshot_path is None else snapshot_path
+        self._snapshot: RoadmapSnapshot | None = None
+        self._config: BoardConfig | None = None
+        self._refresh_task: asyncio.Task[RoadmapSnapshot | None] | None = None
+        self._partial: RoadmapSnapshot | None = None
+        self._mirror: BoardMirror | None = None
+        self.full_sync_interval = _full_sync_interval()
+        self.incremental_syncs = 0
+        self._progress = asyncio.Event()
+        self._patch_lock = asyncio.Lock()
+        self._pending_changes: list[Callable[[BoardMirror], bool]] = []
+        self._loading_mirror: BoardMirror | None = None
+        self._mirror_behind = False
+        self._signature: tuple[int, int, int] | None = None
+        self.reloads = 0
+        self.patches = 0
+        # Pushes a refreshed snapshot to open sessions; set by the app.
+        self.on_refresh: Callable[[RoadmapSnapshot], Awaitable[None]] | None = None
+        self.flights: SingleFlight[RoadmapSnapshot] = SingleFlight()
+        self.fetches = 0
+        self.last_error = ""
+
+    @property
+    def snapshot(self) -> RoadmapSnapshot | None:
+        return self._snapshot
+
+    def is_stale(self) -> bool:
+        if self._snapshot is None:
+            return True
+        return time.time() - self._snapshot["fetched_at"] >= self.ttl
+
+    async def get(self) -> RoadmapSnapshot:
+        """Return the current board snapshot, loading it if there is none."""
+        config = board_config()
+        snapshot = await self._current(config)
+        if snapshot is None:
+            return await self._fetch(config)
+        return snapshot
+
+    async def stream(self) -> AsyncIterator[tuple[RoadmapSnapshot, bool]]:
+        """Yield ``(snapshot, complete)`` pairs until the board is loaded.
+
+        With a snapshot at hand this yields it once. Otherwise it joins the
+        shared load and yields each partial snapshot it publishes, then the
+        complete one. Partial snapshots may be skipped when the caller is
+        slower than the load, but the complete one is always yielded.
+        """
+        config = board_config()
+        snapshot = await self._current(config)
+        if snapshot is not None:
+            yield snapshot, True
+            return
+        fetch = asyncio.ensure_future(self._fetch(config))
+        seen: RoadmapSnapshot | None = None
+        try:
+            while not fetch.done():
+                partial_snapshot = self._partial
+                if partial_snapshot is not None and partial_snapshot is not seen:
+                    seen = partial_snapshot
+                    yield partial_snapshot, False
+                    continue
+                progress = asyncio.ensure_future(self._progress.wait())
+                try:
+                    await asyncio.wait({fetch, progress}, return_when=asyncio.FIRST_COMPLETED)
+                finally:
+                    progress.cancel()
+            yield fetch.result(), True
+        finally:
+            if not fetch.done():
+                fetch.cancel()  # the shared load keeps running for others
+
+    async def _current(self, config: BoardConfig) -> RoadmapSnapshot | None:
+        # The snapshot in memory or on disk, refreshing it in the background when stale.
+        if self._config != config:
+            self._snapshot = None
+            self._config = config
+        if self._snapshot is None:
+            restored = await self._restore(config)
+            if self._snapshot is None and self._config == config:
+                self._snapshot = restored
+        if self._snapshot is None:
+            return None
+        if self.is_stale() and self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._refresh(config))
+        return self._snapshot
+
+    async def warm(self) -> None:
+        """Restore the persisted snapshot and refresh it; run once at startup.
+
+        Errors are recorded in ``last_error`` rather than raised, so a missing
+        token or an unreachable Fizzy never blocks the app from starting.
+        """
+        try:
+            await self.get()
+        except Exception as exc:  # the first visitor sees the error instead
+            self.last_error = str(exc)
+
+    async def _restore(self, config: BoardConfig) -> RoadmapSnapshot | None:
+        if self.snapshot_path is None:
+            return None
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_fetch_pool(), read_snapshot, self.snapshot_path, config)
+
+    async def _fetch(self, config: BoardConfig) -> RoadmapSnapshot:
+        return await self.flights.do(config, lambda: self._load(config))
+
+    async def patch(self, change: Callable[[BoardMirror], bool]) -> RoadmapSnapshot | None:
+        """Apply ``change`` to the raw board and publish the rebuilt snapshot.
+
+        ``change`` mutates the mirror and returns whether anything changed.
+        Returns the new snapshot, or ``None`` when nothing changed or there is
+        no mirror to patch yet; in that case the change is replayed on the
+        running full load or a refresh picks it up from Fizzy, and
+        ``on_refresh`` pushes the result.
+        """
+        config = board_config()
+        if self._mirror_behind and self._mirror is not None:
+            # Another worker patched the snapshot; catch up from Fizzy first.
+            try:
+                await self._fetch(config)
+            except Exception as exc:  # patch what we have
+                self.last_error = str(exc)
+        async with self._patch_lock:
+            mirror = self._mirror
+            loading = self._loading_mirror
+            if mirror is None and loading is not None and loading.config == config:
+                # The first full load is running; it replays the change and
+                # its refresh pushes the result.
+                self._pending_changes.append(change)
+                return None
+            if mirror is None or mirror.config != config or self._config != config:
+                if self._refresh_task is None:
+                    self._refresh_task = asyncio.create_task(self._refresh(config))
+                return None
+            if loading is not None and loading is not mirror:
+                self._pending_changes.append(change)  # replayed on the new mirror
+            if not change(mirror):
+                return None
+            columns, done = await asyncio.get_running_loop().run_in_executor(
+                _fetch_pool(), mirror.build
+            )
+            if mirror is not self._mirror or self._snapshot is None:
+                return self._snapshot  # a full load replaced it meanwhile
+            snapshot: RoadmapSnapshot = {
+                "columns": columns,
+                "done": done,
+                "fetched_at": self._snapshot["fetched_at"],
+                "patched_at": time.time(),
+            }
+            self._snapshot = snapshot
+            self.patches += 1
+        await self._persist(config, snapshot)
+        return snapshot
+
+    async def _persist(self, config: BoardConfig, snapshot: RoadmapSnapshot) -> None:
+        if self.snapshot_path is None:
+            return
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(
+                _fetch_pool(), write_snapshot, self.snapshot_path, config, snapshot
+            )
+        except OSError as exc:  # serving from memory still works
+            self.last_error = f"Could not persist the roadmap snapshot: {exc}"
+            return
+        # Remember our own write so ``reload`` does not read it back.
+        self._signature = await loop.run_in_executor(
+            _fetch_pool(), snapshot_signature, self.snapshot_path
+        )
+
+    async def reload(self) -> RoadmapSnapshot | None:
+        """Adopt the persisted snapshot if another worker wrote a newer one.
+
+        Returns the adopted snapshot, or ``None`` when the file is unchanged,
+        older or for another board. Only the file's signature is checked
+        until it changes, so this is cheap enough to poll.
+        """
+        config = self._config
+        if self.snapshot_path is None or config is None:
+            return None
+        loop = asyncio.get_running_loop()
+        signature = await loop.run_in_executor(_fetch_pool(), snapshot_signature, self.snapshot_path)
+        if signature is None or signature == self._signature:
+            return None
+        self._signature = signature
+        snapshot = await loop.run_in_executor(_fetch_pool(), read_snapshot, self.snapshot_path, config)
+        current = self._snapshot
+        if (
+            snapshot is None
+            or self._config != config
+            or (current is not None and _snapshot_time(snapshot) <= _snapshot_time(current))
+        ):
+            return None
+        self._snapshot = snapshot
+        self._mirror_behind = self._mirror is not None
+        self.reloads += 1
+        return snapshot
+
+    async def _load(self, config: BoardConfig) -> RoadmapSnapshot:
+        self.fetches += 1
+        self._pending_changes = []
+        # Partials are only published for cold loads; a refresh keeps
+        # serving the previous complete snapshot until it is done.
+        cold = self._snapshot is None
+        mirror = self._mirror
+        incremental = (
+            not cold
+            and mirror is not None
+            and mirror.config == config
+            and not mirror.needs_full_sync(self.full_sync_interval)
+        )
+        if incremental:
+            self._loading_mirror = mirror
+            try:
+                changes = await fetch_board_changes(mirror)
+                # Patches apply to this same mirror, so merge and build between them.
+                async with self._patch_lock:
+                    mirror.merge(*changes)
+                    self._mirror_behind = False
+                    columns, done = await asyncio.get_running_loop().run_in_executor(
+                        _fetch_pool(), mirror.build
+                    )
+                    self.incremental_syncs += 1
+                    snapshot: RoadmapSnapshot = {"columns": columns, "done": done, "fetched_at": time.time()}
+                    if self._config == config:
+                        self._snapshot = snapshot
+                        self.last_error = ""
+            finally:
+                self._loading_mirror = None
+            await self._persist(config, snapshot)
+            return snapshot
+        mirror = self._loading_mirror = BoardMirror(config)
+        try:
+            try:
+                async for columns, done, complete in stream_board(config, mirror=mirror):
+                    snapshot = {"columns": columns, "done": done, "fetched_at": time.time()}
+                    if cold and not complete and self._config == config:
+                        self._publish(snapshot)
+            finally:
+                if cold:
+                    self._publish(None)
+            while self._pending_changes:
+                pending, self._pending_changes = self._pending_changes, []
+                if sum(change(mirror) for change in pending):
+                    columns, done = await asyncio.get_running_loop().run_in_executor(
+                        _fetch_pool(), mirror.build
+                    )
+                    snapshot = {
+                        "columns": columns,
+                        "done": done,
+                        "fetched_at": snapshot["fetched_at"],
+                        "patched_at": time.time(),
+                    }
+            if self._config == config:
+                self._mirror = mirror
+                self._mirror_behind = False
+                self._snapshot = snapshot
+                self.last_error = ""
+        finally:
+            self._loading_mirror = None
+            self._pending_changes = []
+        await self._persist(config, snapshot)
+        return snapshot
+
+    def _publish(self, snapshot: RoadmapSnapshot | None) -> None:
+        self._partial = snapshot
+        progress, self._progress = self._progress, asyncio.Event()
+        progress.set()
+
+    async def _refresh(self, config: BoardConfig) -> RoadmapSnapshot | None:
+        try:
+            snapshot = await self._fetch(config)
+        except Exception as exc:  # keep serving the previous snapshot
+            self.last_error = str(exc)
+            return None
+        finally:
+            self._refresh_task = None
+        if self.on_refresh is not None and snapshot is self._snapshot:
+            try:
+                await self.on_refresh(snapshot)
+            except Exception as exc:  # sessions pick it up on their next visit
+                self.last_error = f"Could not push the refreshed roadmap: {exc}"
+        return snapshot
+
+    def stats(self) -> dict[str, Any]:
+        """Counters for logging or monitoring."""
+        snapshot = self._snapshot
+        return {
+            "snapshot_age": None if snapshot is None else round(time.time() - snapshot["fetched_at"], 1),
+            "stale": self.is_stale(),
+            "refreshing": self._refresh_task is not None,
+            "fetches": self.fetches,
+            "incremental_syncs": self.incremental_syncs,
+            "patches": self.patches,
+            "reloads": self.reloads,
+            "last_error": self.last_error,
+            "flights": self.flights.stats(),
+        }
+
+    def clear(self) -> None:
+        """Forget the in-memory snapshot; the next request restores or loads it again."""
+        self._snapshot = None
+        self._mirror = None
+        self._mirror_behind = False
+
+
+ROADMAP_CACHE = RoadmapCache()
+
+
+__all__ = [
+    "BoardConfig",
+    "BoardMirror",
+    "ROADMAP_CACHE",
+    "RoadmapCache",
+    "RoadmapSnapshot",
+    "SingleFlight",
+    "board_config",
+    "build_board",
+    "fetch_board",
+    "fetch_board_changes",
+    "load_board",
+    "read_snapshot",
+    "snapshot_signature",
+    "stream_board",
+    "sync_board",
+    "write_snapshot",
+]
@@ -0,0 +1,226 @@
+"""Single-pass shaping of raw Fizzy columns and cards into roadmap payloads."""
+from __future__ import annotations
+
+from collections.abc import Collection, Iterable, Iterator
+from typing import Any
+
+COLUMN_NAME_OVERRIDES = {
+    "specification": "Design",
+    "working on": "Execute",
+    "testing": "Validate",
+}
+DONE_COLUMN_KEYWORDS = ("done", "complete", "completed", "finished", "shipped", "released")
+UNTRIAGED_COLUMN = {"id": "untriaged", "name": "Investigate"}
+# Raw card fields kept by ``slim_card``: the payload, routing and change times.
+CARD_FIELDS = (
+    "id",
+    "number",
+    "title",
+    "status",
+    "url",
+    "golden",
+    "closed",
+    "column_id",
+    "board_id",
+    "updated_at",
+    "last_active_at",
+)
+
+
+def is_done_column(name: Any) -> bool:
+    normalized = str(name or "").strip().lower()
+    return any(keyword in normalized for keyword in DONE_COLUMN_KEYWORDS)
+
+
+def card_tags(raw_tags: Any) -> list[str]:
+    """Tag names from a card's ``tags``: tag objects, plain strings or one value."""
+    if not raw_tags:
+        return []
+    if isinstance(raw_tags, list):
+        if isinstance(raw_tags[0], dict):
+            return [str(tag["name"]).strip() for tag in raw_tags if tag.get("name")]
+        return [text for text in (str(tag).strip() for tag in raw_tags) if text]
+    return [str(raw_tags).strip()]
+
+
+def card_board_id(card: dict[str, Any]) -> str | None:
+    board = card.get("board")
+    if board and board.get("id") is not None:
+        return str(board["id"])
+    if card.get("board_id") is not None:
+        return str(card["board_id"])
+    return None
+
+
+def card_column_id(card: dict[str, Any]) -> str | None:
+    if card.get("column_id") is not None:
+        return str(card["column_id"]).strip()
+    column = card.get("column")
+    if column and column.get("id") is not None:
+        return str(column["id"]).strip()
+    return None
+
+
+def card_payload(card: dict[str, Any], tags: list[str]) -> dict[str, Any]:
+    """The ``RoadmapCard`` payload for a raw card whose tags were already read."""
+    return {
+        "id": card.get("id", ""),
+        "number": card.get("number", 0),
+        "title": card.get("title", ""),
+        "status": card.get("status", ""),
+        "url": card.get("url", ""),
+        "tags": tags,
+        "tags_text": ", ".join(tags),
+        "golden": bool(card.get("golden", False)),
+        "closed": bool(card.get("closed", False)),
+    }
+
+
+def slim_card(card: dict[str, Any]) -> dict[str, Any]:
+    """A raw card cut down to ``CARD_FIELDS``, tag names and column/board ids.
+
+    The result is still a raw card: ``normalize_board`` shapes it exactly as
+    it would the full one.
+    """
+    slim = {field: card[field] for field in CARD_FIELDS if field in card}
+    if "tags" in card:
+        slim["tags"] = card_tags(card["tags"])
+    for field in ("column", "board"):
+        if field in card:
+            reference = card[field]
+            has_id = isinstance(reference, dict) and reference.get("id") is not None
+            slim[field] = {"id": reference["id"]} if has_id else None
+    return slim
+
+
+def board_cards(items: Iterable[Any], board_id: str) -> Iterator[dict[str, Any]]:
+    """Slim the raw cards in ``items`` that are on board ``board_id``.
+
+    Tag exclusion is left to ``normalize_board``: a card that gains an
+    excluded tag must still reach the cached board to replace its old version.
+    """
+    board_id = str(board_id)
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        card_board = card_board_id(item)
+        if card_board is None or card_board == board_id:
+            yield slim_card(item)
+
+
+def project_card(
+    card: Any,
+    board_id: str,
+    excluded_tags: Collection[str],
+) -> dict[str, Any] | None:
+    """The payload of a raw card, or ``None`` if it is off the board or excluded."""
+    if not isinstance(card, dict):
+        return None
+    card_board = card_board_id(card)
+    if card_board is not None and card_board != board_id:
+        return None
+    tags = card_tags(card.get("tags"))
+    if excluded_tags and any(tag.lower() in excluded_tags for tag in tags):
+        return None
+    return card_payload(card, tags)
+
+
+def _number(payload: dict[str, Any]) -> Any:
+    return payload["number"]
+
+
+def normalize_board(
+    board_id: str,
+    excluded_tags: Collection[str],
+    columns: Iterable[Any],
+    open_cards: Iterable[Any],
+    closed_cards: Iterable[Any],
+    column_name_overrides: dict[str, str] = COLUMN_NAME_OVERRIDES,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Shape raw Fizzy data into ``(columns_payload, done_payload)``.
+
+    Cards from another board, or with a tag in ``excluded_tags`` (lowercase),
+    are dropped. Open cards in a done column or flagged ``closed`` go to the
+    done list, as do all closed cards; the done list is deduplicated by card
+    id, keeping the first occurrence. Other open cards go to their column or,
+    when it is unknown, to the untriaged lane shown first. Columns are
+    ordered by ``position``, cards by ``number``.
+    """
+    board_id = str(board_id)
+    ordered = sorted(
+        (column for column in columns if isinstance(column, dict)),
+        key=lambda column: (column.get("position") is None, column.get("position") or 0),
+    )
+    lanes: dict[str, int] = {}
+    done_column_ids: set[str] = set()
+    active_columns: list[tuple[dict[str, Any], str]] = []
+    for column in ordered:
+        column_id = str(column.get("id", "")).strip()
+        if is_done_column(column.get("name", "")):
+            done_column_ids.add(column_id)
+        else:
+            active_columns.append((column, column_id))
+    # A column id shared with a done column counts as done.
+    active_columns = [item for item in active_columns if item[1] not in done_column_ids]
+    for _, column_id in active_columns:
+        lanes.setdefault(column_id, len(lanes) + 1)  # lane 0 is untriaged
+
+    lane_cards: list[list[dict[str, Any]]] = [[] for _ in range(len(lanes) + 1)]
+    done: list[dict[str, Any]] = []
+    done_ids: set[str] = set()
+
+    for card in open_cards:
+        payload = project_card(card, board_id, excluded_tags)
+        if payload is None:
+            continue
+        column_id = card_column_id(card)
+        if column_id not in done_column_ids and not payload["closed"]:
+            lane_cards[lanes.get(column_id, 0) if column_id else 0].append(payload)
+            continue
+        card_id = str(payload["id"])
+        if card_id and card_id not in done_ids:
+            done_ids.add(card_id)
+            done.append(payload)
+    for card in closed_cards:
+        payload = project_card(card, board_id, excluded_tags)
+        if payload is None:
+            continue
+        card_id = str(payload["id"])
+        if card_id and card_id not in done_ids:
+            done_ids.add(card_id)
+            done.append(payload)
+
+    # Fizzy pages cards by number, so each lane is already one ordered run
+    # (newest first) and these sorts are linear.
+    for cards in lane_cards:
+        cards.sort(key=_number)
+    done.sort(key=_number)
+
+    columns_payload = [{**UNTRIAGED_COLUMN, "cards": lane_cards[0], "count": len(lane_cards[0])}]
+    for column, column_id in active_columns:
+        cards = lane_cards[lanes[column_id]]
+        name = column.get("name", "")
+        columns_payload.append(
+            {
+                "id": column.get("id", ""),
+                "name": column_name_overrides.get(str(name).strip().lower(), name),
+                "cards": cards,
+                "count": len(cards),
+            }
+        )
+    return columns_payload, done
+
+
+__all__ = [
+    "CARD_FIELDS",
+    "COLUMN_NAME_OVERRIDES",
+    "board_cards",
+    "card_board_id",
+    "card_column_id",
+    "card_payload",
+    "card_tags",
+    "is_done_column",
+    "normalize_board",
+    "project_card",
+    "slim_card",
+]
@@ -0,0 +1,258 @@
+"""Fizzy webhook receiver that patches the shared roadmap snapshot, plus a status endpoint."""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+import os
+from collections import deque
+from typing import Any, Callable
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from .fizzy_retry import CLOSED, breaker_stats
+from .roadmap import ROADMAP_CACHE, BoardMirror, RoadmapSnapshot
+
+WEBHOOK_PATH = "/api/fizzy/webhook"
+STATUS_PATH = "/api/fizzy/status"
+SIGNATURE_HEADER = "X-Webhook-Signature"
+MAX_BODY_BYTES = 1024 * 1024
+SEEN_EVENT_HISTORY = 1000
+ROADMAP_ROUTE = "/roadmap"
+DEFAULT_FOLLOW_INTERVAL = 2.0
+
+CLOSE_ACTIONS = {"card_closed"}
+REOPEN_ACTIONS = {"card_reopened"}
+TRIAGE_ACTIONS = {"card_sent_back_to_triage"}
+REMOVE_ACTIONS = {"card_deleted", "card_postponed", "card_auto_postponed"}
+
+# Client tokens of sessions that loaded the roadmap; pruned when they leave.
+ROADMAP_SUBSCRIBERS: set[str] = set()
+
+_SEEN_EVENTS: deque[str] = deque(maxlen=SEEN_EVENT_HISTORY)
+_BROADCASTS: set[asyncio.Task[None]] = set()
+
+logger = logging.getLogger(__name__)
+
+
+def webhook_secret() -> str:
+    return os.getenv("FIZZY_WEBHOOK_SECRET", "").strip()
+
+
+def status_token() -> str:
+    return os.getenv("FIZZY_STATUS_TOKEN", "").strip()
+
+
+def _follow_interval() -> float:
+    try:
+        return float(os.getenv("ROADMAP_FOLLOW_INTERVAL", "") or DEFAULT_FOLLOW_INTERVAL)
+    except ValueError:
+        return DEFAULT_FOLLOW_INTERVAL
+
+
+def verify_signature(secret: str, body: bytes, signature: str) -> bool:
+    """Check ``signature`` (hex, optionally ``sha256=``-prefixed) against ``body``."""
+    expected = hmac.new(secret.encode("utf-8"), body, hashlib.sha256).hexdigest()
+    signature = signature.strip().lower().removeprefix("sha256=")
+    return hmac.compare_digest(expected, signature)
+
+
+def _event_board_id(event: dict[str, Any]) -> str | None:
+    board = event.get("board")
+    if isinstance(board, dict) and board.get("id") is not None:
+        return str(board["id"])
+    return None
+
+
+def board_change(event: dict[str, Any]) -> Callable[[BoardMirror], bool] | None:
+    """Translate a webhook event into a ``RoadmapCache.patch`` change, if it affects the board."""
+    action = str(event.get("action", ""))
+    eventable = event.get("eventable")
+    if not isinstance(eventable, dict):
+        return None
+    kind = str(event.get("eventable_type") or ("Column" if action.startswith("column_") else "Card"))
+    board_id = _event_board_id(event)
+
+    def for_this_board(mirror: BoardMirror) -> bool:
+        # A card moved to another board is still applied; build_board drops it.
+        return board_id is None or board_id == mirror.config.board_id or action == "card_board_changed"
+
+    if kind == "Column":
+        column_id = str(eventable.get("id", ""))
+        if action.endswith("_deleted"):
+            return lambda mirror: for_this_board(mirror) and mirror.remove_column(column_id)
+        return lambda mirror: for_this_board(mirror) and mirror.upsert_column(eventable)
+    if kind != "Card":
+        return None
+    if action in REMOVE_ACTIONS:
+        return lambda mirror: for_this_board(mirror) and mirror.remove_card(eventable)
+
+    overrides: dict[str, Any] = {}
+    if action in CLOSE_ACTIONS:
+        overrides["closed"] = True
+    elif action in REOPEN_ACTIONS:
+        overrides["closed"] = False
+    if action in TRIAGE_ACTIONS:
+        overrides.update(column=None, column_id=None)
+    return lambda mirror: for_this_board(mirror) and mirror.upsert_card(eventable, **overrides)
+
+
+async def broadcast_roadmap(snapshot: RoadmapSnapshot) -> None:
+    """Push ``snapshot`` to every connected session that still shows the roadmap."""
+    from reflex.state import _substate_key
+    from reflex.utils.prerequisites import get_app
+
+    from .state import State
+
+    app = get_app().app
+    namespace = app.event_namespace
+    if namespace is None:
+        return
+    connected = namespace.token_to_sid
+    # Patches keep fetched_at, so a board that was only patched since its
+    # last sync is still flagged stale once the TTL runs out.
+    stale = ROADMAP_CACHE.is_stale()
+
+    async def push(token: str) -> None:
+        async with app.modify_state(_substate_key(token, State)) as root:
+            state = await root.get_state(State)
+            if state.router.url.path.rstrip("/") != ROADMAP_ROUTE:
+                ROADMAP_SUBSCRIBERS.discard(token)
+                return
+            state._show_roadmap_snapshot(snapshot, stale)
+
+    tokens = []
+    for token in list(ROADMAP_SUBSCRIBERS):
+        if token in connected:
+            tokens.append(token)
+        else:
+            ROADMAP_SUBSCRIBERS.discard(token)
+    results = await asyncio.gather(*(push(token) for token in tokens), return_exceptions=True)
+    for token, result in zip(tokens, results):
+        if isinstance(result, Exception):
+            logger.warning("Could not push the roadmap to session %s: %r", token, result)
+
+
+async def follow_snapshot() -> None:
+    """Push snapshots that other workers persist to this worker's sessions; runs forever.
+
+    Polls the snapshot file every ``ROADMAP_FOLLOW_INTERVAL`` seconds. Only
+    needed with several workers, but harmless with one.
+    """
+    interval = _follow_interval()
+    if ROADMAP_CACHE.snapshot_path is None or interval <= 0:
+        return
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            snapshot = await ROADMAP_CACHE.reload()
+            if snapshot is not None:
+                await broadcast_roadmap(snapshot)
+        except Exception:  # keep following
+            logger.exception("Could not reload the roadmap snapshot")
+
+
+def _forget_event(event_id: str) -> None:
+    if event_id in _SEEN_EVENTS:
+        _SEEN_EVENTS.remove(event_id)
+
+
+async def _read_body(request: Request) -> bytes | None:
+    """Return the request body, or ``None`` as soon as it exceeds ``MAX_BODY_BYTES``."""
+    length = request.headers.get("Content-Length", "")
+    if length.isdigit() and int(length) > MAX_BODY_BYTES:
+        return None
+    chunks: list[bytes] = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > MAX_BODY_BYTES:
+            return None
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+async def receive_webhook(request: Request) -> JSONResponse:
+    secret = webhook_secret()
+    if not secret:
+        return JSONResponse({"error": "Webhook receiver is not configured."}, status_code=503)
+    body = await _read_body(request)
+    if body is None:
+        return JSONResponse({"error": "Payload too large."}, status_code=413)
+    if not verify_signature(secret, body, request.headers.get(SIGNATURE_HEADER, "")):
+        return JSONResponse({"error": "Invalid signature."}, status_code=401)
+    try:
+        event = json.loads(body)
+    except ValueError:
+        return JSONResponse({"error": "Invalid JSON."}, status_code=400)
+    if not isinstance(event, dict):
+        return JSONResponse({"error": "Expected a JSON object."}, status_code=400)
+
+    event_id = str(event.get("id") or "")
+    if event_id and event_id in _SEEN_EVENTS:
+        return JSONResponse({"applied": False, "duplicate": True})
+    change = board_change(event)
+    if change is None:
+        return JSONResponse({"applied": False}, status_code=202)
+    if event_id:
+        # Recorded before the first await, so concurrent redeliveries are duplicates.
+        _SEEN_EVENTS.append(event_id)
+    try:
+        snapshot = await ROADMAP_CACHE.patch(change)
+    except ValueError as exc:  # Fizzy settings are missing
+        _forget_event(event_id)
+        return JSONResponse({"error": str(exc)}, status_code=503)
+    except BaseException:
+        _forget_event(event_id)  # a redelivery gets another try
+        raise
+    if snapshot is not None:
+        # Answer Fizzy right away; sessions are updated in the background.
+        task = asyncio.create_task(broadcast_roadmap(snapshot))
+        _BROADCASTS.add(task)
+        task.add_done_callback(_BROADCASTS.discard)
+    return JSONResponse({"applied": snapshot is not None})
+
+
+async def fizzy_status(request: Request) -> JSONResponse:
+    """Breaker state per Fizzy host and roadmap cache counters, for ``FIZZY_STATUS_TOKEN`` holders."""
+    token = status_token()
+    if not token:
+        return JSONResponse({"error": "Status endpoint is not configured."}, status_code=503)
+    supplied = request.headers.get("Authorization", "").removeprefix("Bearer ").strip()
+    if not hmac.compare_digest(token.encode("utf-8"), supplied.encode("utf-8")):
+        return JSONResponse({"error": "Invalid token."}, status_code=401)
+    breakers = breaker_stats()
+    return JSONResponse(
+        {
+            "healthy": all(breaker["state"] == CLOSED for breaker in breakers.values()),
+            "breakers": breakers,
+            "roadmap": ROADMAP_CACHE.stats(),
+        }
+    )
+
+
+def webhook_api() -> Starlette:
+    """ASGI app with the webhook and status routes, for ``rx.App(api_transformer=...)``."""
+    return Starlette(
+        routes=[
+            Route(WEBHOOK_PATH, receive_webhook, methods=["POST"]),
+            Route(STATUS_PATH, fizzy_status, methods=["GET"]),
+        ]
+    )
+
+
+__all__ = [
+    "ROADMAP_SUBSCRIBERS",
+    "STATUS_PATH",
+    "WEBHOOK_PATH",
+    "board_change",
+    "broadcast_roadmap",
+    "follow_snapshot",
+    "verify_signature",
+    "webhook_api",
+]
@@ -1,8 +1,20 @@
 from __future__ import annotations
 
+import functools
+import hashlib
 import importlib
+import json
+import logging
+import math
 import pkgutil
-from typing import Any, Iterable
+import re
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Iterable, Sequence
 
 from .data import (
     CORE_COMPONENTS,
@@ -11,6 +23,35 @@ from .data import (
     _slugify,
 )
 from . import pages
+from .fileio import atomic_write_bytes
+from .search_content import CONTENT_INDEX_PATH, load_content_documents, sources_hash
+
+
+_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+PACKAGE_DIR = Path(__file__).resolve().parent
+PREBUILT_INDEX_VERSION = 2
+PREBUILT_INDEX_PATH = PACKAGE_DIR.parent / "build" / "search" / "entries.json"
+
+logger = logging.getLogger(__name__)
+
+# BM25F field weights; keywords are indexed as one field built from the list,
+# and body holds extracted page text for content documents.
+FIELD_WEIGHTS = {
+    "title": 3.0,
+    "keywords": 2.0,
+    "subtitle": 1.0,
+    "category": 0.5,
+    "body": 0.5,
+}
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Typo tolerance: tokens without an exact prefix match are corrected against the
+# index vocabulary. Trigram overlap picks at most FUZZY_MAX_CANDIDATES terms and
+# an edit-distance pass verifies them, so the cost stays bounded per token.
+FUZZY_MIN_LENGTH = 4
+FUZZY_MAX_LENGTH = 32
+FUZZY_MAX_CANDIDATES = 64
 
 
 def _clean_text(value: Any) -> str:
@@ -48,6 +89,7 @@ def _normalize_entry(entry: dict[str, Any]) -> dict[str, Any]:
         "href": href,
         "external": bool(entry.get("external", href.startswith(("http://", "https://", "mailto:")))),
         "keywords": _normalize_keywords(entry.get("keywords", [])),
+        "body": _clean_text(entry.get("body", "")),
     }
 
 
@@ -192,12 +234,448 @@ def _build_search_entries() -> list[dict[str, Any]]:
             }
         )
 
+    entries.extend(load_content_documents())
+
     entries = _normalize_entries(entries)
     _ensure_unique_ids(entries)
     return entries
 
 
-SEARCH_ENTRIES = _build_search_entries()
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase alphanumeric tokens."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def normalize_query(query: str) -> str:
+    """Canonical form of a palette query (tokens joined by single spaces)."""
+    return " ".join(tokenize(query))
+
+
+def _field_tokens(entry: dict[str, Any]) -> dict[str, list[str]]:
+    tokens: dict[str, list[str]] = {}
+    for field in FIELD_WEIGHTS:
+        value = entry.get(field, "")
+        text = " ".join(value) if isinstance(value, list) else str(value)
+        tokens[field] = tokenize(text)
+    return tokens
+
+
+def _find(postings: Sequence[int], entry_id: int) -> int:
+    position = bisect_left(postings, entry_id)
+    if position < len(postings) and postings[position] == entry_id:
+        return position
+    return -1
+
+
+def entry_term_scores(entries: Sequence[dict[str, Any]]) -> list[dict[str, float]]:
+    """Return the BM25F score of every term in every entry, by entry position."""
+    field_tokens = [_field_tokens(entry) for entry in entries]
+    entry_count = len(field_tokens) or 1
+    average_lengths = {
+        field: (sum(len(tokens[field]) for tokens in field_tokens) / entry_count) or 1.0
+        for field in FIELD_WEIGHTS
+    }
+
+    weighted_tfs: list[dict[str, float]] = []
+    document_frequency: dict[str, int] = {}
+    for tokens in field_tokens:
+        weighted: dict[str, float] = {}
+        for field, weight in FIELD_WEIGHTS.items():
+            field_terms = tokens[field]
+            if not field_terms:
+                continue
+            norm = 1 - BM25_B + BM25_B * len(field_terms) / average_lengths[field]
+            for term in field_terms:
+                weighted[term] = weighted.get(term, 0.0) + weight / norm
+        for term in weighted:
+            document_frequency[term] = document_frequency.get(term, 0) + 1
+        weighted_tfs.append(weighted)
+
+    idf = {
+        term: math.log(1 + (len(weighted_tfs) - df + 0.5) / (df + 0.5))
+        for term, df in document_frequency.items()
+    }
+    return [
+        {
+            term: idf[term] * tf * (BM25_K1 + 1) / (BM25_K1 + tf)
+            for term, tf in weighted.items()
+        }
+        for weighted in weighted_tfs
+    ]
+
+
+def _trigrams(term: str) -> set[str]:
+    padded = f"  {term} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def _max_edits(token: str) -> int:
+    return 1 if len(token) < 8 else 2
+
+
+def _edit_distance(token: str, term: str, limit: int) -> int:
+    """Edit distance from ``token`` to ``term`` or its same-length prefix, at most ``limit + 1``."""
+    if len(term) < len(token) - limit:
+        return limit + 1
+    size = len(term)
+    over = limit + 1
+    before: list[int] = []
+    previous = list(range(size + 1))
+    for i in range(1, len(token) + 1):
+        char = token[i - 1]
+        low = max(1, i - limit)
+        high = min(size, i + limit)
+        current = [over] * (size + 1)
+        if low == 1:
+            current[0] = i
+        row_best = current[0]
+        for j in range(low, high + 1):
+            term_char = term[j - 1]
+            value = previous[j - 1] + (char != term_char)
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if current[j - 1] + 1 < value:
+                value = current[j - 1] + 1
+            if (
+                i > 1
+                and j > 1
+                and char == term[j - 2]
+                and token[i - 2] == term_char
+                and before[j - 2] + 1 < value
+            ):
+                value = before[j - 2] + 1
+            current[j] = value
+            if value < row_best:
+                row_best = value
+        if row_best > limit:
+            return over
+        before, previous = previous, current
+    distance = previous[size]
+    if size > len(token):
+        distance = min(distance, previous[len(token)])
+    return min(distance, over)
+
+
+def entries_fingerprint(entries: Sequence[dict[str, Any]]) -> str:
+    """Stable content hash of the search entries."""
+    body = json.dumps(list(entries), sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+
+class SearchIndex:
+    """Prefix index with BM25F relevance over the palette search fields.
+
+    Tokens without a prefix match are typo-corrected through a trigram index.
+    """
+
+    def __init__(self, entries: Sequence[dict[str, Any]], fingerprint: str | None = None):
+        self.entries = list(entries)
+        self.categories = list(dict.fromkeys(entry["category"] for entry in self.entries))
+        self._all_ids = list(range(len(self.entries)))
+        self.fingerprint = fingerprint or entries_fingerprint(self.entries)
+
+        postings: dict[str, list[int]] = {}
+        scores: dict[str, list[float]] = {}
+        terms: set[str] = set()
+        for entry_id, term_scores in enumerate(entry_term_scores(self.entries)):
+            best: dict[str, float] = {}
+            terms.update(term_scores)
+            for term, score in term_scores.items():
+                length = len(term)
+                for end in range(1, length + 1):
+                    prefix = term[:end]
+                    prefix_score = score * end / length
+                    if prefix_score > best.get(prefix, 0.0):
+                        best[prefix] = prefix_score
+            for prefix, score in best.items():
+                postings.setdefault(prefix, []).append(entry_id)
+                scores.setdefault(prefix, []).append(score)
+
+        self._postings = {term: array("I", ids) for term, ids in postings.items()}
+        self._scores = {term: array("d", values) for term, values in scores.items()}
+
+        self._terms = sorted(terms)
+        trigram_terms: dict[str, list[int]] = {}
+        for term_id, term in enumerate(self._terms):
+            for trigram in _trigrams(term):
+                trigram_terms.setdefault(trigram, []).append(term_id)
+        self._trigram_terms = {gram: array("I", ids) for gram, ids in trigram_terms.items()}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def corrections(self, token: str) -> list[tuple[str, int]]:
+        """Return ``(term, distance)`` for the closest vocabulary terms within typo range."""
+        if not FUZZY_MIN_LENGTH <= len(token) <= FUZZY_MAX_LENGTH:
+            return []
+        limit = _max_edits(token)
+        grams = _trigrams(token)
+        shared: dict[int, int] = {}
+        for gram in grams:
+            for term_id in self._trigram_terms.get(gram, ()):
+                shared[term_id] = shared.get(term_id, 0) + 1
+        # Each edit destroys at most three trigrams.
+        threshold = max(1, len(grams) - 3 * limit)
+        candidates = sorted(
+            (-count, term_id) for term_id, count in shared.items() if count >= threshold
+        )[:FUZZY_MAX_CANDIDATES]
+
+        matches: list[tuple[str, int]] = []
+        for _, term_id in candidates:
+            term = self._terms[term_id]
+            distance = _edit_distance(token, term, limit)
+            if distance <= limit:
+                matches.append((term, distance))
+                # Only the closest corrections are kept from here on.
+                limit = distance
+        return [(term, distance) for term, distance in matches if distance == limit]
+
+    def _corrected_table(self, token: str) -> tuple[Sequence[int], Sequence[float]] | None:
+        best: dict[int, float] = {}
+        for term, distance in self.corrections(token):
+            penalty = 1 + distance
+            for entry_id, score in zip(self._postings[term], self._scores[term]):
+                score /= penalty
+                if score > best.get(entry_id, 0.0):
+                    best[entry_id] = score
+        if not best:
+            return None
+        ids = sorted(best)
+        return array("I", ids), array("d", [best[entry_id] for entry_id in ids])
+
+    def search(self, query: str, candidates: Iterable[int] | None = None) -> list[int]:
+        """Return ids of entries matching every query token, best BM25F score first.
+
+        ``candidates`` limits the entries considered unless a token had to be typo-corrected.
+        """
+        tokens = set(tokenize(query))
+        if not tokens:
+            return list(self._all_ids if candidates is None else candidates)
+
+        tables: list[tuple[Sequence[int], Sequence[float]]] = []
+        for token in tokens:
+            postings = self._postings.get(token)
+            if postings:
+                tables.append((postings, self._scores[token]))
+                continue
+            corrected = self._corrected_table(token)
+            if corrected is None:
+                return []
+            tables.append(corrected)
+            candidates = None
+
+        seeds: Iterable[tuple[int, float]]
+        if candidates is None:
+            tables.sort(key=lambda item: len(item[0]))
+            (shortest, shortest_scores), probes = tables[0], tables[1:]
+            seeds = zip(shortest, shortest_scores)
+        else:
+            seeds = ((entry_id, 0.0) for entry_id in candidates)
+            probes = tables
+
+        ranked: list[tuple[float, int]] = []
+        for entry_id, total in seeds:
+            for postings, scores in probes:
+                found = _find(postings, entry_id)
+                if found < 0:
+                    break
+                total += scores[found]
+            else:
+                ranked.append((-total, entry_id))
+        ranked.sort()
+        return [entry_id for _, entry_id in ranked]
+
+
+class QueryCache:
+    """Process-wide LRU of normalized query -> ranked entry ids, bounded by queries and ids.
+
+    It clears itself when asked about an index with a different fingerprint.
+    """
+
+    def __init__(self, max_queries: int = 2048, max_ids: int = 500_000):
+        self.max_queries = max_queries
+        self.max_ids = max_ids
+        self._results: OrderedDict[str, tuple[int, ...]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._fingerprint = ""
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def lookup(
+        self,
+        index: SearchIndex,
+        query: str,
+        candidates: Iterable[int] | None = None,
+    ) -> tuple[int, ...]:
+        """Return ranked ids for ``query``, computing and caching on a miss.
+
+        ``candidates`` must be a superset of the matches; it only narrows the work on a miss.
+        """
+        key = normalize_query(query)
+        with self._lock:
+            if index.fingerprint != self._fingerprint:
+                self._reset(index.fingerprint)
+            cached = self._results.get(key)
+            if cached is not None:
+                self._results.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        result = tuple(index.search(key, candidates))
+        with self._lock:
+            if index.fingerprint == self._fingerprint and key not in self._results:
+                self._results[key] = result
+                self.size += len(result)
+                self._evict()
+        return result
+
+    def _evict(self) -> None:
+        while self._results and (
+            len(self._results) > self.max_queries or self.size > self.max_ids
+        ):
+            _, evicted = self._results.popitem(last=False)
+            self.size -= len(evicted)
+            self.evictions += 1
+
+    def _reset(self, fingerprint: str) -> None:
+        self._results.clear()
+        self._fingerprint = fingerprint
+        self.size = 0
+
+    def clear(self) -> None:
+        """Drop all cached results and counters."""
+        with self._lock:
+            self._reset("")
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict[str, Any]:
+        """Snapshot of cache counters for logging or monitoring."""
+        with self._lock:
+            return {
+                "queries": len(self._results),
+                "ids": self.size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": self.hit_ratio,
+            }
+
+
+QUERY_CACHE = QueryCache()
+
+
+def _sources_hash() -> str:
+    # Everything the entries are built from: pages and the modules they import
+    # (see ``search_content``), this module and the extracted content.
+    return sources_hash((Path(__file__).resolve(), CONTENT_INDEX_PATH))
+
+
+def _load_prebuilt(path: Path) -> tuple[list[dict[str, Any]], str] | None:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != PREBUILT_INDEX_VERSION
+        or data.get("sources") != _sources_hash()
+    ):
+        return None
+    return data["entries"], data["fingerprint"]
+
+
+def write_prebuilt_index(path: Path = PREBUILT_INDEX_PATH) -> list[dict[str, Any]]:
+    """Build entries from the page modules and persist them for fast worker startup."""
+    entries = _build_search_entries()
+    payload = {
+        "version": PREBUILT_INDEX_VERSION,
+        "sources": _sources_hash(),
+        "fingerprint": entries_fingerprint(entries),
+        "entries": entries,
+    }
+    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    atomic_write_bytes(path, body.encode("utf-8"))
+    return entries
+
+
+@functools.lru_cache(maxsize=1)
+def get_search_index() -> SearchIndex:
+    """Load the search index on first use, from the prebuilt artifact when it is current."""
+    prebuilt = _load_prebuilt(PREBUILT_INDEX_PATH)
+    if prebuilt is not None:
+        entries, fingerprint = prebuilt
+        return SearchIndex(entries, fingerprint=fingerprint)
+    started = time.perf_counter()
+    index = SearchIndex(_build_search_entries())
+    logger.warning(
+        "Search index %s is missing or stale; built %d entries in-process in %.0f ms. "
+        "Run `python -m xian_tech.search_assets` at build time.",
+        PREBUILT_INDEX_PATH,
+        len(index),
+        (time.perf_counter() - started) * 1000,
+    )
+    return index
+
+
+def __getattr__(name: str) -> Any:
+    # SEARCH_ENTRIES / SEARCH_CATEGORIES / SEARCH_INDEX load lazily so importing
+    # this module does not import every page or build the index.
+    if name == "SEARCH_INDEX":
+        return get_search_index()
+    if name == "SEARCH_ENTRIES":
+        return get_search_index().entries
+    if name == "SEARCH_CATEGORIES":
+        return get_search_index().categories
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def search_entries(query: str) -> tuple[int, ...]:
+    """Ranked entry ids for a palette query, served from the shared cache."""
+    return QUERY_CACHE.lookup(get_search_index(), query)
+
+
+def refine_entries(
+    query: str,
+    previous_query: str = "",
+    previous_ids: Sequence[int] = (),
+) -> tuple[str, tuple[int, ...]]:
+    """Return ``(normalized_query, ranked_ids)``, re-ranking the previous result when typing ahead.
+
+    Other edits fall back to the shared cache and full index.
+    """
+    normalized = normalize_query(query)
+    if not normalized:
+        return "", ()
+    if previous_query and normalized == previous_query:
+        return normalized, tuple(previous_ids)
+    index = get_search_index()
+    if previous_query and normalized.startswith(previous_query):
+        return normalized, QUERY_CACHE.lookup(index, normalized, previous_ids)
+    return normalized, QUERY_CACHE.lookup(index, normalized)
 
 
-__all__ = ["SEARCH_ENTRIES"]
+__all__ = [
+    "FIELD_WEIGHTS",
+    "QUERY_CACHE",
+    "QueryCache",
+    "SEARCH_CATEGORIES",
+    "SEARCH_ENTRIES",
+    "SEARCH_INDEX",
+    "SearchIndex",
+    "get_search_index",
+    "normalize_query",
+    "refine_entries",
+    "search_entries",
+    "tokenize",
+    "write_prebuilt_index",
+]
@@ -0,0 +1,104 @@
+"""Static search index asset for the client-side command palette (``python -m xian_tech.search_assets``)."""
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Sequence
+
+from .fileio import atomic_write_bytes
+
+CLIENT_INDEX_VERSION = 1
+ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
+SEARCH_ASSET_DIR = ASSETS_DIR / "search"
+MANIFEST_NAME = "manifest.json"
+
+_CLIENT_ENTRY_FIELDS = ("id", "title", "subtitle", "category", "badge", "href", "external")
+
+
+def build_client_index(entries: Sequence[dict[str, Any]]) -> dict[str, Any]:
+    """Serialize entries and their BM25F term scores for the browser matcher.
+
+    ``terms`` is sorted so the client can binary-search prefixes; each
+    ``postings`` item is a flat ``[entry_id, score, entry_id, score, ...]`` list.
+    """
+    from .search import entry_term_scores
+
+    postings: dict[str, list[float]] = {}
+    for entry_id, term_scores in enumerate(entry_term_scores(entries)):
+        for term, score in term_scores.items():
+            postings.setdefault(term, []).extend((entry_id, round(score, 4)))
+    terms = sorted(postings)
+    return {
+        "version": CLIENT_INDEX_VERSION,
+        "entries": [
+            {field: entry[field] for field in _CLIENT_ENTRY_FIELDS}
+            for entry in entries
+        ],
+        "terms": terms,
+        "postings": [postings[term] for term in terms],
+    }
+
+
+def write_client_index(
+    entries: Sequence[dict[str, Any]],
+    asset_dir: Path = SEARCH_ASSET_DIR,
+) -> Path:
+    """Write the content-hashed index and its manifest, pruning stale indexes."""
+    payload = build_client_index(entries)
+    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    digest = hashlib.sha256(body).hexdigest()[:12]
+
+    asset_dir.mkdir(parents=True, exist_ok=True)
+    target = asset_dir / f"index.{digest}.json"
+    if not target.exists():
+        atomic_write_bytes(target, body)
+    for stale in asset_dir.glob("index.*.json"):
+        if stale != target:
+            stale.unlink()
+
+    manifest = {
+        "version": CLIENT_INDEX_VERSION,
+        "hash": digest,
+        "path": f"/{asset_dir.name}/{target.name}",
+        "entries": len(entries),
+    }
+    atomic_write_bytes(asset_dir / MANIFEST_NAME, json.dumps(manifest, indent=2).encode("utf-8"))
+    return target
+
+
+def client_index_url(asset_dir: Path = SEARCH_ASSET_DIR) -> str:
+    """Return the public URL of the current index asset, or "" if none is built."""
+    try:
+        manifest = json.loads((asset_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return ""
+    if manifest.get("version") != CLIENT_INDEX_VERSION:
+        return ""
+    path = str(manifest.get("path", ""))
+    if not path or not (asset_dir / Path(path).name).exists():
+        return ""
+    return path
+
+
+def main() -> None:
+    from .search import PREBUILT_INDEX_PATH, write_prebuilt_index
+    from .search_content import build_content_index
+
+    build_content_index()
+    entries = write_prebuilt_index()
+    print(f"Wrote {len(entries)} search entries to {PREBUILT_INDEX_PATH}")
+    target = write_client_index(entries)
+    print(f"Wrote client search index to {target}")
+
+
+__all__ = [
+    "CLIENT_INDEX_VERSION",
+    "build_client_index",
+    "client_index_url",
+    "write_client_index",
+]
+
+
+if __name__ == "__main__":
+    main()
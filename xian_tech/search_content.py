@@ -0,0 +1,279 @@
+"""Build-time extraction of page content into deep-linked search documents (``python -m xian_tech.search_content``)."""
+from __future__ import annotations
+
+import ast
+import hashlib
+import importlib.util
+import json
+from pathlib import Path
+from typing import Any, Iterable
+
+from .fileio import atomic_write_bytes
+
+CONTENT_INDEX_VERSION = 1
+PACKAGE_DIR = Path(__file__).resolve().parent
+CONTENT_INDEX_PATH = PACKAGE_DIR.parent / "build" / "search" / "content.json"
+PAGE_CONTENT_ID = "page-content"
+CHUNK_WORDS = 120
+SNIPPET_CHARS = 140
+MAX_TITLE_CHARS = 120
+
+# Page output also depends on the extractor, so it feeds every page hash next to
+# the page's own ``xian_tech`` imports (see ``_module_sources``).
+_EXTRACTOR_SOURCE = Path(__file__).resolve()
+
+
+def _literal_text(value: Any) -> str:
+    from reflex.vars.sequence import LiteralStringVar
+
+    if isinstance(value, str):
+        return value
+    if isinstance(value, LiteralStringVar):
+        return value._var_value
+    return ""
+
+
+def _clean(text: str) -> str:
+    return " ".join(text.split())
+
+
+def _find_by_id(component: Any, identifier: str) -> Any | None:
+    if _literal_text(getattr(component, "id", None)) == identifier:
+        return component
+    for child in getattr(component, "children", []):
+        found = _find_by_id(child, identifier)
+        if found is not None:
+            return found
+    return None
+
+
+def _heading_text(component: Any) -> str:
+    from reflex.components.base.bare import Bare
+
+    if isinstance(component, Bare):
+        return _literal_text(component.contents)
+    return " ".join(_heading_text(child) for child in component.children)
+
+
+def _collect_sections(root: Any) -> list[dict[str, Any]]:
+    """Split a component tree into ``{"anchor", "title", "parts"}`` sections."""
+    from reflex.components.base.bare import Bare
+    from reflex.components.base.script import Script
+    from reflex.components.core.foreach import Foreach
+    from reflex.components.datadisplay.code import CodeBlock
+    from reflex.components.radix.themes.typography.heading import Heading
+
+    sections: list[dict[str, Any]] = [{"anchor": "", "title": "", "parts": []}]
+
+    def visit(component: Any) -> None:
+        if isinstance(component, (Foreach, Script)):
+            return
+        if isinstance(component, Bare):
+            text = _literal_text(component.contents)
+            if text.strip():
+                sections[-1]["parts"].append(text)
+            return
+        anchor = _literal_text(getattr(component, "id", None))
+        if anchor and component is not root:
+            sections.append({"anchor": anchor, "title": "", "parts": []})
+        if isinstance(component, CodeBlock):
+            code = _literal_text(component.code)
+            if code.strip():
+                sections[-1]["parts"].append(code)
+        if isinstance(component, Heading) and not sections[-1]["title"]:
+            sections[-1]["title"] = _clean(_heading_text(component))
+        for child in component.children:
+            visit(child)
+
+    visit(root)
+    return sections
+
+
+def _section_title(section: dict[str, Any], inherited: str) -> str:
+    if section["title"]:
+        return section["title"]
+    first = section["parts"][0] if section["parts"] else ""
+    if first and "\n" not in first.strip() and len(first) <= MAX_TITLE_CHARS:
+        return _clean(first)
+    return inherited
+
+
+def _snippet(text: str) -> str:
+    if len(text) <= SNIPPET_CHARS:
+        return text
+    return text[:SNIPPET_CHARS].rsplit(" ", 1)[0] + "…"
+
+
+def extract_page_documents(component: Any, *, route: str, page_title: str) -> list[dict[str, Any]]:
+    """Return chunked search documents for one rendered page."""
+    content = _find_by_id(component, PAGE_CONTENT_ID) or component
+    slug = route.strip("/").replace("/", "-") or "home"
+    documents: list[dict[str, Any]] = []
+    used_ids: set[str] = set()
+    title = page_title
+    for section in _collect_sections(content):
+        title = _section_title(section, title)
+        words = _clean(" ".join(section["parts"])).split(" ")
+        if words == [""]:
+            continue
+        anchor = section["anchor"]
+        href = f"{route}#{anchor}" if anchor else route
+        for chunk_number, start in enumerate(range(0, len(words), CHUNK_WORDS)):
+            body = " ".join(words[start : start + CHUNK_WORDS])
+            doc_id = f"content-{slug}-{anchor or 'top'}-{chunk_number}"
+            suffix = 1
+            while doc_id in used_ids:
+                suffix += 1
+                doc_id = f"content-{slug}-{anchor or 'top'}-{chunk_number}-{suffix}"
+            used_ids.add(doc_id)
+            documents.append(
+                {
+                    "id": doc_id,
+                    "title": title,
+                    "subtitle": _snippet(body),
+                    "category": page_title,
+                    "badge": "Content",
+                    "href": href,
+                    "external": False,
+                    "keywords": [],
+                    "body": body,
+                }
+            )
+    return documents
+
+
+def _local_imports(path: Path, module_name: str) -> set[str]:
+    package = module_name if path.name == "__init__.py" else module_name.rpartition(".")[0]
+    names: set[str] = set()
+    # Imports inside functions only run when called, not when the page is built.
+    pending: list[ast.AST] = [ast.parse(path.read_bytes(), filename=str(path))]
+    while pending:
+        node = pending.pop()
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)):
+            continue
+        pending.extend(ast.iter_child_nodes(node))
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level:
+                base = importlib.util.resolve_name("." * node.level + base, package)
+            # ``from pkg import name`` may import a submodule or just an attribute.
+            names.add(base)
+            names.update(f"{base}.{alias.name}" for alias in node.names)
+    return {name for name in names if name.split(".")[0] == PACKAGE_DIR.name}
+
+
+def _module_sources(*module_names: str) -> set[Path]:
+    """Source files of ``module_names`` and every ``xian_tech`` module they import, transitively."""
+    sources: set[Path] = set()
+    seen: set[str] = set()
+    pending = list(module_names)
+    while pending:
+        name = pending.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        base = PACKAGE_DIR.parent.joinpath(*name.split("."))
+        path = base / "__init__.py" if base.is_dir() else base.with_suffix(".py")
+        if not path.is_file():
+            continue
+        sources.add(path)
+        pending.extend(_local_imports(path, name))
+    return sources
+
+
+def _page_hash(module_name: str) -> str:
+    digest = hashlib.sha256(f"v{CONTENT_INDEX_VERSION}".encode())
+    for path in sorted({*_module_sources(module_name), _EXTRACTOR_SOURCE}):
+        digest.update(str(path.relative_to(PACKAGE_DIR.parent)).encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def sources_hash(extra: Iterable[Path] = ()) -> str:
+    """Content hash of every page module, the modules they import and ``extra``."""
+    digest = hashlib.sha256(f"v{CONTENT_INDEX_VERSION}".encode())
+    package = f"{PACKAGE_DIR.name}.pages"
+    pages = (f"{package}.{path.stem}" for path in (PACKAGE_DIR / "pages").glob("*.py") if path.stem != "__init__")
+    paths = {*_module_sources(package, *pages), _EXTRACTOR_SOURCE, *extra}
+    for path in sorted(paths):
+        digest.update(str(path.relative_to(PACKAGE_DIR.parent)).encode("utf-8"))
+        try:
+            digest.update(path.read_bytes())
+        except OSError:
+            digest.update(b"<missing>")
+    return digest.hexdigest()
+
+
+def _load_index(path: Path) -> dict[str, Any]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != CONTENT_INDEX_VERSION:
+        return {}
+    return data
+
+
+def build_content_index(path: Path = CONTENT_INDEX_PATH) -> dict[str, int]:
+    """Extract documents for every registered page, reusing unchanged pages."""
+    from .xian_tech import app
+
+    previous = _load_index(path).get("pages", {})
+    pages: dict[str, Any] = {}
+    stats = {"pages": 0, "reused": 0, "documents": 0}
+    for key, page in app._unevaluated_pages.items():
+        factory = page.component
+        if not callable(factory) or key == "404":
+            continue
+        route = "/" if key == "index" else f"/{key}"
+        page_hash = _page_hash(factory.__module__)
+        cached = previous.get(route)
+        if cached and cached.get("hash") == page_hash:
+            documents = cached["documents"]
+            stats["reused"] += 1
+        else:
+            documents = extract_page_documents(
+                factory(),
+                route=route,
+                page_title=str(page.title or key),
+            )
+        pages[route] = {"hash": page_hash, "documents": documents}
+        stats["pages"] += 1
+        stats["documents"] += len(documents)
+
+    body = json.dumps(
+        {"version": CONTENT_INDEX_VERSION, "pages": pages},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    atomic_write_bytes(path, body.encode("utf-8"))
+    return stats
+
+
+def load_content_documents(path: Path = CONTENT_INDEX_PATH) -> list[dict[str, Any]]:
+    """Read prebuilt content documents; returns [] when the index was never built."""
+    pages = _load_index(path).get("pages", {})
+    return [document for page in pages.values() for document in page.get("documents", [])]
+
+
+def main() -> None:
+    stats = build_content_index()
+    print(
+        f"Indexed {stats['documents']} content chunks from {stats['pages']} pages "
+        f"({stats['reused']} unchanged) into {CONTENT_INDEX_PATH}"
+    )
+
+
+__all__ = [
+    "CONTENT_INDEX_VERSION",
+    "build_content_index",
+    "extract_page_documents",
+    "load_content_documents",
+    "sources_hash",
+]
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,6 @@
 from .app import (
     ActiveCommandInfo,
     CommandAction,
-    CommandSection,
     RoadmapCard,
     RoadmapColumn,
     State,
@@ -12,7 +11,6 @@ from .tooling import ToolingState
 __all__ = [
     "ActiveCommandInfo",
     "CommandAction",
-    "CommandSection",
     "RoadmapCard",
     "RoadmapColumn",
     "SamplesState",
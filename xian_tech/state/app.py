@@ -2,7 +2,7 @@ import asyncio
 import os
 import re
 import time
-from typing import Any, TypedDict
+from typing import Any, Sequence, TypedDict
 
 import reflex as rx
 from dotenv import load_dotenv
@@ -15,6 +15,8 @@ EMAIL_PATTERN = re.compile(
     r"(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,63}$",
     re.IGNORECASE,
 )
+# Done cards sent per page of the collapsed-by-default "Done" section.
+ROADMAP_DONE_PAGE_SIZE = 24
 
 
 class CommandAction(TypedDict):
@@ -28,18 +30,6 @@ class CommandAction(TypedDict):
     keywords: list[str]
 
 
-class CommandSection(TypedDict, total=False):
-    type: str
-    category: str
-    id: str
-    title: str
-    subtitle: str
-    badge: str
-    href: str
-    external: bool
-    keywords: list[str]
-
-
 class ActiveCommandInfo(TypedDict):
     id: str
     title: str
@@ -78,7 +68,11 @@ class State(rx.State):
     command_palette_open: bool = False
     command_palette_visible: bool = False
     command_query: str = ""
-    command_palette_active_id: str | None = None
+    command_palette_active_index: int = -1
+    _command_result_query: str = ""
+    # A tuple, not a list: state lists are wrapped in a mutation-tracking proxy
+    # that costs a wrapper per element on every iteration.
+    _command_result_ids: tuple[int, ...] = ()
     image_lightbox_open: bool = False
     image_lightbox_src: str = ""
     image_lightbox_alt: str = ""
@@ -86,8 +80,14 @@ class State(rx.State):
     roadmap_loading: bool = False
     roadmap_error: str = ""
     roadmap_columns: list[RoadmapColumn] = []
+    # Only the open page of done cards; the rest stay in the shared snapshot.
     roadmap_done_cards: list[RoadmapCard] = []
     roadmap_done_count: int = 0
+    roadmap_done_open: bool = False
+    roadmap_done_page: int = 0
+    roadmap_done_loading: bool = False
+    roadmap_stale: bool = False
+    roadmap_synced_at: str = ""
     contact_submission_inflight: bool = False
     contact_status: str = ""
     contact_error: str = ""
@@ -101,8 +101,13 @@ class State(rx.State):
 
     @rx.var
     def roadmap_show_loading(self) -> bool:
-        """Show skeletons while the roadmap data is still empty."""
-        return self.roadmap_loading or (not self.roadmap_columns and not self.roadmap_error)
+        """Show skeletons until the first columns of the roadmap arrive."""
+        return not self.roadmap_columns and (self.roadmap_loading or not self.roadmap_error)
+
+    @rx.var
+    def roadmap_done_pages(self) -> int:
+        """Number of pages in the done section."""
+        return max(1, -(-self.roadmap_done_count // ROADMAP_DONE_PAGE_SIZE))
 
     def toggle_mobile_nav(self):
         """Toggle the mobile navigation drawer."""
@@ -126,8 +131,8 @@ class State(rx.State):
             return
         self.command_palette_visible = True
         self.command_palette_open = False
-        actions = self.command_palette_actions
-        self.command_palette_active_id = actions[0]["id"] if actions else None
+        order = self._command_palette_order()
+        self.command_palette_active_index = order[0] if order else -1
         yield
         self.command_palette_open = True
 
@@ -135,46 +140,58 @@ class State(rx.State):
         """Hide the command palette and reset the query."""
         self.command_palette_open = False
         self.command_query = ""
-        self.command_palette_active_id = None
+        self._command_result_query = ""
+        self._command_result_ids = ()
+        self.command_palette_active_index = -1
         yield
         await asyncio.sleep(0.3)
         self.command_palette_visible = False
 
     def set_command_query(self, value: str):
-        """Update the palette query."""
-        self.command_query = value
-        actions = self.command_palette_actions
-        self.command_palette_active_id = actions[0]["id"] if actions else None
+        """Update the palette query, narrowing the previous results while typing ahead."""
+        from ..search import SEARCH_ENTRIES, refine_entries
 
-    def set_command_palette_selection(self, value: str):
+        self.command_query = value
+        query, result_ids = refine_entries(
+            value,
+            self._command_result_query,
+            self._command_result_ids,
+        )
+        grouped: dict[str, list[int]] = {}
+        for entry_id in result_ids:
+            grouped.setdefault(SEARCH_ENTRIES[entry_id]["category"], []).append(entry_id)
+        self._command_result_query = query
+        self._command_result_ids = tuple(entry_id for ids in grouped.values() for entry_id in ids)
+        order = self._command_palette_order()
+        self.command_palette_active_index = order[0] if order else -1
+
+    def set_command_palette_selection(self, value: int):
         """Highlight a palette item."""
-        self.command_palette_active_id = value
+        self.command_palette_active_index = value
 
     def command_palette_move_up(self):
         """Move selection to previous item in the palette."""
-        actions = self.command_palette_actions
-        if not actions:
+        order = self._command_palette_order()
+        if not order:
             return
-        ids = [a["id"] for a in actions]
-        current = self.command_palette_active_id
-        if current is None or current not in ids:
-            self.command_palette_active_id = ids[-1]
+        current = self.command_palette_active_index
+        if current not in order:
+            self.command_palette_active_index = order[-1]
         else:
-            idx = ids.index(current)
-            self.command_palette_active_id = ids[idx - 1] if idx > 0 else ids[-1]
+            idx = order.index(current)
+            self.command_palette_active_index = order[idx - 1] if idx > 0 else order[-1]
 
     def command_palette_move_down(self):
         """Move selection to next item in the palette."""
-        actions = self.command_palette_actions
-        if not actions:
+        order = self._command_palette_order()
+        if not order:
             return
-        ids = [a["id"] for a in actions]
-        current = self.command_palette_active_id
-        if current is None or current not in ids:
-            self.command_palette_active_id = ids[0]
+        current = self.command_palette_active_index
+        if current not in order:
+            self.command_palette_active_index = order[0]
         else:
-            idx = ids.index(current)
-            self.command_palette_active_id = ids[idx + 1] if idx < len(ids) - 1 else ids[0]
+            idx = order.index(current)
+            self.command_palette_active_index = order[idx + 1] if idx < len(order) - 1 else order[0]
 
     def open_image_lightbox(self, src: str, alt: str = ""):
         """Show the image lightbox."""
@@ -199,237 +216,98 @@ class State(rx.State):
             self.copied_code_key = ""
 
     async def load_roadmap(self):
-        """Load the Fizzy roadmap board into state."""
-        if self.roadmap_loading:
-            return
+        """Load the Fizzy roadmap board into state from the shared snapshot cache.
 
-        column_name_overrides = {
-            "specification": "Design",
-            "working on": "Execute",
-            "testing": "Validate",
-        }
-
-        self.roadmap_loading = True
-        self.roadmap_error = ""
-        yield
+        On a cold cache the columns render as soon as they arrive, as loading
+        lanes, and the cards follow with the complete board, so each session
+        gets two board updates however large the board is.
+        """
+        from ..roadmap import ROADMAP_CACHE
+        from ..roadmap_webhook import ROADMAP_SUBSCRIBERS
 
-        def fetch_board() -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
-            from ..fizzy_api import get_board_cards, get_board_columns
-
-            token = os.getenv("FIZZY_TOKEN", "").strip()
-            account_slug = (
-                os.getenv("FIZZY_ACCOUNT_SLUG", "")
-                or os.getenv("FIZZY_ACCOUNT", "")
-                or "1"
-            ).strip().lstrip("/")
-            board_id = (
-                os.getenv("FIZZY_BOARD_ID", "")
-                or os.getenv("FIZZY_BOARD", "")
-                or "03fiomkit5oknquymk0ooi26m"
-            ).strip()
-            base_url = (
-                os.getenv("FIZZY_BASE_URL", "")
-                or os.getenv("FIZZY_API_URL", "")
-                or "https://tasks.xian.technology"
-            ).strip()
-
-            if not token:
-                raise ValueError("Missing FIZZY_TOKEN for Fizzy API access.")
-            if not account_slug or not board_id:
-                raise ValueError("Missing FIZZY_ACCOUNT_SLUG or FIZZY_BOARD_ID.")
-
-            def normalize_id(value: Any) -> str:
-                return str(value).strip()
-
-            def is_done_column(name: str) -> bool:
-                normalized = name.strip().lower()
-                done_keywords = (
-                    "done",
-                    "complete",
-                    "completed",
-                    "finished",
-                    "shipped",
-                    "released",
-                )
-                return any(keyword in normalized for keyword in done_keywords)
-
-            columns = get_board_columns(
-                base_url=base_url,
-                account_slug=account_slug,
-                token=token,
-                board_id=board_id,
-            )
-            open_cards = get_board_cards(
-                base_url=base_url,
-                account_slug=account_slug,
-                token=token,
-                board_id=board_id,
-            )
-            closed_cards = get_board_cards(
-                base_url=base_url,
-                account_slug=account_slug,
-                token=token,
-                board_id=board_id,
-                indexed_by="closed",
-            )
-
-            columns = [col for col in columns if isinstance(col, dict)]
-            open_cards = [card for card in open_cards if isinstance(card, dict)]
-            closed_cards = [card for card in closed_cards if isinstance(card, dict)]
-            board_id_value = str(board_id)
-
-            def is_same_board(card: dict[str, Any]) -> bool:
-                board = card.get("board") or {}
-                if board.get("id") is not None:
-                    return str(board.get("id")) == board_id_value
-                if card.get("board_id") is not None:
-                    return str(card.get("board_id")) == board_id_value
-                return True
-
-            open_cards = [card for card in open_cards if is_same_board(card)]
-            closed_cards = [card for card in closed_cards if is_same_board(card)]
-
-            columns_sorted = sorted(
-                columns,
-                key=lambda col: (col.get("position") is None, col.get("position") or 0),
-            )
-            done_column_ids = {
-                normalize_id(col.get("id", ""))
-                for col in columns_sorted
-                if is_done_column(col.get("name", ""))
-            }
-            cards_by_column: dict[str, list[dict[str, Any]]] = {
-                normalize_id(col.get("id", "")): []
-                for col in columns_sorted
-                if normalize_id(col.get("id", "")) not in done_column_ids
-            }
-            untriaged: list[dict[str, Any]] = []
-            done_cards: list[dict[str, Any]] = []
-            done_card_ids: set[str] = set()
-
-            def extract_tags(raw_tags: Any) -> list[str]:
-                if not raw_tags:
-                    return []
-                if isinstance(raw_tags, list):
-                    if raw_tags and isinstance(raw_tags[0], dict):
-                        return [
-                            str(tag.get("name", "")).strip()
-                            for tag in raw_tags
-                            if tag.get("name")
-                        ]
-                    return [str(tag).strip() for tag in raw_tags if str(tag).strip()]
-                return [str(raw_tags).strip()]
-
-            excluded_tags_raw = os.getenv("FIZZY_EXCLUDE_TAGS", "").strip()
-            excluded_tags = {
-                tag.strip().lower()
-                for tag in excluded_tags_raw.split(",")
-                if tag.strip()
-            }
-
-            def is_excluded(card: dict[str, Any]) -> bool:
-                if not excluded_tags:
-                    return False
-                tags = [tag.lower() for tag in extract_tags(card.get("tags"))]
-                return any(tag in excluded_tags for tag in tags)
-
-            if excluded_tags:
-                open_cards = [card for card in open_cards if not is_excluded(card)]
-                closed_cards = [card for card in closed_cards if not is_excluded(card)]
-
-            def build_raw_card_payload(data: dict[str, Any]) -> dict[str, Any]:
-                tags = extract_tags(data.get("tags"))
-                return {
-                    "id": data.get("id", ""),
-                    "number": data.get("number", 0),
-                    "title": data.get("title", ""),
-                    "status": data.get("status", ""),
-                    "url": data.get("url", ""),
-                    "tags": tags,
-                    "tags_text": ", ".join(tags),
-                    "golden": bool(data.get("golden", False)),
-                    "closed": bool(data.get("closed", False)),
-                }
-
-            def add_done_payload(payload: dict[str, Any]) -> None:
-                card_id = str(payload.get("id", ""))
-                if not card_id or card_id in done_card_ids:
-                    return
-                done_cards.append(payload)
-                done_card_ids.add(card_id)
-
-            for card in open_cards:
-                column_id = None
-                column = card.get("column") or {}
-                if card.get("column_id") is not None:
-                    column_id = normalize_id(card.get("column_id"))
-                elif column.get("id") is not None:
-                    column_id = normalize_id(column.get("id"))
-
-                card_payload = build_raw_card_payload(card)
-                if column_id in done_column_ids or card_payload.get("closed"):
-                    add_done_payload(card_payload)
-                    continue
-                if column_id and column_id in cards_by_column:
-                    cards_by_column[column_id].append(card_payload)
-                else:
-                    untriaged.append(card_payload)
-
-            for column_id, items in cards_by_column.items():
-                items.sort(key=lambda item: item["number"])
-
-            for card in closed_cards:
-                add_done_payload(build_raw_card_payload(card))
-
-            done_payload = sorted(done_cards, key=lambda item: item["number"])
-
-            columns_payload = []
-            for col in columns_sorted:
-                col_id = normalize_id(col.get("id", ""))
-                if col_id in done_column_ids:
-                    continue
-                normalized = str(col.get("name", "")).strip().lower()
-                columns_payload.append(
-                    {
-                        "id": col.get("id", ""),
-                        "name": column_name_overrides.get(normalized, col.get("name", "")),
-                        "cards": cards_by_column.get(col_id, []),
-                        "count": len(cards_by_column.get(col_id, [])),
-                    }
-                )
-
-            untriaged_sorted = sorted(untriaged, key=lambda item: item["number"])
-            columns_payload.insert(
-                0,
-                {
-                    "id": "untriaged",
-                    "name": "Investigate",
-                    "cards": untriaged_sorted,
-                    "count": len(untriaged_sorted),
-                },
-            )
+        if self.roadmap_loading:
+            return
+        ROADMAP_SUBSCRIBERS.add(self.router.session.client_token)
 
-            return columns_payload, done_payload
+        if ROADMAP_CACHE.snapshot is None:
+            self.roadmap_loading = True
+            self.roadmap_error = ""
+            yield
 
         try:
-            columns_payload, done_payload = await asyncio.to_thread(fetch_board)
-            self.roadmap_columns = columns_payload
-            self.roadmap_done_cards = done_payload
-            self.roadmap_done_count = len(done_payload)
+            async for snapshot, complete in ROADMAP_CACHE.stream():
+                self._show_roadmap_snapshot(snapshot, complete and ROADMAP_CACHE.is_stale())
+                if not complete:
+                    yield
         except Exception as exc:  # pragma: no cover - surface user-friendly errors
             self.roadmap_error = str(exc)
         finally:
             self.roadmap_loading = False
+            self.roadmap_done_loading = False
+
+    def _show_roadmap_snapshot(self, snapshot: dict[str, Any], stale: bool = False) -> None:
+        """Copy a roadmap snapshot into state; also used to push webhook updates.
+
+        Done cards are only copied while the done section is open, one page
+        at a time, so the initial payload carries the active columns and the
+        done count alone. The sync time shown is ``fetched_at``, the last load
+        from Fizzy; pushed patches do not move it.
+        """
+        self.roadmap_columns = snapshot["columns"]
+        self.roadmap_done_count = len(snapshot["done"])
+        if self.roadmap_done_open:
+            self._show_roadmap_done_page(snapshot["done"], self.roadmap_done_page)
+        self.roadmap_stale = stale
+        self.roadmap_synced_at = time.strftime(
+            "%b %d, %Y %H:%M UTC", time.gmtime(snapshot["fetched_at"])
+        )
+        self.roadmap_error = ""
+
+    def _show_roadmap_done_page(self, done: Sequence[dict[str, Any]], page: int) -> None:
+        # ``done`` is oldest first; page 0 holds the newest cards, newest first.
+        pages = max(1, -(-len(done) // ROADMAP_DONE_PAGE_SIZE))
+        page = min(max(page, 0), pages - 1)
+        end = len(done) - page * ROADMAP_DONE_PAGE_SIZE
+        self.roadmap_done_page = page
+        self.roadmap_done_cards = list(reversed(done[max(0, end - ROADMAP_DONE_PAGE_SIZE) : end]))
+        self.roadmap_done_count = len(done)
+        self.roadmap_done_loading = False
+
+    def _load_roadmap_done_page(self, page: int):
+        from ..roadmap import ROADMAP_CACHE
+
+        snapshot = ROADMAP_CACHE.snapshot
+        if snapshot is None:
+            # E.g. a worker that has not loaded the board yet. Loading it here
+            # would hold this session's state lock for the whole fetch, so
+            # load_roadmap fills in the page once the board is in.
+            self.roadmap_done_page = max(page, 0)
+            self.roadmap_done_loading = True
+            return State.load_roadmap
+        self._show_roadmap_done_page(snapshot["done"], page)
+
+    def show_roadmap_done_page(self, page: int):
+        """Show one page of done cards from the shared roadmap snapshot."""
+        return self._load_roadmap_done_page(page)
+
+    def toggle_roadmap_done(self):
+        """Expand the done section at its first page, or collapse it and drop its cards."""
+        self.roadmap_done_open = not self.roadmap_done_open
+        if not self.roadmap_done_open:
+            self.roadmap_done_cards = []
+            self.roadmap_done_loading = False
+            return
+        return self._load_roadmap_done_page(0)
 
     async def refresh_roadmap(self):
-        """Force reload the roadmap data when the page is visited."""
+        """Show the roadmap when the page is visited.
+
+        Cached boards render immediately, including the snapshot persisted by
+        a previous run; the shared cache refreshes stale snapshots in the
+        background instead of refetching per visit.
+        """
         if self.roadmap_loading:
             return
-        self.roadmap_columns = []
-        self.roadmap_done_cards = []
-        self.roadmap_done_count = 0
-        self.roadmap_error = ""
-        yield
         yield State.load_roadmap
 
     async def submit_contact_form(self, form_data: dict[str, Any]):
@@ -573,71 +451,51 @@ class State(rx.State):
             yield State.close_command_palette
         yield rx.redirect(active["href"])
 
-    @rx.var(cache=True, auto_deps=False, deps=["command_query"])
+    def _command_palette_order(self) -> Sequence[int]:
+        """Entry ids in palette order: grouped search results, or every entry."""
+        from ..search import SEARCH_ENTRIES
+
+        if not self._command_result_query:
+            return range(len(SEARCH_ENTRIES))
+        return self._command_result_ids
+
+    @property
     def command_palette_actions(self) -> list[CommandAction]:
-        """Return filtered actions for the command palette."""
+        """Return the palette actions in display order (backend only)."""
         from ..search import SEARCH_ENTRIES
 
-        query = self.command_query.strip().lower()
-        if not query:
-            return SEARCH_ENTRIES
-
-        def matches(action: CommandAction) -> bool:
-            haystack = " ".join(
-                [
-                    action.get("title", ""),
-                    action.get("subtitle", ""),
-                    " ".join(action.get("keywords", [])),
-                    action.get("category", ""),
-                ]
-            ).lower()
-            return query in haystack
-
-        return [
-            action
-            for action in SEARCH_ENTRIES
-            if matches(action)
-        ]
+        return [SEARCH_ENTRIES[entry_id] for entry_id in self._command_palette_order()]
 
-    @rx.var
-    def command_palette_empty(self) -> bool:
-        """Determine if the palette has no search matches."""
-        return len(self.command_palette_actions) == 0
+    @rx.var(cache=True, auto_deps=False, deps=["_command_result_query", "_command_result_ids"])
+    def command_palette_layout(self) -> list[int]:
+        """Palette rows as entry ids, with ``-1 - category_index`` marking a header.
 
-    @rx.var
-    def command_palette_sections(self) -> list[CommandSection]:
-        """Flatten grouped actions into header + item sections."""
-        sections: list[CommandSection] = []
-        current_category = ""
-        for action in self.command_palette_actions:
-            category = action.get("category", "")
+        Rows index into the entries and headers into the categories that
+        ``command_palette`` compiles into the page, so state only holds integers.
+        """
+        from ..search import SEARCH_CATEGORIES, SEARCH_ENTRIES
+
+        category_index = {category: idx for idx, category in enumerate(SEARCH_CATEGORIES)}
+        layout: list[int] = []
+        current_category = None
+        for entry_id in self._command_palette_order():
+            category = SEARCH_ENTRIES[entry_id]["category"]
             if category != current_category:
-                sections.append(
-                    {
-                        "type": "header",
-                        "category": category,
-                        "id": f"header-{category}",
-                    }
-                )
+                layout.append(-1 - category_index[category])
                 current_category = category
-            sections.append(
-                {
-                    "type": "item",
-                    "category": category,
-                    "id": action["id"],
-                    "title": action["title"],
-                    "subtitle": action["subtitle"],
-                    "badge": action["badge"],
-                    "href": action["href"],
-                    "external": action["external"],
-                    "keywords": action["keywords"],
-                }
-            )
-        return sections
+            layout.append(entry_id)
+        return layout
 
-    @rx.var
+    @rx.var(cache=True, auto_deps=False, deps=["_command_result_query", "_command_result_ids"])
+    def command_palette_empty(self) -> bool:
+        """Determine if the palette has no search matches."""
+        return bool(self._command_result_query) and not self._command_result_ids
+
+    @property
     def command_palette_active_action(self) -> ActiveCommandInfo:
-        """Return the currently highlighted action or a placeholder."""
+        """Return the currently highlighted action or a placeholder (backend only)."""
+        from ..search import SEARCH_ENTRIES
+
         placeholder: ActiveCommandInfo = {
             "id": "palette-placeholder",
             "title": "Search the Xian Technology site",
@@ -651,19 +509,18 @@ class State(rx.State):
             ],
             "placeholder": True,
         }
-        active_id = self.command_palette_active_id
-        for action in self.command_palette_actions:
-            if action["id"] == active_id:
-                result: ActiveCommandInfo = {
-                    **action,
-                    "placeholder": False,
-                }
-                return result
-        return placeholder
+        active_index = self.command_palette_active_index
+        if active_index not in self._command_palette_order():
+            return placeholder
+        result: ActiveCommandInfo = {
+            **SEARCH_ENTRIES[active_index],
+            "placeholder": False,
+        }
+        return result
 
-    @rx.var
+    @property
     def has_command_palette_selection(self) -> bool:
-        """Convenience flag for template logic."""
+        """Convenience flag for handler logic."""
         return not self.command_palette_active_action["placeholder"]
 
 
@@ -15,6 +15,8 @@ from .pages.samples import samples_page
 from .pages.tutorials import tutorials_page
 from .pages.tooling import tooling_page
 from .pages.not_found import not_found_page
+from .roadmap import ROADMAP_CACHE
+from .roadmap_webhook import broadcast_roadmap, follow_snapshot, webhook_api
 from .state import State
 
 
@@ -25,8 +27,16 @@ app = rx.App(
         rx.el.link(rel="icon", type="image/png", href="/favicon.png"),
         rx.el.link(rel="shortcut icon", type="image/png", href="/favicon.png"),
     ],
+    api_transformer=webhook_api(),
 )
 
+# Restore the persisted roadmap snapshot at boot so the first visitor does not wait on Fizzy.
+app.register_lifespan_task(ROADMAP_CACHE.warm)
+# Push board changes that other workers receive to this worker's sessions.
+app.register_lifespan_task(follow_snapshot)
+# Push background refreshes to sessions that got the stale or restored board.
+ROADMAP_CACHE.on_refresh = broadcast_roadmap
+
 app.add_page(home_page, route="/", title="Xian Technology Foundation")
 app.add_page(consensus_page, route="/consensus", title="CometBFT Consensus")
 app.add_page(contracting_page, route="/contracting", title="Contracting")